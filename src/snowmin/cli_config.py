@@ -0,0 +1,77 @@
+"""`snowmin config` subcommands."""
+
+import yaml
+import click
+from colorama import Fore, Style
+
+from snowmin.core.config import (
+    get_merged_connection_config,
+    load_generic_config,
+    save_generic_config,
+    CONFIG_FILE,
+    YamlDumper,
+)
+
+
+@click.group()
+def config():
+    """Manage configuration"""
+    pass
+
+
+@config.command()
+@click.pass_context
+def show(ctx):
+    """Show current configuration"""
+    try:
+        settings = ctx.obj["settings"]
+        cli_overrides = ctx.obj["cli_overrides"]
+
+        # Show snowmin settings
+        click.echo(f"{Fore.CYAN}Snowmin Settings:{Style.RESET_ALL}")
+        data = settings.model_dump(mode="json", exclude_none=True)
+        click.echo(yaml.dump(data, Dumper=YamlDumper, default_flow_style=False))
+        click.echo(f"Loaded from: {CONFIG_FILE}")
+
+        # Show merged connection config
+        click.echo(f"\n{Fore.CYAN}Merged Connection Config:{Style.RESET_ALL}")
+        try:
+            merged_config = get_merged_connection_config(settings, cli_overrides)
+            # Mask sensitive fields
+            for key in ["password", "private_key_file", "private_key_passphrase"]:
+                if key in merged_config and merged_config[key]:
+                    merged_config[key] = "******"
+            click.echo(
+                yaml.dump(merged_config, Dumper=YamlDumper, default_flow_style=False)
+            )
+        except Exception as e:
+            click.echo(f"Error loading connection config: {e}")
+
+    except Exception as e:
+        click.echo(f"Error loading config: {e}")
+
+
+@config.command()
+@click.argument("key")
+@click.argument("value")
+def set(key, value):
+    """Set a configuration value in ~/.snowmin/config.json"""
+    try:
+        # Load existing raw config to preserve unset optional fields
+        raw_config = load_generic_config()
+
+        from snowmin.core.config import Settings
+
+        # Basic validation: check if key exists in model
+        if key not in Settings.model_fields:
+            click.echo(f"Warning: '{key}' is not a known configuration setting.")
+
+        raw_config[key] = value
+
+        # Write back
+        save_generic_config(raw_config)
+
+        click.echo(f"Updated {key} = {value}")
+
+    except Exception as e:
+        click.echo(f"Error updating config: {e}")
@@ -0,0 +1,92 @@
+"""`snowmin pipes` subcommands."""
+
+import click
+
+
+def _pipe_filter_options(action: str, status_when: str):
+    """Shared --pattern/--schema/--status options for pipe actions."""
+
+    def decorator(f):
+        f = click.option("--status", help=f"Filter by status before {status_when}")(f)
+        f = click.option("--schema", help="Schema(s) to query")(f)
+        f = click.option("--pattern", help=f"{action} pipes matching regex pattern")(f)
+        return f
+
+    return decorator
+
+
+@click.group()
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Always re-run SHOW PIPES instead of reusing results from the last 30s",
+)
+@click.pass_context
+def pipes(ctx, no_cache):
+    """Manage Snowflake Pipes"""
+    ctx.ensure_object(dict)
+    ctx.obj["no_cache"] = no_cache
+
+
+@pipes.command("list")
+@click.option("--pattern", help="Filter pipes by regex pattern")
+@click.option("--schema", help="Schema(s) to query (DATABASE.SCHEMA or SCHEMA)")
+@click.option("--status", help="Filter by status (RUNNING, PAUSED, STALLED)")
+@click.pass_context
+def list_pipes(ctx, pattern, schema, status):
+    """List pipes"""
+    from snowmin.operations.pipes import list_pipes_command
+
+    list_pipes_command(ctx, pattern, schema, status)
+
+
+@pipes.command("refresh")
+@click.argument("pipe_name", required=False)
+@_pipe_filter_options("Refresh", "refreshing")
+@click.pass_context
+def refresh_pipe(ctx, pipe_name, pattern, schema, status):
+    """Refresh a pipe or multiple pipes"""
+    from snowmin.operations.pipes import refresh_pipe_command
+
+    refresh_pipe_command(ctx, pipe_name, pattern, schema, status)
+
+
+@pipes.command("pause")
+@click.argument("pipe_name", required=False)
+@_pipe_filter_options("Pause", "pausing")
+@click.pass_context
+def pause_pipe(ctx, pipe_name, pattern, schema, status):
+    """Pause a pipe or multiple pipes"""
+    from snowmin.operations.pipes import pause_pipe_command
+
+    pause_pipe_command(ctx, pipe_name, pattern, schema, status)
+
+
+@pipes.command("resume")
+@click.argument("pipe_name", required=False)
+@_pipe_filter_options("Resume", "resuming")
+@click.pass_context
+def resume_pipe(ctx, pipe_name, pattern, schema, status):
+    """Resume a pipe or multiple pipes"""
+    from snowmin.operations.pipes import resume_pipe_command
+
+    resume_pipe_command(ctx, pipe_name, pattern, schema, status)
+
+
+@pipes.command("drop-recreate")
+@click.argument("pipe_name", required=False)
+@click.option("--all", is_flag=True, help="Process all pipes")
+@_pipe_filter_options("Drop-recreate", "drop-recreate")
+@click.option(
+    "--skip-status",
+    is_flag=True,
+    help="Skip fetching current status (faster, but status will be UNKNOWN)",
+)
+@click.pass_context
+def drop_recreate_pipe(ctx, pipe_name, all, pattern, schema, status, skip_status):
+    """Drop and recreate one or more pipes using their current DDL"""
+    from snowmin.operations.pipes import drop_recreate_pipe_command
+
+    drop_recreate_pipe_command(
+        ctx, pipe_name, all, pattern, schema, status, skip_status
+    )
@@ -0,0 +1,74 @@
+"""`snowmin streams` subcommands."""
+
+import click
+
+
+@click.group()
+@click.pass_context
+def streams(ctx):
+    """Manage Snowflake Streams"""
+    pass
+
+
+@streams.command("list")
+@click.option("--pattern", help="Filter streams by regex pattern")
+@click.option("--schema", help="Schema(s) to query (DATABASE.SCHEMA or SCHEMA)")
+@click.option(
+    "--has-data/--no-data",
+    default=None,
+    help="Filter by data availability",
+)
+@click.pass_context
+def list_streams(ctx, pattern, schema, has_data):
+    """List streams"""
+    from snowmin.operations.streams import list_streams_command
+
+    list_streams_command(ctx, pattern, schema, has_data)
+
+
+@streams.command("create")
+@click.argument("stream_name")
+@click.argument("source_table")
+@click.option("--schema", help="Schema(s) to create the stream in")
+@click.option(
+    "--mode",
+    type=click.Choice(["DEFAULT", "APPEND_ONLY", "INSERT_ONLY"], case_sensitive=False),
+    help="Stream mode",
+)
+@click.option(
+    "--before", help="Create stream BEFORE timestamp (e.g. '2024-01-01 00:00:00')"
+)
+@click.option("--at", help="Create stream AT timestamp (e.g. '2024-01-01 00:00:00')")
+@click.option("--comment", help="Description/comment for the stream")
+@click.pass_context
+def create_stream(ctx, stream_name, source_table, schema, mode, before, at, comment):
+    """Create a stream on a table"""
+    from snowmin.operations.streams import create_stream_command
+
+    create_stream_command(
+        ctx, stream_name, source_table, schema, mode, before, at, comment
+    )
+
+
+@streams.command("drop")
+@click.argument("stream_name")
+@click.option("--schema", help="Schema(s) the stream belongs to")
+@click.pass_context
+def drop_stream(ctx, stream_name, schema):
+    """Drop a stream"""
+    from snowmin.operations.streams import drop_stream_command
+
+    drop_stream_command(ctx, stream_name, schema)
+
+
+@streams.command("reset")
+@click.argument("stream_name", required=False)
+@click.option("--all", "all_streams", is_flag=True, help="Reset all streams in schema")
+@click.option("--schema", help="Schema(s) the stream belongs to")
+@click.option("--at", help="Recreate stream AT timestamp (e.g. '2024-01-01 00:00:00')")
+@click.pass_context
+def reset_stream(ctx, stream_name, all_streams, schema, at):
+    """Drop and recreate one or more streams, optionally at a point in time"""
+    from snowmin.operations.streams import reset_stream_command
+
+    reset_stream_command(ctx, stream_name, all_streams, schema, at)
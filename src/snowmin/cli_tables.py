@@ -0,0 +1,20 @@
+"""`snowmin tables` subcommands."""
+
+import click
+
+
+@click.group()
+@click.pass_context
+def tables(ctx):
+    """Manage Snowflake Tables"""
+    pass
+
+
+@tables.command("truncate")
+@click.argument("table_name")
+@click.pass_context
+def truncate_table(ctx, table_name):
+    """Truncate a table"""
+    from snowmin.operations.tables import truncate_table_command
+
+    truncate_table_command(ctx, table_name)
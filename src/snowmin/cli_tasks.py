@@ -0,0 +1,56 @@
+"""`snowmin tasks` subcommands."""
+
+import click
+
+
+def _task_target_options(action: str):
+    """Shared --all/--pattern/--schema options for task actions."""
+
+    def decorator(f):
+        f = click.option("--schema", help="Schema(s) to look for tasks in")(f)
+        f = click.option("--pattern", help=f"{action} tasks matching regex pattern")(f)
+        f = click.option("--all", is_flag=True, help=f"{action} all tasks in schema")(f)
+        return f
+
+    return decorator
+
+
+@click.group()
+@click.pass_context
+def tasks(ctx):
+    """Manage Snowflake Tasks"""
+    pass
+
+
+@tasks.command("list")
+@click.option("--pattern", help="Filter tasks by regex pattern")
+@click.option("--schema", help="Schema(s) to look for tasks in")
+@click.option("--status", help="Filter by status (started, suspended)")
+@click.pass_context
+def list_tasks(ctx, pattern, schema, status):
+    """List tasks"""
+    from snowmin.operations.tasks import list_tasks_command
+
+    list_tasks_command(ctx, pattern, schema, status)
+
+
+@tasks.command("suspend")
+@click.argument("task_name", required=False)
+@_task_target_options("Suspend")
+@click.pass_context
+def suspend_task(ctx, task_name, all, pattern, schema):
+    """Suspend a task or multiple tasks"""
+    from snowmin.operations.tasks import suspend_task_command
+
+    suspend_task_command(ctx, task_name, all, pattern, schema)
+
+
+@tasks.command("resume")
+@click.argument("task_name", required=False)
+@_task_target_options("Resume")
+@click.pass_context
+def resume_task(ctx, task_name, all, pattern, schema):
+    """Resume a task or multiple tasks"""
+    from snowmin.operations.tasks import resume_task_command
+
+    resume_task_command(ctx, task_name, all, pattern, schema)
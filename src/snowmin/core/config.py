@@ -1,3 +1,7 @@
+import abc
+import functools
+import json
+import os
 from pathlib import Path
 from typing import Optional, Literal, Dict, Any, Tuple
 from pydantic_settings import (
@@ -10,13 +14,40 @@ from pydantic.fields import FieldInfo
 import yaml
 import tomllib
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it.
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper  # noqa: F401
+
 CONFIG_DIR = Path.home() / ".snowmin"
-CONFIG_FILE = CONFIG_DIR / "config.yaml"
+CONFIG_FILE = CONFIG_DIR / "config.json"
+# Pre-JSON location of the generic config; migrated on first read
+LEGACY_CONFIG_FILE = CONFIG_DIR / "config.yaml"
+_TOML_CONFIG_PATH = Path.home() / ".snowflake" / "connections.toml"
 
 
 def get_toml_config_path() -> Path:
     """Get the path to the TOML configuration file"""
-    return Path.home() / ".snowflake" / "connections.toml"
+    return _TOML_CONFIG_PATH
+
+
+def _file_mtime_ns(path: Path) -> Optional[int]:
+    """Return the mtime of *path* in nanoseconds, or None if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def _load_toml_cached(toml_path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Parse connections.toml. Keyed on mtime so edits are picked up."""
+    try:
+        with open(toml_path, "rb") as f:
+            return tomllib.load(f)
+    except tomllib.TOMLDecodeError as e:
+        raise ValueError(f"Error parsing {toml_path}: {e}")
 
 
 def load_snowflake_connection(profile: Optional[str] = None) -> Dict[str, Any]:
@@ -24,103 +55,131 @@ def load_snowflake_connection(profile: Optional[str] = None) -> Dict[str, Any]:
     Load Snowflake connection configuration from ~/.snowflake/connections.toml.
     Returns a dictionary of connection parameters.
     """
-    result = {}
-
     toml_path = get_toml_config_path()
-    if toml_path.exists():
-        try:
-            with open(toml_path, "rb") as f:
-                data = tomllib.load(f)
+    mtime_ns = _file_mtime_ns(toml_path)
+    if mtime_ns is None:
+        return {}
+
+    data = _load_toml_cached(toml_path, mtime_ns)
 
-            connection_name = profile or "default"
-            if connection_name in data:
-                result.update(data[connection_name])
-                return result
+    connection_name = profile or "default"
+    if connection_name in data:
+        # Return a copy: callers merge overrides into the result.
+        return dict(data[connection_name])
 
-            if profile and profile not in data:
-                raise ValueError(f"Connection '{profile}' not found in {toml_path}")
+    if profile:
+        raise ValueError(f"Connection '{profile}' not found in {toml_path}")
 
-        except tomllib.TOMLDecodeError as e:
-            raise ValueError(f"Error parsing {toml_path}: {e}")
+    return {}
 
-    return result
 
+def get_env_config_path() -> Path:
+    """Get the path to the environment-specific config file"""
+    # Get environment name from env var or default to 'dev'
+    env_name = os.getenv("SNOWMIN_ENV", "dev")
+    return Path.cwd() / f"snowmin_{env_name}.yaml"
 
-class EnvironmentConfigSettingsSource(PydanticBaseSettingsSource):
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a JSON or YAML config file. Keyed on mtime so edits are picked up."""
+    with open(path, "r") as f:
+        if path.endswith(".json"):
+            return json.load(f) or {}
+        return yaml.load(f, Loader=YamlLoader) or {}
+
+
+def _read_config_file(path: Path) -> Dict[str, Any]:
+    """Return the parsed config at *path*, or an empty dict if unavailable."""
+    if not path.is_file():
+        return {}
+
+    try:
+        data = _load_config_cached(str(path), path.stat().st_mtime_ns)
+    except (OSError, ValueError, yaml.YAMLError):
+        # Unreadable or malformed config (json.JSONDecodeError is a ValueError)
+        return {}
+    # Valid JSON/YAML that is not a mapping (e.g. a list) holds no settings
+    return data if isinstance(data, dict) else {}
+
+
+def migrate_legacy_config() -> None:
     """
-    Custom settings source that loads from environment-specific config file.
-    Looks for ./snowmin_{env}.yaml where {env} comes from SNOWMIN_ENV or defaults to 'dev'.
+    Convert ~/.snowmin/config.yaml to config.json once, then remove it. Run at
+    CLI startup; settings loading only reads the legacy file.
     """
+    if CONFIG_FILE.is_file() or not LEGACY_CONFIG_FILE.is_file():
+        return
 
-    def get_field_value(
-        self, field: FieldInfo, field_name: str
-    ) -> Tuple[Any, str, bool]:
-        # Get environment name from env var or default to 'dev'
-        import os
+    try:
+        with open(LEGACY_CONFIG_FILE, "r") as f:
+            data = yaml.load(f, Loader=YamlLoader) or {}
+    except (OSError, yaml.YAMLError):
+        # Leave an unreadable legacy file in place for the user to fix
+        return
 
-        env_name = os.getenv("SNOWMIN_ENV", "dev")
-        env_config_file = Path.cwd() / f"snowmin_{env_name}.yaml"
+    try:
+        save_generic_config(data)
+    except (TypeError, ValueError) as e:
+        # YAML-only values (e.g. dates) have no JSON form: keep the YAML
+        print(f"Warning: Could not migrate {LEGACY_CONFIG_FILE} to JSON: {e}")
+        return
+    LEGACY_CONFIG_FILE.unlink()
 
-        if not env_config_file.exists():
-            return None, field_name, False
 
-        try:
-            with open(env_config_file, "r") as f:
-                config_data = yaml.safe_load(f) or {}
+def load_generic_config() -> Dict[str, Any]:
+    """Load a copy of the raw generic config (~/.snowmin/config.json)."""
+    migrate_legacy_config()
+    return dict(_read_config_file(CONFIG_FILE))
 
-            # Handle alias for schema_name -> schema
-            if field_name == "schema_name" and "schema" in config_data:
-                field_value = config_data.get("schema")
-            else:
-                field_value = config_data.get(field_name)
 
-            return field_value, field_name, False
-        except Exception:
-            return None, field_name, False
+def save_generic_config(data: Dict[str, Any]) -> None:
+    """
+    Write *data* to the generic config file (~/.snowmin/config.json).
+    Writes a sibling temp file and renames it over the config so a crash
+    mid-write never leaves a truncated file behind.
+    """
+    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = CONFIG_FILE.with_suffix(".json.tmp")
+    try:
+        with open(tmp_file, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+            f.write("\n")
+        os.replace(tmp_file, CONFIG_FILE)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
 
-    def prepare_field_value(
-        self, field_name: str, field: FieldInfo, value: Any, value_is_complex: bool
-    ) -> Any:
-        return value
 
-    def __call__(self) -> Dict[str, Any]:
-        d: Dict[str, Any] = {}
-        for field_name, field in self.settings_cls.model_fields.items():
-            field_value, field_key, value_is_complex = self.get_field_value(
-                field, field_name
-            )
-            field_value = self.prepare_field_value(
-                field_name, field, field_value, value_is_complex
-            )
-            if field_value is not None:
-                d[field_key] = field_value
-        return d
-
-
-class GenericConfigSettingsSource(PydanticBaseSettingsSource):
+# Settings fields stored under a different key in config files
+_ALIAS = {"schema_name": "schema"}
+
+
+@functools.cache
+def _file_field_keys(settings_cls: type) -> Tuple[Tuple[str, str], ...]:
+    """(field name, config file key) pairs; model fields are fixed per class."""
+    return tuple((name, _ALIAS.get(name, name)) for name in settings_cls.model_fields)
+
+
+class FileConfigSettingsSource(PydanticBaseSettingsSource):
     """
-    Custom settings source that loads from generic config file ~/.snowmin/config.yaml.
+    Base settings source that reads field values from a single config file.
+    The file is parsed once per call, not once per field. Subclasses must
+    implement config_path (PydanticBaseSettingsSource is an abc.ABC).
     """
 
+    @abc.abstractmethod
+    def config_path(self) -> Path:
+        """Path of the config file this source reads."""
+
+    def _field_value_from(self, config_data: Dict[str, Any], field_name: str) -> Any:
+        return config_data.get(_ALIAS.get(field_name, field_name))
+
     def get_field_value(
         self, field: FieldInfo, field_name: str
     ) -> Tuple[Any, str, bool]:
-        if not CONFIG_FILE.exists():
-            return None, field_name, False
-
-        try:
-            with open(CONFIG_FILE, "r") as f:
-                config_data = yaml.safe_load(f) or {}
-
-            # Handle alias for schema_name -> schema
-            if field_name == "schema_name" and "schema" in config_data:
-                field_value = config_data.get("schema")
-            else:
-                field_value = config_data.get(field_name)
-
-            return field_value, field_name, False
-        except Exception:
-            return None, field_name, False
+        config_data = _read_config_file(self.config_path())
+        return self._field_value_from(config_data, field_name), field_name, False
 
     def prepare_field_value(
         self, field_name: str, field: FieldInfo, value: Any, value_is_complex: bool
@@ -128,17 +187,40 @@ class GenericConfigSettingsSource(PydanticBaseSettingsSource):
         return value
 
     def __call__(self) -> Dict[str, Any]:
-        d: Dict[str, Any] = {}
-        for field_name, field in self.settings_cls.model_fields.items():
-            field_value, field_key, value_is_complex = self.get_field_value(
-                field, field_name
-            )
-            field_value = self.prepare_field_value(
-                field_name, field, field_value, value_is_complex
-            )
-            if field_value is not None:
-                d[field_key] = field_value
-        return d
+        # get_field_value/prepare_field_value are kept for the source API, but
+        # building the dict in one pass avoids per-field call overhead.
+        config_data = _read_config_file(self.config_path())
+        if not config_data:
+            return {}
+
+        field_values = (
+            (field_name, config_data.get(key))
+            for field_name, key in _file_field_keys(self.settings_cls)
+        )
+        return {name: value for name, value in field_values if value is not None}
+
+
+class EnvironmentConfigSettingsSource(FileConfigSettingsSource):
+    """
+    Custom settings source that loads from environment-specific config file.
+    Looks for ./snowmin_{env}.yaml where {env} comes from SNOWMIN_ENV or defaults to 'dev'.
+    """
+
+    def config_path(self) -> Path:
+        return get_env_config_path()
+
+
+class GenericConfigSettingsSource(FileConfigSettingsSource):
+    """
+    Custom settings source that loads from generic config file ~/.snowmin/config.json
+    (or the legacy ~/.snowmin/config.yaml if that has not been migrated yet).
+    """
+
+    def config_path(self) -> Path:
+        # Until migrate_legacy_config has run, read the legacy YAML in place
+        if not CONFIG_FILE.is_file() and LEGACY_CONFIG_FILE.is_file():
+            return LEGACY_CONFIG_FILE
+        return CONFIG_FILE
 
 
 class Settings(BaseSettings):
@@ -149,7 +231,7 @@ class Settings(BaseSettings):
     1. CLI parameters (init_settings)
     2. Environment variables (SNOWMIN__*)
     3. Environment-specific config file (./snowmin_{env}.yaml)
-    4. Generic config file (~/.snowmin/config.yaml)
+    4. Generic config file (~/.snowmin/config.json)
     """
 
     model_config = SettingsConfigDict(
@@ -184,6 +266,11 @@ class Settings(BaseSettings):
 
     # Tool Settings
     state_backend: Literal["stateless"] = "stateless"
+    introspect_databases: Optional[str] = Field(
+        None,
+        description="Comma-separated databases plan/apply read current state from "
+        "(default: every database except shared ones)",
+    )
 
     @classmethod
     def settings_customise_sources(
@@ -201,7 +288,7 @@ class Settings(BaseSettings):
         1. init_settings - CLI parameters passed to Settings()
         2. env_settings - Environment variables (SNOWMIN__*)
         3. EnvironmentConfigSettingsSource - ./snowmin_{env}.yaml
-        4. GenericConfigSettingsSource - ~/.snowmin/config.yaml
+        4. GenericConfigSettingsSource - ~/.snowmin/config.json
         """
         return (
             init_settings,
@@ -212,13 +299,20 @@ class Settings(BaseSettings):
 
     def save(self):
         """Save current settings to config file."""
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-
         # Dump model to dict, exclude None values to keep file clean
         data = self.model_dump(mode="json", exclude_none=True)
+        save_generic_config(data)
+
+        _SETTINGS_CACHE.clear()
 
-        with open(CONFIG_FILE, "w") as f:
-            yaml.dump(data, f)
+
+# (Settings field, connection key) pairs; aliased fields such as
+# schema_name are stored under their alias ("schema")
+_CONNECTION_FIELDS = tuple(
+    (name, field.alias or name)
+    for name, field in Settings.model_fields.items()
+    if name not in {"state_backend", "connection", "introspect_databases"}
+)
 
 
 def get_merged_connection_config(
@@ -238,18 +332,18 @@ def get_merged_connection_config(
     connection_profile = settings.connection or cli_overrides.get("connection")
     conn_config = load_snowflake_connection(connection_profile)
 
-    # Apply settings overrides (already merged from all sources by Pydantic)
-    settings_dict = settings.model_dump(
-        exclude_none=True, exclude={"state_backend", "connection"}
-    )
-    for key, value in settings_dict.items():
+    # Apply settings overrides (already merged from all sources by Pydantic).
+    # Read attributes directly rather than paying for a model_dump() per call.
+    for field_name, key in _CONNECTION_FIELDS:
+        value = getattr(settings, field_name)
         if value is not None:
             conn_config[key] = value
 
     # Apply CLI overrides (highest priority)
-    for key, value in cli_overrides.items():
-        if value is not None and key != "connection":
-            conn_config[key] = value
+    if cli_overrides:
+        for key, value in cli_overrides.items():
+            if value is not None and key != "connection":
+                conn_config[key] = value
 
     # Normalize 'username' to 'user' if present
     if "username" in conn_config and "user" not in conn_config:
@@ -258,20 +352,55 @@ def get_merged_connection_config(
     return conn_config
 
 
-# Global settings instance - lazy loaded
+# Settings instances keyed on their inputs - see _settings_cache_key. The
+# oldest entry is evicted once SETTINGS_CACHE_MAXSIZE is reached.
+SETTINGS_CACHE_MAXSIZE = 16
+_SETTINGS_CACHE: Dict[Any, Settings] = {}
+
+
+def _settings_cache_key(kwargs: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Build a cache key covering every input Settings reads: init kwargs,
+    SNOWMIN__* environment variables, and the config files.
+    """
+    env_config_file = get_env_config_path()
+    env_vars = frozenset(
+        (key, value)
+        for key, value in os.environ.items()
+        if key.upper().startswith("SNOWMIN__")
+    )
+    return (
+        frozenset(kwargs.items()),
+        env_vars,
+        env_config_file,
+        _file_mtime_ns(env_config_file),
+        CONFIG_FILE,
+        _file_mtime_ns(CONFIG_FILE),
+        LEGACY_CONFIG_FILE,
+        _file_mtime_ns(LEGACY_CONFIG_FILE),
+    )
+
+
 def get_settings(**kwargs) -> Settings:
     """
     Get settings instance.
 
+    Loaded settings are cached per process and reused while the CLI
+    overrides, environment variables and config files they were built from
+    are unchanged. Each call returns its own copy, so callers may modify it.
+
     Args:
         **kwargs: Optional keyword arguments to pass to Settings (CLI overrides)
 
     Returns:
         Settings instance with values loaded from all sources
     """
-    try:
-        return Settings(**kwargs)
-    except Exception as e:
-        # If loading fails (e.g. missing required fields), we might return a partial or let it raise
-        # For CLI usage, we might want to handle this gracefully
-        raise e
+    key = _settings_cache_key(kwargs)
+    settings = _SETTINGS_CACHE.get(key)
+    if settings is None:
+        # If loading fails (e.g. invalid values) let it raise; the CLI falls back
+        settings = Settings(**kwargs)
+        if len(_SETTINGS_CACHE) >= SETTINGS_CACHE_MAXSIZE:
+            del _SETTINGS_CACHE[next(iter(_SETTINGS_CACHE))]
+        _SETTINGS_CACHE[key] = settings
+    return settings.model_copy()
@@ -1,17 +1,19 @@
+import functools
+import time
+from itertools import repeat
 import snowflake.connector
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
 
 
-def get_private_key(key_path: str, password: Optional[str] = None) -> bytes:
-    """Load and deserialize a private key."""
-    path = Path(key_path).expanduser()
-    if not path.exists():
-        raise FileNotFoundError(f"Private key file not found: {path}")
-
-    with open(path, "rb") as key_file:
+@functools.lru_cache(maxsize=4)
+def _load_private_key_cached(
+    key_path: str, mtime_ns: int, password: Optional[str]
+) -> bytes:
+    """Deserialize a PEM private key to DER; keyed on mtime so edits are picked up."""
+    with open(key_path, "rb") as key_file:
         p_key = serialization.load_pem_private_key(
             key_file.read(),
             password=password.encode() if password else None,
@@ -26,9 +28,41 @@ def get_private_key(key_path: str, password: Optional[str] = None) -> bytes:
     return pkb
 
 
+def get_private_key(key_path: str, password: Optional[str] = None) -> bytes:
+    """Load and deserialize a private key."""
+    path = Path(key_path).expanduser()
+    if not path.exists():
+        raise FileNotFoundError(f"Private key file not found: {path}")
+
+    return _load_private_key_cached(str(path), path.stat().st_mtime_ns, password)
+
+
+# Rows fetched per round-trip by ConnectionManager.fetch_iter
+FETCH_BATCH_SIZE = 10_000
+
+# fetch_all_cached: result lifetime and maximum number of cached queries
+QUERY_CACHE_TTL_S = 2.0
+QUERY_CACHE_MAXSIZE = 256
+
+# conn_config keys passed straight through to snowflake.connector.connect
+_CONNECTION_ARG_KEYS = ("account", "user", "role", "warehouse", "database", "schema")
+
+
+def _config_hash(conn_config: Dict[str, Any]) -> int:
+    """Hash a connection config for use in fetch_all_cached keys."""
+    try:
+        return hash(frozenset(conn_config.items()))
+    except TypeError:
+        # Unhashable values (e.g. arrays in connections.toml)
+        return hash(repr(sorted(conn_config.items())))
+
+
 class ConnectionManager:
     _connection = None
     _current_config = None
+    _config_hash = None
+    # fetch_all_cached results: (config hash, query, params) -> (fetched at, rows)
+    _query_cache: Dict[Tuple[Any, ...], Tuple[float, List[Dict[str, Any]]]] = {}
 
     @classmethod
     def get_connection(cls, conn_config: Optional[Dict[str, Any]] = None):
@@ -41,32 +75,28 @@ class ConnectionManager:
                 account, user, password, private_key_file, private_key_passphrase,
                 role, warehouse, database, schema
         """
-        # If config provided and different from current, close existing connection
+        # If config provided and different from current, close existing connection.
+        # A copy is kept so a caller changing its dict in place still compares
+        # unequal on the next call.
         if conn_config and conn_config != cls._current_config:
             cls.close()
+            cls._current_config = dict(conn_config)
+            cls._config_hash = _config_hash(conn_config)
 
         if cls._connection is None:
             if not conn_config:
                 raise ValueError("Connection config must be provided")
 
-            cls._current_config = conn_config
-
-            # Build connection args
+            # Build connection args; get_merged_connection_config has already
+            # normalized aliases (username -> user, schema_name -> schema)
             conn_args = {
-                "account": conn_config.get("account"),
-                "user": conn_config.get("user"),
+                key: conn_config[key]
+                for key in _CONNECTION_ARG_KEYS
+                if conn_config.get(key)
             }
-
-            # Add optional connection parameters
-            if conn_config.get("role"):
-                conn_args["role"] = conn_config["role"]
-            if conn_config.get("warehouse"):
-                conn_args["warehouse"] = conn_config["warehouse"]
-            if conn_config.get("database"):
-                conn_args["database"] = conn_config["database"]
-            schema = conn_config.get("schema") or conn_config.get("schema_name")
-            if schema and "," not in schema:
-                conn_args["schema"] = schema
+            # A comma-separated schema list is a filter, not a session schema
+            if "," in conn_args.get("schema", ""):
+                del conn_args["schema"]
 
             # Authentication: priority is private_key > password > externalbrowser
             private_key_file = conn_config.get("private_key_file")
@@ -90,15 +120,30 @@ class ConnectionManager:
 
         return cls._connection
 
+    @classmethod
+    def get_current_config(cls) -> Dict[str, Any]:
+        """Return the config of the active connection, or {} if not connected."""
+        return cls._current_config or {}
+
     @classmethod
     def execute(
-        cls, query: str, params=None, conn_config: Optional[Dict[str, Any]] = None
+        cls,
+        query: str,
+        params=None,
+        conn_config: Optional[Dict[str, Any]] = None,
+        num_statements: Optional[int] = None,
     ):
-        """Execute a query and return the cursor."""
+        """
+        Execute a query and return the cursor. Pass num_statements to run a
+        ';'-separated batch of that many statements in one round-trip.
+        """
         conn = cls.get_connection(conn_config)
         cursor = conn.cursor()
         try:
-            cursor.execute(query, params)
+            if num_statements is None:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query, params, num_statements=num_statements)
             return cursor
         except Exception as e:
             cursor.close()
@@ -111,8 +156,58 @@ class ConnectionManager:
         """Execute and return all results as a list of dicts."""
         cursor = cls.execute(query, params, conn_config)
         try:
-            columns = [col[0].lower() for col in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+            columns = tuple(col[0].lower() for col in cursor.description)
+            # map/zip keep the per-row dict construction in C
+            return list(map(dict, map(zip, repeat(columns), cursor.fetchall())))
+        finally:
+            cursor.close()
+
+    @classmethod
+    def fetch_all_cached(
+        cls,
+        query: str,
+        params=None,
+        conn_config: Optional[Dict[str, Any]] = None,
+        ttl: float = QUERY_CACHE_TTL_S,
+    ):
+        """
+        fetch_all for read-only metadata queries (SHOW/DESC): identical queries
+        on the same connection within *ttl* seconds share one result. The rows
+        are shared too, so callers must not mutate them. Never use for DDL/DML.
+        """
+        config_hash = (
+            cls._config_hash if conn_config is None else _config_hash(conn_config)
+        )
+        key = (config_hash, query, params)
+        now = time.monotonic()
+        cached = cls._query_cache.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+
+        rows = cls.fetch_all(query, params, conn_config)
+        if len(cls._query_cache) >= QUERY_CACHE_MAXSIZE:
+            cls._query_cache.clear()
+        cls._query_cache[key] = (now, rows)
+        return rows
+
+    @classmethod
+    def invalidate_cache(cls):
+        """Forget all fetch_all_cached results, e.g. before running DDL."""
+        cls._query_cache.clear()
+
+    @classmethod
+    def fetch_iter(
+        cls, query: str, params=None, conn_config: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute and yield results one dict at a time, fetching FETCH_BATCH_SIZE
+        rows per round-trip so large results are never fully materialized.
+        """
+        cursor = cls.execute(query, params, conn_config)
+        try:
+            columns = tuple(col[0].lower() for col in cursor.description)
+            while rows := cursor.fetchmany(FETCH_BATCH_SIZE):
+                yield from map(dict, map(zip, repeat(columns), rows))
         finally:
             cursor.close()
 
@@ -122,3 +217,5 @@ class ConnectionManager:
             cls._connection.close()
             cls._connection = None
             cls._current_config = None
+            cls._config_hash = None
+        cls.invalidate_cache()
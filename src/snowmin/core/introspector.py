@@ -1,17 +1,73 @@
-from typing import Dict, List
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+from snowmin.core.config import CONFIG_DIR
 from snowmin.core.connection import ConnectionManager
 from snowmin.core.state import Resource
 from snowmin.resources.account import Warehouse
+from snowmin.resources.schema_objects import Column, Table
+
+# SHOW output spellings of booleans and missing values
+_TRUTHY = frozenset({"true", "True", "TRUE", True, 1, "1"})
+_NULLISH = frozenset({None, "null", "NULL", ""})
+
+# Concurrent queries while fetching tables. Databases and the DESC TABLE
+# fallback share one pool, so this caps the total.
+INTROSPECT_MAX_WORKERS = 8
+
+# On-disk cache of fetch_all() results, one file per account, role and
+# database allow-list
+CACHE_DIR = CONFIG_DIR / "cache"
+CACHE_MAX_AGE_S = 300
 
 
 class Introspector:
-    def __init__(self):
+    def __init__(
+        self,
+        databases: Optional[str] = None,
+        conn_config: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Args:
+            databases: Optional comma-separated allow-list of databases to
+                introspect (the introspect_databases setting).
+            conn_config: Connection configuration to introspect with; defaults
+                to the connection that is already open.
+        """
         self.conn = ConnectionManager
+        self.conn_config = conn_config
+        self.databases = (
+            None
+            if not databases
+            else {name.strip().upper() for name in databases.split(",") if name.strip()}
+        )
+        # Set when a fetch swallowed an error, so partial state is not cached
+        self._fetch_failed = False
 
-    def fetch_all(self) -> Dict[str, Resource]:
+    def fetch_all(
+        self, max_age_s: float = CACHE_MAX_AGE_S, refresh: bool = False
+    ) -> Dict[str, Resource]:
         """
         Fetch all managed resources from Snowflake and return as a dict of {identifier: Resource}.
+
+        Results are cached on disk per account, role and database allow-list;
+        a cache younger than
+        *max_age_s* seconds is returned without querying Snowflake unless
+        *refresh* is set. Nothing is cached if any fetch failed, as the result
+        would be missing resources that do exist.
         """
+        cache_path = self._cache_path()
+        if refresh:
+            self.conn.invalidate_cache()
+        else:
+            cached = _load_cache(cache_path, max_age_s)
+            if cached is not None:
+                return cached
+
+        self._fetch_failed = False
         resources = {}
 
         # Warehouses
@@ -26,15 +82,33 @@ class Introspector:
 
         # Add other types here...
 
+        if not self._fetch_failed:
+            _save_cache(cache_path, resources)
         return resources
 
+    def invalidate_cache(self) -> None:
+        """Drop the cached current state, e.g. after applying changes."""
+        self._cache_path().unlink(missing_ok=True)
+
+    def _cache_path(self) -> Path:
+        # Both the role and the allow-list change what introspection sees
+        config = self.conn_config or self.conn.get_current_config()
+        account = (config.get("account") or "default").lower()
+        key = json.dumps(
+            [account, (config.get("role") or "").upper(), sorted(self.databases or ())]
+        )
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return CACHE_DIR / f"{account}-{digest}.json"
+
     def fetch_warehouses(self) -> List[Warehouse]:
         # SHOW WAREHOUSES check logic
         # Result columns: name, state, type, size, ...
         # exact columns depend on snowflake version/account
         # We generally execute "SHOW WAREHOUSES"
         try:
-            rows = self.conn.fetch_all("SHOW WAREHOUSES")
+            rows = self.conn.fetch_all_cached(
+                "SHOW WAREHOUSES", conn_config=self.conn_config
+            )
             results = []
             for row in rows:
                 # row keys are lowercase
@@ -44,13 +118,13 @@ class Introspector:
                 # auto_suspend might be in different column or need parsing
                 # 'auto_suspend': 600
                 auto_suspend = row.get("auto_suspend")
-                if auto_suspend == "null" or auto_suspend is None:
+                if auto_suspend in _NULLISH:
                     auto_suspend = None
                 else:
                     auto_suspend = int(auto_suspend)
 
                 # 'auto_resume': 'true'
-                auto_resume = str(row.get("auto_resume", "true")).lower() == "true"
+                auto_resume = row.get("auto_resume", True) in _TRUTHY
 
                 comment = row.get("comment", "")
                 scaling_policy = row.get("scaling_policy", "STANDARD")
@@ -62,94 +136,316 @@ class Introspector:
                     auto_resume=auto_resume,
                     scaling_policy=scaling_policy,
                     comment=comment,
+                    # Current state, not desired state: keep out of the registry
+                    register=False,
                 )
-                # clear registry for fetched objects?
-                # fetched objects shouldn't auto-register as "Desired State".
-                # My base class auto-registers. This is a problem.
-                # Use a context manager or explicit flag?
-                # Or just clear registry before loading user config?
-                # User config is loaded AFTER introspection? usually "Plan" = Diff(Desired, Current)
-                # Ideally 'Current' objects are just objects, not in "The Registry" of desired state.
-                # So I need to hack/fix the base class auto-registry.
                 results.append(wh)
             return results
         except Exception as e:
             # Maybe permission error or no warehouses
             print(f"Warning: Failed to fetch warehouses: {e}")
+            self._fetch_failed = True
             return []
 
     def fetch_tables(self) -> List[Resource]:
         """Fetch all tables in the account (or reachable schemas)."""
-        # SHOW OBJECTS? SHOW TABLES lacks columns.
         # Strategy:
-        # 1. SHOW TABLES IN ACCOUNT
-        # 2. Group by schema
-        # 3. For each table, DESC TABLE (expensive!)
-        # Optimization: Only DESC tables that are in our Desired State? (Reconciliation limit)
-        # But we also want to detect drift/unmanaged tables (Destroy).
-        # For now, let's just implement SHOW TABLES and assume we can DESC them.
+        # 1. SHOW TERSE DATABASES, then per database (concurrently):
+        # 2. SHOW TERSE TABLES IN DATABASE (name/database/schema only; the
+        #    table comment is not needed for drift detection)
+        # 3. SHOW COLUMNS IN DATABASE once, grouped by table
+        # 4. If SHOW COLUMNS fails (e.g. over its 10k row limit), query the
+        #    database's INFORMATION_SCHEMA.COLUMNS once instead.
+        # 5. Fall back to one DESC TABLE per table (N+1) only if that fails
+        #    too. The describes are queued on the same pool once every
+        #    database is done, so no worker blocks waiting on another.
+        # Per-database queries avoid the timeouts and row caps of IN ACCOUNT.
 
         tables = []
         try:
-            # This might be huge in real account. Limit to databases we care about?
-            # SHOW TABLES IN ACCOUNT is safest for discovery.
-            rows = self.conn.fetch_all("SHOW TABLES IN ACCOUNT")
+            if self.conn_config:
+                # Connect before fanning out: the workers only reuse it
+                self.conn.get_connection(self.conn_config)
+            databases = self.fetch_database_names()
+            with ThreadPoolExecutor(max_workers=INTROSPECT_MAX_WORKERS) as pool:
+                undescribed = []
+                for db_tables, db_undescribed in pool.map(
+                    self._fetch_tables_in_database, databases
+                ):
+                    tables.extend(db_tables)
+                    undescribed.extend(db_undescribed)
+                if undescribed:
+                    columns_by_table = self._describe_tables(undescribed, pool)
+                    tables.extend(self._build_tables(undescribed, columns_by_table))
+        except Exception as e:
+            print(f"Warning: Failed to fetch tables: {e}")
+            self._fetch_failed = True
 
-            for row in rows:
-                db_name = row["database_name"]
-                schema_name = row["schema_name"]
-                table_name = row["name"]
-                comment = row.get("comment")
-
-                # Fetch columns
-                # We need fully qualified name
-                full_name = f"{db_name}.{schema_name}.{table_name}"
-
-                # TODO: Optimize this N+1 query.
-                # Information Schema might be better:
-                # SELECT * FROM snowflake.account_usage.columns WHERE deleted = NULL
-                # But that has latency.
-                # INFORMATION_SCHEMA in specific DB is faster but per-DB.
-
-                # Let's try DESC TABLE for now.
-                try:
-                    cols_rows = self.conn.fetch_all(f"DESC TABLE {full_name}")
-                    columns = []
-                    for c_row in cols_rows:
-                        # name, type, kind, null?, default, primary key, unique key...
-                        # DESC output: name, type, kind, null?, default, primary key, ..
-                        c_name = c_row["name"]
-                        c_type = c_row["type"]  # e.g. VARCHAR(100), NUMBER(38,0)
-                        c_null = c_row["null?"] == "Y"
-                        c_comment = c_row.get("comment")
-
-                        from snowmin.resources.schema_objects import Column
-
-                        columns.append(
-                            Column(
-                                name=c_name,
-                                type=c_type,
-                                nullable=c_null,
-                                comment=c_comment,
-                            )
-                        )
-
-                    from snowmin.resources.schema_objects import Table
-
-                    tables.append(
-                        Table(
-                            name=table_name,
-                            database=db_name,
-                            schema=schema_name,
-                            columns=columns,
-                            comment=comment,
-                            register=False,
-                        )
-                    )
-                except Exception as e:
-                    print(f"Warning: Failed to describe table {full_name}: {e}")
+        return tables
 
+    def fetch_database_names(self) -> List[str]:
+        """
+        Names of the databases to introspect: the configured allow-list if
+        any, otherwise every database except shared (imported) ones.
+        """
+        rows = self.conn.fetch_all_cached(
+            "SHOW TERSE DATABASES", conn_config=self.conn_config
+        )
+        names = [row["name"] for row in rows if row.get("kind") != "IMPORTED DATABASE"]
+        if self.databases is None:
+            return names
+        return [name for name in names if name.upper() in self.databases]
+
+    def _fetch_tables_in_database(
+        self, db_name: str
+    ) -> Tuple[List[Table], List[Dict[str, Any]]]:
+        """
+        Fetch the tables of *db_name*. Returns the tables built, plus the
+        SHOW rows of any tables that still need a DESC TABLE.
+        """
+        try:
+            # Rows are streamed so peak memory does not grow with the database
+            columns_by_table = self._fetch_columns_by_table(db_name)
+            rows = self.conn.fetch_iter(f"SHOW TERSE TABLES IN DATABASE {db_name}")
+            if columns_by_table is None:
+                # The fallbacks need every schema/table name up front
+                rows = list(rows)
+                schemas = sorted({row["schema_name"] for row in rows})
+                columns_by_table = self._fetch_columns_for_schemas(db_name, schemas)
+            if columns_by_table is None:
+                return [], rows
+            return self._build_tables(rows, columns_by_table), []
         except Exception as e:
-            print(f"Warning: Failed to fetch tables: {e}")
+            print(f"Warning: Failed to fetch tables in database {db_name}: {e}")
+            self._fetch_failed = True
+            return [], []
+
+    def _build_tables(
+        self,
+        table_rows: Iterable[Dict[str, Any]],
+        columns_by_table: Dict[Tuple[str, str, str], Union[List[Column], Exception]],
+    ) -> List[Table]:
+        tables = []
+        for row in table_rows:
+            db_name = row["database_name"]
+            schema_name = row["schema_name"]
+            table_name = row["name"]
+
+            # We need fully qualified name
+            full_name = f"{db_name}.{schema_name}.{table_name}"
 
+            try:
+                columns = columns_by_table.get((db_name, schema_name, table_name), [])
+                if isinstance(columns, Exception):
+                    raise columns
+
+                tables.append(
+                    # Rows come straight from Snowflake: skip validation
+                    # (and Resource.__init__, so nothing is registered)
+                    Table.model_construct(
+                        name=table_name,
+                        database=db_name,
+                        schema_name=schema_name,
+                        columns=columns,
+                    )
+                )
+            except Exception as e:
+                print(f"Warning: Failed to describe table {full_name}: {e}")
+                self._fetch_failed = True
         return tables
+
+    def _fetch_columns_by_table(
+        self, db_name: str
+    ) -> Optional[Dict[Tuple[str, str, str], List[Column]]]:
+        """
+        Fetch every column in *db_name* with a single SHOW COLUMNS and group
+        them by (database, schema, table). Returns None if the bulk query fails
+        so the caller can fall back to DESC TABLE.
+        """
+        columns_by_table: Dict[Tuple[str, str, str], List[Column]] = {}
+        try:
+            for c_row in self.conn.fetch_iter(f"SHOW COLUMNS IN DATABASE {db_name}"):
+                key = (
+                    c_row["database_name"],
+                    c_row["schema_name"],
+                    c_row["table_name"],
+                )
+                columns_by_table.setdefault(key, []).append(
+                    Column(
+                        name=c_row["column_name"],
+                        type=_column_type_from_show(c_row["data_type"]),
+                        nullable=str(c_row["null?"]).lower() == "true",
+                        comment=c_row.get("comment") or None,
+                    )
+                )
+        except Exception:
+            return None
+        return columns_by_table
+
+    def _fetch_columns_for_schemas(
+        self, db_name: str, schemas: List[str]
+    ) -> Optional[Dict[Tuple[str, str, str], List[Column]]]:
+        """
+        Fetch the columns of every table in *schemas* with one query against
+        the database's INFORMATION_SCHEMA, which has no SHOW row limit.
+        Returns None if the query fails so the caller can fall back to
+        DESC TABLE.
+        """
+        columns_by_table: Dict[Tuple[str, str, str], List[Column]] = {}
+        if not schemas:
+            return columns_by_table
+
+        placeholders = ", ".join(["%s"] * len(schemas))
+        query = (
+            "SELECT table_schema, table_name, column_name, data_type,"
+            " character_maximum_length, numeric_precision, numeric_scale,"
+            " datetime_precision, is_nullable, comment"
+            f" FROM {db_name}.information_schema.columns"
+            f" WHERE table_schema IN ({placeholders})"
+            " ORDER BY table_schema, table_name, ordinal_position"
+        )
+        try:
+            for c_row in self.conn.fetch_iter(query, tuple(schemas)):
+                key = (db_name, c_row["table_schema"], c_row["table_name"])
+                type_name = c_row["data_type"]
+                columns_by_table.setdefault(key, []).append(
+                    Column(
+                        name=c_row["column_name"],
+                        type=_format_column_type(
+                            type_name,
+                            length=c_row["character_maximum_length"],
+                            precision=c_row["numeric_precision"],
+                            scale=c_row["datetime_precision"]
+                            if type_name in _SCALED_TIME_TYPES
+                            else c_row["numeric_scale"],
+                        ),
+                        nullable=c_row["is_nullable"] == "YES",
+                        comment=c_row.get("comment") or None,
+                    )
+                )
+        except Exception:
+            return None
+        return columns_by_table
+
+    def _describe_tables(
+        self, table_rows: Iterable[Dict[str, Any]], pool: ThreadPoolExecutor
+    ) -> Dict[Tuple[str, str, str], Union[List[Column], Exception]]:
+        """
+        DESC every table in *table_rows* concurrently on *pool*. Each key maps
+        to the table's columns, or to the exception raised while describing it.
+        """
+        keys = [
+            (row["database_name"], row["schema_name"], row["name"])
+            for row in table_rows
+        ]
+
+        def describe(key: Tuple[str, str, str]) -> Union[List[Column], Exception]:
+            try:
+                return self._describe_table_columns(".".join(key))
+            except Exception as e:
+                return e
+
+        return dict(zip(keys, pool.map(describe, keys)))
+
+    def _describe_table_columns(self, full_name: str) -> List[Column]:
+        """Fetch the columns of a single table with DESC TABLE."""
+        columns = []
+        for c_row in self.conn.fetch_all_cached(f"DESC TABLE {full_name}"):
+            # DESC output: name, type, kind, null?, default, primary key, ..
+            columns.append(
+                Column(
+                    name=c_row["name"],
+                    type=c_row["type"],  # e.g. VARCHAR(100), NUMBER(38,0)
+                    nullable=c_row["null?"] == "Y",
+                    comment=c_row.get("comment"),
+                )
+            )
+        return columns
+
+
+def _column_type_from_show(data_type: str) -> str:
+    """
+    Convert the JSON data_type reported by SHOW COLUMNS
+    (e.g. '{"type":"FIXED","precision":38,"scale":0}') into the
+    DESC TABLE spelling (e.g. 'NUMBER(38,0)').
+    """
+    try:
+        info = json.loads(data_type)
+    except (TypeError, ValueError):
+        return str(data_type)
+
+    return _format_column_type(
+        info.get("type", ""),
+        length=info.get("length"),
+        precision=info.get("precision"),
+        scale=info.get("scale"),
+    )
+
+
+# Types whose scale is the fractional-seconds precision
+_SCALED_TIME_TYPES = ("TIME", "TIMESTAMP_LTZ", "TIMESTAMP_NTZ", "TIMESTAMP_TZ")
+
+
+def _format_column_type(
+    type_name: str,
+    length: Optional[int] = None,
+    precision: Optional[int] = None,
+    scale: Optional[int] = None,
+) -> str:
+    """
+    Spell a column type the way DESC TABLE does. Accepts both the SHOW COLUMNS
+    (FIXED/REAL) and INFORMATION_SCHEMA (NUMBER/FLOAT) type names.
+    """
+    if type_name in ("FIXED", "NUMBER"):
+        precision = 38 if precision is None else precision
+        scale = 0 if scale is None else scale
+        return f"NUMBER({precision},{scale})"
+    if type_name in ("REAL", "FLOAT"):
+        return "FLOAT"
+    if type_name in ("TEXT", "BINARY"):
+        base = "VARCHAR" if type_name == "TEXT" else "BINARY"
+        return f"{base}({length})" if length else base
+    if type_name in _SCALED_TIME_TYPES:
+        return f"{type_name}({9 if scale is None else scale})"
+    return type_name
+
+
+# Cacheable resource classes keyed by _snowflake_type
+_RESOURCE_TYPES: Dict[str, Type[Resource]] = {
+    cls._snowflake_type: cls for cls in (Warehouse, Table)
+}
+
+
+def _load_cache(cache_path: Path, max_age_s: float) -> Optional[Dict[str, Resource]]:
+    """Return the cached resources at *cache_path*, or None if missing or stale."""
+    try:
+        if time.time() - cache_path.stat().st_mtime > max_age_s:
+            return None
+        with open(cache_path, "r") as f:
+            entries = json.load(f)
+        # model_validate does not run Resource.__init__, so nothing registers
+        resources = (
+            _RESOURCE_TYPES[entry["type"]].model_validate(entry["data"])
+            for entry in entries
+        )
+        return {resource.identifier: resource for resource in resources}
+    except (OSError, ValueError, KeyError):
+        # Missing or unreadable cache (pydantic's ValidationError is a ValueError)
+        return None
+
+
+def _save_cache(cache_path: Path, resources: Dict[str, Resource]) -> None:
+    """Write *resources* to *cache_path*; failures only cost the next run a fetch."""
+    entries = [
+        {
+            "type": resource._snowflake_type,
+            "data": resource.model_dump(mode="json", by_alias=True),
+        }
+        for resource in resources.values()
+    ]
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump(entries, f)
+    except OSError as e:
+        print(f"Warning: Failed to write state cache {cache_path}: {e}")
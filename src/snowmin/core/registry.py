@@ -1,26 +1,42 @@
-from typing import Dict, List, TYPE_CHECKING
+from typing import Dict, List, TYPE_CHECKING, ValuesView
 
 if TYPE_CHECKING:
     from snowmin.core.state import Resource
 
 
 class ResourceRegistry:
+    # Keyed by unique identifier (e.g. "warehouse.COMPUTE_WH") in declaration
+    # order, which plan() relies on to emit dependent DDL after its targets
     _resources: Dict[str, "Resource"] = {}
+    # Index of the same resources by _snowflake_type, for get_all_of_type
+    _by_type: Dict[str, Dict[str, "Resource"]] = {}
 
     @classmethod
     def register(cls, resource: "Resource"):
-        """Register a resource instance."""
-        # Key by unique identifier: type.name (e.g. warehouse.compute_wh)
+        """Register a resource instance; a later definition overwrites an earlier one."""
         key = resource.identifier
-        if key in cls._resources:
-            # Overwrite allowed?
-            pass
         cls._resources[key] = resource
+        cls._by_type.setdefault(resource._snowflake_type, {})[key] = resource
+
+    @classmethod
+    def unregister(cls, resource: "Resource"):
+        """Remove *resource*, unless a later definition has since replaced it."""
+        key = resource.identifier
+        if cls._resources.get(key) is resource:
+            del cls._resources[key]
+            del cls._by_type[resource._snowflake_type][key]
 
     @classmethod
     def get_all(cls) -> List["Resource"]:
+        """All registered resources in first-registered order."""
         return list(cls._resources.values())
 
+    @classmethod
+    def get_all_of_type(cls, snowflake_type: str) -> ValuesView["Resource"]:
+        """Registered resources of one type, e.g. "warehouse"."""
+        return cls._by_type.get(snowflake_type, {}).values()
+
     @classmethod
     def clear(cls):
         cls._resources = {}
+        cls._by_type = {}
@@ -1,46 +1,64 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 
 import click
+from colorama import Fore, Style
 from snowmin.core.introspector import Introspector
 from snowmin.core.registry import ResourceRegistry
 from snowmin.core.connection import ConnectionManager
 
 
 class Runner:
-    def __init__(self):
-        self.introspector = Introspector()
+    def __init__(
+        self,
+        databases: Optional[str] = None,
+        verbose: bool = True,
+        conn_config: Optional[Dict[str, Any]] = None,
+    ):
+        self.introspector = Introspector(databases=databases, conn_config=conn_config)
+        # When False, skip building the per-resource plan lines
+        self.verbose = verbose
         self.conn = ConnectionManager
+        self.conn_config = conn_config
 
-    def plan(self) -> List[str]:
+    def plan(self, refresh: bool = False) -> List[str]:
         """
         Compare desired state (Registry) with current state (Introspector).
         Returns list of SQL statements.
+
+        The current state may come from the Introspector's on-disk cache;
+        pass refresh=True to always query Snowflake.
         """
         # 1. Fetch current state
         click.echo("Fetching current state from Snowflake...")
-        current_state = self.introspector.fetch_all()
+        current_state = self.introspector.fetch_all(refresh=refresh)
 
         # 2. Get desired state
         desired_state = ResourceRegistry.get_all()
 
         plan_sql = []
 
-        from colorama import Fore, Style
+        # 3. Partition identifiers up front. Dict key views give hash-set
+        # membership while keeping declaration order, which a bare set
+        # difference would not (set iteration order varies between runs).
+        desired = {r.identifier: r for r in desired_state}
+        current_ids = current_state.keys()
+        to_create = [r for i, r in desired.items() if i not in current_ids]
+        to_update = [(i, r) for i, r in desired.items() if i in current_ids]
+        to_drop = [(i, r) for i, r in current_state.items() if i not in desired]
+
+        for resource in to_create:
+            if self.verbose:
+                click.echo(
+                    f"  {Fore.GREEN}+ Create {resource.identifier}{Style.RESET_ALL}"
+                )
+            plan_sql.append(resource.get_create_sql())
 
-        # 3. Compare Desired vs Current
-        for resource in desired_state:
-            identifier = resource.identifier
-            if identifier not in current_state:
-                # Create
-                click.echo(f"  {Fore.GREEN}+ Create {identifier}{Style.RESET_ALL}")
-                plan_sql.append(resource.get_create_sql())
-            else:
-                # Update?
-                current = current_state[identifier]
-                alter_sql = resource.get_alter_sql(current)
-                if alter_sql:
+        for identifier, resource in to_update:
+            alter_sql = resource.get_alter_sql(current_state[identifier])
+            if alter_sql:
+                if self.verbose:
                     click.echo(f"  {Fore.YELLOW}~ Update {identifier}{Style.RESET_ALL}")
-                    plan_sql.append(alter_sql)
+                plan_sql.append(alter_sql)
 
         # 4. Check for Destructive changes (Resources in Current but not Desired)
         # Note: We should be careful. Is Desired State authoritative?
@@ -50,13 +68,10 @@ class Runner:
         # We need to know which types we support to avoiding dropping things we don't know about.
         # Since Introspector only fetches what we support (e.g. Warehouses),
         # checking "if identifier in current but not desired" is safe-ish for those types.
-
-        desired_identifiers = {r.identifier for r in desired_state}
-        for identifier, resource in current_state.items():
-            if identifier not in desired_identifiers:
-                # Drop
+        for identifier, resource in to_drop:
+            if self.verbose:
                 click.echo(f"  {Fore.RED}- Destroy {identifier}{Style.RESET_ALL}")
-                plan_sql.append(resource.get_drop_sql())
+            plan_sql.append(resource.get_drop_sql())
 
         return plan_sql
 
@@ -67,7 +82,18 @@ class Runner:
             return
 
         click.echo("\nApplying changes...")
-        for sql in plan_sql:
-            click.echo(f"Executing: {sql}")
-            self.conn.execute(sql)
+        # Metadata fetched before the DDL below is about to go stale. Drop it
+        # up front and again afterwards, so a failed statement part way
+        # through the plan cannot leave the old state cached.
+        self._invalidate_caches()
+        try:
+            for sql in plan_sql:
+                click.echo(f"Executing: {sql}")
+                self.conn.execute(sql, conn_config=self.conn_config)
+        finally:
+            self._invalidate_caches()
         click.echo("Apply complete.")
+
+    def _invalidate_caches(self):
+        self.conn.invalidate_cache()
+        self.introspector.invalidate_cache()
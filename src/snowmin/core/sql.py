@@ -0,0 +1,10 @@
+"""Helpers for building Snowflake SQL text."""
+
+# Snowflake string literals treat a backslash as an escape character, so
+# backslashes are doubled along with single quotes
+_LITERAL_ESCAPES = str.maketrans({"\\": "\\\\", "'": "''"})
+
+
+def quote_literal(value) -> str:
+    """Render value as a single-quoted SQL string literal."""
+    return "'" + str(value).translate(_LITERAL_ESCAPES) + "'"
@@ -3,21 +3,44 @@
 from __future__ import annotations
 
 import importlib.util
+import os
 import sys
 from pathlib import Path
 from types import ModuleType
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple, Union
 
 import click
 
+from snowmin.core.registry import ResourceRegistry
 
-def load_stack(path: str) -> ModuleType:
+if TYPE_CHECKING:
+    from snowmin.core.state import Resource
+
+# Executed stack modules, with the resources each registered, keyed by
+# (resolved path, mtime_ns)
+_CACHE: Dict[Tuple[str, int], Tuple[ModuleType, List[Resource]]] = {}
+
+# Stack directories already added to sys.path (avoids rescanning sys.path)
+_STACK_DIRS_SEEN: Set[str] = set()
+
+
+def load_stack(path: Union[str, os.PathLike], reload: bool = False) -> ModuleType:
     """Load a stack Python file from *path* and execute it.
 
     The module is registered in ``sys.modules`` under the key ``"stack"``
     so that any relative imports inside the stack file resolve correctly.
 
+    An unchanged stack file is only executed once per process; later calls
+    return the cached module and register the resources its execution
+    registered again, so they are present even if the registry was cleared
+    in between. When the file changes (or *reload* is set) the resources of
+    its earlier execution are unregistered and the stack re-executed;
+    resources registered by other stacks are left alone.
+
     Args:
-        path: Absolute or CWD-relative path to a ``.py`` stack file.
+        path: Absolute or CWD-relative path (``str`` or path-like) to a
+            ``.py`` stack file.
+        reload: Re-execute the stack even if its file is unchanged.
 
     Returns:
         The loaded module.
@@ -35,11 +58,28 @@ def load_stack(path: str) -> ModuleType:
             f"Stack file must be a Python (.py) file, got: '{stack_path.name}'"
         )
 
+    cache_key = (str(stack_path), stack_path.stat().st_mtime_ns)
+    if not reload and cache_key in _CACHE:
+        module, resources = _CACHE[cache_key]
+        for resource in resources:
+            ResourceRegistry.register(resource)
+        sys.modules["stack"] = module
+        return module
+
+    # Re-executing a stack we already ran: drop what its last run registered
+    stale_keys = [key for key in _CACHE if key[0] == cache_key[0]]
+    for key in stale_keys:
+        _, resources = _CACHE.pop(key)
+        for resource in resources:
+            ResourceRegistry.unregister(resource)
+
     # Add the directory containing the stack file to sys.path so that
     # relative imports inside the stack (e.g. from my_helpers import ...) work.
     stack_dir = str(stack_path.parent)
-    if stack_dir not in sys.path:
-        sys.path.insert(0, stack_dir)
+    if stack_dir not in _STACK_DIRS_SEEN:
+        if stack_dir not in sys.path:
+            sys.path.insert(0, stack_dir)
+        _STACK_DIRS_SEEN.add(stack_dir)
 
     spec = importlib.util.spec_from_file_location("stack", stack_path)
     if spec is None or spec.loader is None:
@@ -47,6 +87,13 @@ def load_stack(path: str) -> ModuleType:
 
     module = importlib.util.module_from_spec(spec)
     sys.modules["stack"] = module
+    registered_before = {id(resource) for resource in ResourceRegistry.get_all()}
     spec.loader.exec_module(module)  # type: ignore[union-attr]
 
+    resources = [
+        resource
+        for resource in ResourceRegistry.get_all()
+        if id(resource) not in registered_before
+    ]
+    _CACHE[cache_key] = (module, resources)
     return module
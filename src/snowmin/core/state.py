@@ -1,5 +1,7 @@
+import sys
+from functools import cached_property
 from typing import ClassVar
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from snowmin.core.registry import ResourceRegistry
 
 
@@ -8,6 +10,10 @@ class Resource(BaseModel):
     Base class for all Snowflake resources.
     """
 
+    # Resources are immutable once defined, so derived values such as the
+    # identifier and CREATE statement can be cached on the instance
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(
         ...,
         description="Name of the resource (case-insensitive usually, but Snowflake is tricky)",
@@ -15,19 +21,58 @@ class Resource(BaseModel):
 
     # Internal usage
     _snowflake_type: ClassVar[str] = "resource"
+    # _snowflake_type.upper(), filled in for each subclass at class creation
+    _type_upper: ClassVar[str] = "RESOURCE"
+    # Names of the cached_property attributes, filled in the same way
+    _cached_properties: ClassVar[frozenset] = frozenset()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._type_upper = cls._snowflake_type.upper()
+        cls._cached_properties = frozenset(
+            name
+            for klass in cls.__mro__
+            for name, attr in vars(klass).items()
+            if isinstance(attr, cached_property)
+        )
 
     def __init__(self, register: bool = True, **data):
         super().__init__(**data)
         if register:
             ResourceRegistry.register(self)
 
-    @property
+    def model_copy(self, *, update=None, deep: bool = False):
+        """
+        Copy the resource. cached_property values live in the instance
+        __dict__, which pydantic copies too, so they are dropped from the copy
+        and derived again from its (possibly updated) fields.
+        """
+        copy = super().model_copy(update=update, deep=deep)
+        for name in self._cached_properties:
+            copy.__dict__.pop(name, None)
+        return copy
+
+    @cached_property
     def identifier(self) -> str:
-        """Unique identifier for the resource (e.g. 'warehouse.my_wh')"""
-        return f"{self._snowflake_type}.{self.name.upper()}"
+        """
+        Unique identifier for the resource (e.g. 'warehouse.MY_WH').
+        Computed once per instance and interned, since it is read and used as
+        a dict key several times per resource while planning.
+        """
+        return sys.intern(f"{self._snowflake_type}.{self.name.upper()}")
+
+    @cached_property
+    def create_sql(self) -> str:
+        """SQL to create this resource, built once per instance."""
+        return self._build_create_sql()
 
     def get_create_sql(self) -> str:
         """Return SQL to create this resource."""
+        return self.create_sql
+
+    def _build_create_sql(self) -> str:
+        """Build the CREATE statement; implemented by each resource type."""
         raise NotImplementedError
 
     def get_alter_sql(self, current_state: "Resource") -> str:
@@ -36,7 +81,7 @@ class Resource(BaseModel):
 
     def get_drop_sql(self) -> str:
         """Return SQL to drop this resource."""
-        return f"DROP {self._snowflake_type.upper()} IF EXISTS {self.name}"
+        return f"DROP {self._type_upper} IF EXISTS {self.name}"
 
 
 class AccountObject(Resource):
@@ -51,6 +96,9 @@ class SchemaObject(Resource):
     database: str
     schema_name: str = Field(..., alias="schema")
 
-    @property
+    @cached_property
     def identifier(self) -> str:
-        return f"{self._snowflake_type}.{self.database.upper()}.{self.schema_name.upper()}.{self.name.upper()}"
+        return sys.intern(
+            f"{self._snowflake_type}."
+            + f"{self.database}.{self.schema_name}.{self.name}".upper()
+        )
@@ -2,85 +2,371 @@
 
 import re
 import json
+import functools
+import threading
+import time
 import click
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 from colorama import Fore, Style
 from snowmin.core.connection import ConnectionManager
 from snowmin.core.config import get_merged_connection_config
+from snowmin.core.sql import quote_literal
 from snowmin.operations.schema import (
     build_schema_query_suffix,
     location_label,
     parse_schema_specs,
 )
 
+# Prefer orjson for the per-pipe status payloads when it is installed.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# keep catching the stdlib exception.
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depends on the environment
+    _json_loads = json.loads
+
+# Pipes per SYSTEM$PIPE_STATUS query, to stay well under query size limits
+STATUS_BATCH_SIZE = 50
+
+# Status batches queried concurrently on the shared connection
+STATUS_MAX_WORKERS = 4
+
+# SHOW PIPES rows fetched per round-trip
+SHOW_PIPES_FETCH_SIZE = 1000
+
+# Where SHOW PIPES puts the columns we read (created_on, name, database_name,
+# schema_name, ...); checked against cursor.description before use
+_SHOW_PIPES_LAYOUT = (("NAME", 1), ("DATABASE_NAME", 2), ("SCHEMA_NAME", 3))
+
+# How long SHOW PIPES results are reused within a process (see --no-cache)
+SHOW_PIPES_CACHE_TTL_S = 30.0
+
+# SHOW PIPES results: (account, database, schema) -> (fetched at, pipes)
+_SHOW_PIPES_CACHE: Dict[Tuple[Optional[str], ...], Tuple[float, list]] = {}
+
+# Current DDL of one pipe, bound to its fully qualified name
+PIPE_DDL_QUERY = "SELECT GET_DDL('pipe', %s)"
+
+# States synthesized client-side, so a --status filter on them needs the
+# full status payload rather than only the execution state
+_CLIENT_ONLY_STATES = frozenset({"UNKNOWN", "ERROR_PARSING_JSON"})
+
+# Display colors for exact execution states; STOPPED_*/STALLED_* states are
+# matched by substring in _get_status_color
+_STATUS_COLORS = {"RUNNING": Fore.GREEN, "PAUSED": Fore.YELLOW}
+
+# "executionState" field of a SYSTEM$PIPE_STATUS payload (plain string value)
+_EXECUTION_STATE_RE = re.compile(r'"executionState"\s*:\s*"([^"\\]*)"')
+
+
+@dataclass(slots=True)
+class PipeRef:
+    """A pipe to report on or act on, with its last known execution state."""
+
+    name: str
+    state: str = "UNKNOWN"
+    database: Optional[str] = None
+    schema: Optional[str] = None
+
+    @property
+    def full_name(self) -> str:
+        """Name qualified with as much of database/schema as is known."""
+        if self.database and self.schema:
+            return f"{self.database}.{self.schema}.{self.name}"
+        if self.schema:
+            return f"{self.schema}.{self.name}"
+        return self.name
+
 
 def _get_status_color(status: str) -> str:
     """Get color for pipe status"""
     status_upper = status.upper()
-    if status_upper == "RUNNING":
-        return Fore.GREEN
-    elif status_upper == "PAUSED":
-        return Fore.YELLOW
-    elif "STOPPED" in status_upper or "STALLED" in status_upper:
+    color = _STATUS_COLORS.get(status_upper)
+    if color is not None:
+        return color
+    if "STOPPED" in status_upper or "STALLED" in status_upper:
         return Fore.RED
-    else:
-        return Fore.WHITE
+    return Fore.WHITE
+
+
+def _iter_rows(cursor):
+    """Yield cursor rows, fetching SHOW_PIPES_FETCH_SIZE rows per round-trip."""
+    cursor.arraysize = SHOW_PIPES_FETCH_SIZE
+    while rows := cursor.fetchmany(SHOW_PIPES_FETCH_SIZE):
+        yield from rows
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a --pattern regex once per process rather than once per row."""
+    return re.compile(pattern)
+
+
+def _pipe_status_query(batch: List[PipeRef], state_only: bool = False) -> str:
+    """
+    One SELECT with a SYSTEM$PIPE_STATUS column per pipe in *batch*. The
+    function only accepts a constant argument, so each name is inlined as a
+    string literal rather than bound or read from a column. With state_only,
+    each column is just the executionState of the status payload.
+    """
+    columns = []
+    for i, pipe in enumerate(batch):
+        column = f"SYSTEM$PIPE_STATUS({quote_literal(pipe.full_name)})"
+        if state_only:
+            column = f"PARSE_JSON({column}):executionState::string"
+        columns.append(f"{column} AS s{i}")
+    return "SELECT " + ", ".join(columns)
+
+
+def _fetch_status_batch(
+    conn_config: dict, batch: List[PipeRef], status_filter: Optional[str] = None
+) -> dict:
+    """Run SYSTEM$PIPE_STATUS for one batch of pipes."""
+    cursor = ConnectionManager.execute(
+        _pipe_status_query(batch, state_only=bool(status_filter)),
+        conn_config=conn_config,
+    )
+    try:
+        row = cursor.fetchone() or ()
+    finally:
+        cursor.close()
+
+    if status_filter:
+        wanted = status_filter.upper()
+        return {
+            pipe.full_name: state
+            for pipe, state in zip(batch, row)
+            if state is not None and state.upper() == wanted
+        }
 
+    status_map = {}
+    for pipe, json_status in zip(batch, row):
+        p_name = pipe.full_name
+        # Only executionState is needed, so pull it out with a regex and
+        # fully parse the payload only when that misses
+        match = _EXECUTION_STATE_RE.search(json_status)
+        if match:
+            status_map[p_name] = match.group(1)
+            continue
+        try:
+            status_data = _json_loads(json_status)
+            execution_state = status_data.get("executionState", "UNKNOWN")
+            status_map[p_name] = execution_state
+        except json.JSONDecodeError:
+            status_map[p_name] = "ERROR_PARSING_JSON"
 
-def _fetch_pipe_statuses(conn_config: dict, pipes: list) -> dict:
+    return status_map
+
+
+def _fetch_pipe_statuses(
+    conn_config: dict,
+    pipes: List[PipeRef],
+    max_workers: int = STATUS_MAX_WORKERS,
+    status_filter: Optional[str] = None,
+) -> dict:
     """
     Fetch detailed status for a list of pipes using SYSTEM$PIPE_STATUS.
-    Returns a dict mapping pipe_name -> execution_state.
+    Returns a dict mapping the pipe's full_name -> execution_state.
 
-    pipes: List of (name, database, schema) tuples
+    pipes: List of PipeRef
+    max_workers: Number of batches in flight at once
+    status_filter: Only return pipes in this state (case-insensitive),
+        reading just the execution state rather than the full payload
     """
     if not pipes:
         return {}
 
     status_map = {}
-    batch_size = 50  # Process in batches to avoid query size limits
-
-    for i in range(0, len(pipes), batch_size):
-        batch = pipes[i : i + batch_size]
-        queries = []
-
-        for name, db, schema in batch:
-            # Construct fully qualified name
-            fqn = name
-            if db and schema:
-                fqn = f"{db}.{schema}.{name}"
-            elif schema:
-                fqn = f"{schema}.{name}"
-
-            queries.append(
-                f"SELECT '{name}' as pipe_name, SYSTEM$PIPE_STATUS('{fqn}') as json_status"
-            )
-
-        full_query = " UNION ALL ".join(queries)
-
+    batches = [
+        pipes[i : i + STATUS_BATCH_SIZE]
+        for i in range(0, len(pipes), STATUS_BATCH_SIZE)
+    ]
+    echo_lock = threading.Lock()
+    failed_batches = []
+
+    def fetch(batch: list) -> dict:
         try:
-            cursor = ConnectionManager.execute(full_query, conn_config=conn_config)
-            rows = cursor.fetchall()
-            cursor.close()
-
-            for row in rows:
-                p_name = row[0]
-                json_status = row[1]
-                try:
-                    status_data = json.loads(json_status)
-                    execution_state = status_data.get("executionState", "UNKNOWN")
-                    status_map[p_name] = execution_state
-                except json.JSONDecodeError:
-                    status_map[p_name] = "ERROR_PARSING_JSON"
+            return _fetch_status_batch(conn_config, batch, status_filter)
+        except Exception as e:
+            with echo_lock:
+                click.echo(
+                    f"{Fore.RED}Error fetching status batch: {e}{Style.RESET_ALL}",
+                    err=True,
+                )
+            if len(batch) > 1:
+                failed_batches.append(batch)
+            return {}
 
+    def fetch_one(pipe: PipeRef) -> dict:
+        try:
+            return _fetch_status_batch(conn_config, [pipe], status_filter)
         except Exception as e:
-            click.echo(
-                f"{Fore.RED}Error fetching status batch: {e}{Style.RESET_ALL}", err=True
-            )
+            with echo_lock:
+                click.echo(
+                    f"{Fore.RED}Error fetching status for pipe {pipe.full_name}: {e}{Style.RESET_ALL}",
+                    err=True,
+                )
+            return {}
+
+    # The first batch runs inline so the shared connection is opened once,
+    # before any worker thread asks for it
+    status_map.update(fetch(batches[0]))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(fetch, batch) for batch in batches[1:]]
+        for future in as_completed(futures):
+            status_map.update(future.result())
+
+        # One bad pipe fails its whole batch; retry those pipes one at a time
+        # so the rest are not left UNKNOWN
+        retry = [pipe for batch in failed_batches for pipe in batch]
+        for result in pool.map(fetch_one, retry):
+            status_map.update(result)
 
     return status_map
 
 
+def _show_pipes_indices(
+    description,
+) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """(name, database_name, schema_name) column indices of a SHOW PIPES result."""
+    if len(description) > 3 and all(
+        description[i][0].upper() == col for col, i in _SHOW_PIPES_LAYOUT
+    ):
+        return 1, 2, 3
+
+    # Unexpected layout: find column indexes case-insensitively
+    col_map = {c[0].upper(): i for i, c in enumerate(description)}
+    return col_map.get("NAME"), col_map.get("DATABASE_NAME"), col_map.get("SCHEMA_NAME")
+
+
+def _show_pipes(
+    conn_config: dict, target_database: Optional[str], target_schema: Optional[str]
+) -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """Run SHOW PIPES for one location; returns (name, database, schema) tuples."""
+    query = "SHOW PIPES" + build_schema_query_suffix(target_database, target_schema)
+
+    click.echo(f"Fetching pipes{location_label(target_database, target_schema)}...")
+    cursor = ConnectionManager.execute(query, conn_config=conn_config)
+
+    try:
+        name_idx, database_idx, schema_idx = _show_pipes_indices(cursor.description)
+
+        if name_idx is None:
+            raise click.ClickException(
+                "Could not find 'name' column in SHOW PIPES result."
+            )
+
+        return [
+            (
+                row[name_idx],
+                row[database_idx] if database_idx is not None else target_database,
+                row[schema_idx] if schema_idx is not None else target_schema,
+            )
+            for row in _iter_rows(cursor)
+        ]
+    finally:
+        cursor.close()
+
+
+def _forget_show_pipes(conn_config: dict, pipes: List[PipeRef]) -> None:
+    """Drop cached SHOW PIPES results for any location that lists *pipes*."""
+
+    def covers(location: Optional[str], value: Optional[str]) -> bool:
+        return location is None or location.upper() == (value or "").upper()
+
+    account = conn_config.get("account")
+    for key in list(_SHOW_PIPES_CACHE):
+        key_account, key_database, key_schema = key
+        if key_account == account and any(
+            covers(key_database, pipe.database) and covers(key_schema, pipe.schema)
+            for pipe in pipes
+        ):
+            del _SHOW_PIPES_CACHE[key]
+
+
+def _split_pipe_name(
+    pipe_name: str,
+    target_locations: List[Tuple[Optional[str], Optional[str]]],
+    config_database: Optional[str],
+) -> Tuple[str, List[Tuple[Optional[str], Optional[str]]]]:
+    """
+    Split a PIPE_NAME argument into the bare name and the (database, schema)
+    locations to apply it to. A qualified name overrides target_locations.
+    """
+    first, sep, rest = pipe_name.partition(".")
+    if not sep:
+        return pipe_name, target_locations
+
+    second, sep, name = rest.partition(".")
+    if not sep:
+        return rest, [(config_database, first)]
+    if "." in name:
+        # More than three parts: not a pipe reference we can split
+        return pipe_name, target_locations
+    return name, [(first, second)]
+
+
+def _enumerate_pipes(
+    conn_config: dict,
+    locations: List[Tuple[Optional[str], Optional[str]]],
+    pattern: Optional[str] = None,
+    need_status: bool = True,
+    use_cache: bool = True,
+    status: Optional[str] = None,
+) -> List[PipeRef]:
+    """
+    SHOW PIPES in each (database, schema) location, keeping the pipes whose
+    name matches pattern. With need_status, each pipe's state is filled in
+    with one SYSTEM$PIPE_STATUS pass over all locations; otherwise it is
+    left as UNKNOWN. With status, only pipes in that state (case-insensitive)
+    are returned. SHOW PIPES results younger than SHOW_PIPES_CACHE_TTL_S are
+    reused unless use_cache is False.
+    """
+    pat_search = _compile_pattern(pattern).search if pattern else None
+    found = []
+
+    for target_database, target_schema in locations:
+        cache_key = (conn_config.get("account"), target_database, target_schema)
+        cached = _SHOW_PIPES_CACHE.get(cache_key) if use_cache else None
+        if cached and time.monotonic() - cached[0] < SHOW_PIPES_CACHE_TTL_S:
+            location_pipes = cached[1]
+        else:
+            location_pipes = _show_pipes(conn_config, target_database, target_schema)
+            if use_cache:
+                _SHOW_PIPES_CACHE[cache_key] = (time.monotonic(), location_pipes)
+
+        if pat_search is not None:
+            location_pipes = [p for p in location_pipes if pat_search(p[0])]
+        found.extend(
+            PipeRef(p_name, database=p_database, schema=p_schema)
+            for p_name, p_database, p_schema in location_pipes
+        )
+
+    status_upper = status.upper() if status else None
+
+    # Statuses are fetched only after pattern filtering to minimize
+    # SYSTEM$PIPE_STATUS calls
+    if need_status and found:
+        click.echo(f"Fetching statuses for {len(found)} pipe(s)...")
+        # Only read execution states where the filter allows; pipes it
+        # filters out come back as UNKNOWN and fail the check below
+        status_filter = None
+        if status_upper and status_upper not in _CLIENT_ONLY_STATES:
+            status_filter = status
+        status_map = _fetch_pipe_statuses(
+            conn_config, found, status_filter=status_filter
+        )
+        for pipe in found:
+            pipe.state = status_map.get(pipe.full_name, "UNKNOWN")
+
+    if status_upper:
+        found = [pipe for pipe in found if pipe.state.upper() == status_upper]
+
+    return found
+
+
 def list_pipes_command(
     ctx,
     pattern: Optional[str] = None,
@@ -93,84 +379,35 @@ def list_pipes_command(
     conn_config = get_merged_connection_config(settings, cli_overrides)
 
     try:
-        target_schema_spec = (
-            schema or conn_config.get("schema") or conn_config.get("schema_name")
-        )
+        target_schema_spec = schema or conn_config.get("schema")
         config_database = conn_config.get("database")
 
-        # Pre-filter pipes by pattern to minimize SYSTEM$PIPE_STATUS calls
-        pipes_to_check = []
-        for target_database, target_schema in parse_schema_specs(
-            target_schema_spec, config_database
-        ):
-            query = "SHOW PIPES" + build_schema_query_suffix(
-                target_database, target_schema
-            )
-
-            click.echo(
-                f"Fetching pipes{location_label(target_database, target_schema)}..."
-            )
-
-            cursor = ConnectionManager.execute(query, conn_config=conn_config)
-
-            # Helper to find column index case-insensitively
-            col_map = {c[0].upper(): i for i, c in enumerate(cursor.description)}
-            name_idx = col_map.get("NAME")
-            database_idx = col_map.get("DATABASE_NAME")
-            schema_idx = col_map.get("SCHEMA_NAME")
-
-            if name_idx is None:
-                click.echo(
-                    f"{Fore.RED}Error: Could not find 'name' column in SHOW PIPES result.{Style.RESET_ALL}",
-                    err=True,
-                )
-                cursor.close()
-                return
-
-            rows = cursor.fetchall()
-            cursor.close()
-
-            for row in rows:
-                p_name = row[name_idx]
-                p_database = (
-                    row[database_idx] if database_idx is not None else target_database
-                )
-                p_schema = row[schema_idx] if schema_idx is not None else target_schema
-
-                if pattern and not re.search(pattern, p_name):
-                    continue
-
-                pipes_to_check.append((p_name, p_database, p_schema))
+        pipes_to_check = _enumerate_pipes(
+            conn_config,
+            parse_schema_specs(target_schema_spec, config_database),
+            pattern,
+            use_cache=not ctx.obj.get("no_cache"),
+            status=status,
+        )
 
         if not pipes_to_check:
-            click.echo("No pipes found.")
+            if status:
+                click.echo(f"No pipes found matching status '{status}'.")
+            else:
+                click.echo("No pipes found.")
             return
 
-        click.echo(f"Fetching detailed status for {len(pipes_to_check)} pipe(s)...")
-        status_map = _fetch_pipe_statuses(conn_config, pipes_to_check)
-
-        # Filter by status and display
-        filtered_count = 0
+        # Display (already filtered by status)
         click.echo("-" * 60)
 
-        for p_name, p_database, p_schema in pipes_to_check:
-            p_state = status_map.get(p_name, "UNKNOWN")
-
-            # Apply status filter (case-insensitive)
-            if status and p_state.upper() != status.upper():
-                continue
-
-            filtered_count += 1
-            state_color = _get_status_color(p_state)
+        for pipe in pipes_to_check:
+            state_color = _get_status_color(pipe.state)
 
-            display_name = f"{p_schema}.{p_name}"
+            display_name = f"{pipe.schema}.{pipe.name}"
             # Ensure proper padding for alignment could be added here, but simple format for now:
-            click.echo(f"{display_name}: {state_color}{p_state}{Style.RESET_ALL}")
+            click.echo(f"{display_name}: {state_color}{pipe.state}{Style.RESET_ALL}")
 
-        if filtered_count == 0 and status:
-            click.echo(f"No pipes found matching status '{status}'.")
-        else:
-            click.echo(f"\nTotal displayed: {filtered_count}")
+        click.echo(f"\nTotal displayed: {len(pipes_to_check)}")
 
     except Exception as e:
         click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}", err=True)
@@ -193,9 +430,7 @@ def _process_pipes(
     conn_config = get_merged_connection_config(settings, cli_overrides)
 
     try:
-        target_schema_spec = (
-            schema or conn_config.get("schema") or conn_config.get("schema_name")
-        )
+        target_schema_spec = schema or conn_config.get("schema")
         config_database = conn_config.get("database")
 
         target_locations = parse_schema_specs(target_schema_spec, config_database)
@@ -206,104 +441,38 @@ def _process_pipes(
             # Single pipe specified
             # For single pipe, we might need to fetch status if filtering by status is requested
             # or simply to display it.
-            # However, p_state isn't known until we query.
+            # However, pipe.state isn't known until we query.
             # If plain pipe_name is given, we assume user wants to act on it regardless of current state
             # UNLESS status filter is provided.
 
-            # Parse possible schema in name
-            p_n = pipe_name
-            p_d = None
-            p_s = None
-            pipe_locations = target_locations
-            if "." in p_n:
-                parts = p_n.split(".")
-                if len(parts) == 3:
-                    p_d, p_s, p_n = parts
-                    pipe_locations = [(p_d, p_s)]
-                elif len(parts) == 2:
-                    p_s, p_n = parts
-                    pipe_locations = [(config_database, p_s)]
+            p_n, pipe_locations = _split_pipe_name(
+                pipe_name, target_locations, config_database
+            )
 
             for pipe_database, pipe_schema in pipe_locations:
+                pipe = PipeRef(p_n, database=pipe_database, schema=pipe_schema)
                 # If status filter is applied, we MUST fetch status first.
-                current_state = "UNKNOWN"
                 if status:
-                    status_map = _fetch_pipe_statuses(
-                        conn_config, [(p_n, pipe_database, pipe_schema)]
-                    )
-                    current_state = status_map.get(p_n, "UNKNOWN")
+                    status_map = _fetch_pipe_statuses(conn_config, [pipe])
+                    pipe.state = status_map.get(pipe.full_name, "UNKNOWN")
 
-                    if current_state.upper() != status.upper():
+                    if pipe.state.upper() != status.upper():
                         click.echo(
-                            f"Pipe {pipe_name} has status {current_state}, skipping (requested {status})"
+                            f"Pipe {pipe_name} has status {pipe.state}, skipping (requested {status})"
                         )
                         continue
 
-                pipes_to_process.append(
-                    (p_n, current_state, pipe_database, pipe_schema)
-                )
+                pipes_to_process.append(pipe)
 
         elif pattern:
-            # Pattern-based filtering
-            for target_database, target_schema in target_locations:
-                query = "SHOW PIPES" + build_schema_query_suffix(
-                    target_database, target_schema
-                )
-
-                click.echo(
-                    f"Fetching pipes{location_label(target_database, target_schema)}..."
-                )
-                cursor = ConnectionManager.execute(query, conn_config=conn_config)
-
-                # Helper to find column index case-insensitively
-                col_map = {c[0].upper(): i for i, c in enumerate(cursor.description)}
-                name_idx = col_map.get("NAME")
-                database_idx = col_map.get("DATABASE_NAME")
-                schema_idx = col_map.get("SCHEMA_NAME")
-
-                if name_idx is None:
-                    click.echo(
-                        f"{Fore.RED}Error: Could not find 'name' column in SHOW PIPES result.{Style.RESET_ALL}",
-                        err=True,
-                    )
-                    cursor.close()
-                    return
-
-                rows = cursor.fetchall()
-                cursor.close()
-
-                # First filter by pattern
-                candidates = []
-                for row in rows:
-                    p_name = row[name_idx]
-                    p_database = (
-                        row[database_idx]
-                        if database_idx is not None
-                        else target_database
-                    )
-                    p_schema = (
-                        row[schema_idx] if schema_idx is not None else target_schema
-                    )
-
-                    if not re.search(pattern, p_name):
-                        continue
-                    candidates.append((p_name, p_database, p_schema))
-
-                if not candidates:
-                    continue
-
-                # Now fetch statuses for candidates
-                click.echo(f"Fetching statuses for {len(candidates)} pipes...")
-                status_map = _fetch_pipe_statuses(conn_config, candidates)
-
-                for p_name, p_database, p_schema in candidates:
-                    p_state = status_map.get(p_name, "UNKNOWN")
-
-                    # Apply status filter (case-insensitive)
-                    if status and p_state.upper() != status.upper():
-                        continue
-
-                    pipes_to_process.append((p_name, p_state, p_database, p_schema))
+            # Pattern-based filtering, then by status (case-insensitive)
+            pipes_to_process = _enumerate_pipes(
+                conn_config,
+                target_locations,
+                pattern,
+                use_cache=not ctx.obj.get("no_cache"),
+                status=status,
+            )
 
         if not pipes_to_process:
             click.echo("No pipes found to process.")
@@ -312,16 +481,10 @@ def _process_pipes(
         # Display pipes before confirmation (for pattern-based operations)
         if pattern:
             click.echo(f"\nFound {len(pipes_to_process)} pipe(s) to {action}:")
-            for pipe_info in pipes_to_process:
-                p_name = pipe_info[0] if isinstance(pipe_info, tuple) else pipe_info
-                p_state = (
-                    pipe_info[1]
-                    if isinstance(pipe_info, tuple) and len(pipe_info) > 1
-                    else "UNKNOWN"
-                )
-                state_color = _get_status_color(p_state)
+            for pipe in pipes_to_process:
+                state_color = _get_status_color(pipe.state)
                 click.echo(
-                    f"  - {Fore.CYAN}{p_name}{Style.RESET_ALL} (Status: {state_color}{p_state}{Style.RESET_ALL})"
+                    f"  - {Fore.CYAN}{pipe.name}{Style.RESET_ALL} (Status: {state_color}{pipe.state}{Style.RESET_ALL})"
                 )
 
             if not click.confirm(
@@ -330,29 +493,11 @@ def _process_pipes(
                 click.echo("Operation cancelled.")
                 return
 
-        for pipe_info in pipes_to_process:
-            # Handle both tuple (name, state, database, schema) and string (name only) formats
-            if isinstance(pipe_info, tuple):
-                p_name = pipe_info[0]
-                p_database = pipe_info[2] if len(pipe_info) > 2 else None
-                p_schema = pipe_info[3] if len(pipe_info) > 3 else None
-            else:
-                p_name = pipe_info
-                p_database = None
-                p_schema = None
+        for pipe in pipes_to_process:
+            p_name = pipe.name
+            full_pipe_name = pipe.full_name
 
             try:
-                # Build fully qualified pipe name
-                pipe_schema = p_schema
-                pipe_database = p_database
-
-                if pipe_database and pipe_schema:
-                    full_pipe_name = f"{pipe_database}.{pipe_schema}.{p_name}"
-                elif pipe_schema:
-                    full_pipe_name = f"{pipe_schema}.{p_name}"
-                else:
-                    full_pipe_name = p_name
-
                 # Build action-specific SQL
                 if action == "REFRESH":
                     query = f"ALTER PIPE {full_pipe_name} REFRESH"
@@ -434,9 +579,7 @@ def drop_recreate_pipe_command(
     conn_config = get_merged_connection_config(settings, cli_overrides)
 
     try:
-        target_schema_spec = (
-            schema or conn_config.get("schema") or conn_config.get("schema_name")
-        )
+        target_schema_spec = schema or conn_config.get("schema")
         config_database = conn_config.get("database")
 
         target_locations = parse_schema_specs(target_schema_spec, config_database)
@@ -446,112 +589,38 @@ def drop_recreate_pipe_command(
         if pipe_name:
             # Single pipe specified
 
-            # Parse possible schema in name
-            p_n = pipe_name
-            p_d = None
-            p_s = None
-            pipe_locations = target_locations
-            if "." in p_n:
-                parts = p_n.split(".")
-                if len(parts) == 3:
-                    p_d, p_s, p_n = parts
-                    pipe_locations = [(p_d, p_s)]
-                elif len(parts) == 2:
-                    p_s, p_n = parts
-                    pipe_locations = [(config_database, p_s)]
+            p_n, pipe_locations = _split_pipe_name(
+                pipe_name, target_locations, config_database
+            )
 
             for pipe_database, pipe_schema in pipe_locations:
-                current_state = "UNKNOWN"
+                pipe = PipeRef(p_n, database=pipe_database, schema=pipe_schema)
+                # The single-pipe confirmation never shows the state, so only
+                # fetch it when a --status filter needs it
                 if status and not skip_status:
-                    status_map = _fetch_pipe_statuses(
-                        conn_config, [(p_n, pipe_database, pipe_schema)]
-                    )
-                    current_state = status_map.get(p_n, "UNKNOWN")
+                    status_map = _fetch_pipe_statuses(conn_config, [pipe])
+                    pipe.state = status_map.get(pipe.full_name, "UNKNOWN")
 
-                    if current_state.upper() != status.upper():
+                    if pipe.state.upper() != status.upper():
                         click.echo(
-                            f"Pipe {pipe_name} has status {current_state}, skipping (requested {status})"
+                            f"Pipe {pipe_name} has status {pipe.state}, skipping (requested {status})"
                         )
                         continue
-                elif not skip_status:
-                    # Fetch status just for display if not skipping
-                    status_map = _fetch_pipe_statuses(
-                        conn_config, [(p_n, pipe_database, pipe_schema)]
-                    )
-                    current_state = status_map.get(p_n, "UNKNOWN")
 
-                pipes_to_process.append(
-                    (p_n, current_state, pipe_database, pipe_schema)
-                )
+                pipes_to_process.append(pipe)
 
         elif pattern or all_flag:
-            # Pattern-based or all pipes
-            for target_database, target_schema in target_locations:
-                query = "SHOW PIPES" + build_schema_query_suffix(
-                    target_database, target_schema
-                )
-
-                click.echo(
-                    f"Fetching pipes{location_label(target_database, target_schema)}..."
-                )
-                cursor = ConnectionManager.execute(query, conn_config=conn_config)
-
-                col_map = {c[0].upper(): i for i, c in enumerate(cursor.description)}
-                name_idx = col_map.get("NAME")
-                database_idx = col_map.get("DATABASE_NAME")
-                schema_idx = col_map.get("SCHEMA_NAME")
-
-                if name_idx is None:
-                    click.echo(
-                        f"{Fore.RED}Error: Could not find 'name' column in SHOW PIPES result.{Style.RESET_ALL}",
-                        err=True,
-                    )
-                    cursor.close()
-                    return
-
-                rows = cursor.fetchall()
-                cursor.close()
-
-                # First match filtering
-                candidates = []
-                for row in rows:
-                    p_name = row[name_idx]
-                    p_database = (
-                        row[database_idx]
-                        if database_idx is not None
-                        else target_database
-                    )
-                    p_schema = (
-                        row[schema_idx] if schema_idx is not None else target_schema
-                    )
-
-                    # Apply pattern filter if provided
-                    if pattern and not re.search(pattern, p_name):
-                        continue
-
-                    candidates.append((p_name, p_database, p_schema))
-
-                if not candidates:
-                    continue
-
-                # Fetch detailed statuses unless skipped
-                status_map = {}
-                if not skip_status:
-                    click.echo(f"Fetching statuses for {len(candidates)} pipes...")
-                    status_map = _fetch_pipe_statuses(conn_config, candidates)
-
-                for p_name, p_database, p_schema in candidates:
-                    p_state = status_map.get(p_name, "UNKNOWN")
-
-                    # Apply status filter (case-insensitive)
-                    # Note: if skip_status is True, p_state is UNKNOWN.
-                    # If user filters by status AND uses --skip-status, effectively no pipes will match
-                    # unless they filter for UNKNOWN (which is unlikely what they want).
-                    # We should probably warn or error if both are used, but for now we follow logic.
-                    if status and p_state.upper() != status.upper():
-                        continue
-
-                    pipes_to_process.append((p_name, p_state, p_database, p_schema))
+            # Pattern-based or all pipes. Note: if skip_status is True, every
+            # pipe.state is UNKNOWN, so a --status filter other than UNKNOWN
+            # matches nothing.
+            pipes_to_process = _enumerate_pipes(
+                conn_config,
+                target_locations,
+                pattern,
+                need_status=not skip_status,
+                use_cache=not ctx.obj.get("no_cache"),
+                status=status,
+            )
 
         if not pipes_to_process:
             click.echo("No pipes found to process.")
@@ -560,16 +629,10 @@ def drop_recreate_pipe_command(
         # Display pipes before confirmation
         if pattern or all_flag:
             click.echo(f"\nFound {len(pipes_to_process)} pipe(s) to drop and recreate:")
-            for pipe_info in pipes_to_process:
-                p_name = pipe_info[0] if isinstance(pipe_info, tuple) else pipe_info
-                p_state = (
-                    pipe_info[1]
-                    if isinstance(pipe_info, tuple) and len(pipe_info) > 1
-                    else "UNKNOWN"
-                )
-                state_color = _get_status_color(p_state)
+            for pipe in pipes_to_process:
+                state_color = _get_status_color(pipe.state)
                 click.echo(
-                    f"  - {Fore.CYAN}{p_name}{Style.RESET_ALL} (Status: {state_color}{p_state}{Style.RESET_ALL})"
+                    f"  - {Fore.CYAN}{pipe.name}{Style.RESET_ALL} (Status: {state_color}{pipe.state}{Style.RESET_ALL})"
                 )
 
             if not click.confirm(
@@ -585,41 +648,25 @@ def drop_recreate_pipe_command(
                 click.echo("Operation cancelled.")
                 return
 
-        for pipe_info in pipes_to_process:
-            # Handle both tuple (name, state, database, schema) and string (name only) formats
-            if isinstance(pipe_info, tuple):
-                p_name = pipe_info[0]
-                p_database = pipe_info[2] if len(pipe_info) > 2 else None
-                p_schema = pipe_info[3] if len(pipe_info) > 3 else None
-            else:
-                p_name = pipe_info
-                p_database = None
-                p_schema = None
-
-                # Parse schema/database from string input if present
-                if "." in p_name:
-                    parts = p_name.split(".")
-                    if len(parts) == 3:
-                        p_database, p_schema, p_name = parts
-                    elif len(parts) == 2:
-                        p_schema, p_name = parts
+        # Group pipes by schema so USE SCHEMA is only issued when the
+        # context actually changes
+        pipes_to_process.sort(key=lambda p: (p.database or "", p.schema or ""))
+        current_context = None
 
-            try:
-                # Build fully qualified pipe name
-                pipe_schema = p_schema
-                pipe_database = p_database
-
-                if pipe_database and pipe_schema:
-                    full_pipe_name = f"{pipe_database}.{pipe_schema}.{p_name}"
-                elif pipe_schema:
-                    full_pipe_name = f"{pipe_schema}.{p_name}"
-                else:
-                    full_pipe_name = p_name
+        # Cached SHOW PIPES results for these locations are about to go
+        # stale, even if a pipe below fails part way through
+        _forget_show_pipes(conn_config, pipes_to_process)
+
+        for pipe in pipes_to_process:
+            p_name = pipe.name
+            full_pipe_name = pipe.full_name
 
+            try:
                 # 1. Get DDL
                 click.echo(f"Fetching DDL for pipe {p_name}...")
-                ddl_query = f"SELECT GET_DDL('pipe', '{full_pipe_name}')"
-                cursor = ConnectionManager.execute(ddl_query, conn_config=conn_config)
+                cursor = ConnectionManager.execute(
+                    PIPE_DDL_QUERY, (full_pipe_name,), conn_config=conn_config
+                )
                 res = cursor.fetchone()
                 cursor.close()
 
@@ -630,26 +677,31 @@ def drop_recreate_pipe_command(
                 if not ddl:
                     raise click.ClickException(f"Empty DDL returned for pipe {p_name}")
 
-                # 2. Drop Pipe
+                # 2. Drop and recreate in one multi-statement round-trip.
+                # DDL from GET_DDL often lacks fully qualified names, so the
+                # schema context is set first to recreate in the right place.
+                statements = []
+                if pipe.database and pipe.schema:
+                    if (pipe.database, pipe.schema) != current_context:
+                        use_query = f"USE SCHEMA {pipe.database}.{pipe.schema}"
+                        click.echo(f"Setting context: {use_query}")
+                        statements.append(use_query)
+
                 drop_query = f"DROP PIPE {full_pipe_name}"
                 click.echo(f"Executing: {drop_query}")
-                cursor = ConnectionManager.execute(drop_query, conn_config=conn_config)
-                cursor.close()
-
-                # 3. Recreate Pipe
-                # DDL from GET_DDL often lacks fully qualified names.
-                # Must set context to ensure creation happens in correct schema.
-                if pipe_database and pipe_schema:
-                    use_query = f"USE SCHEMA {pipe_database}.{pipe_schema}"
-                    click.echo(f"Setting context: {use_query}")
-                    cursor = ConnectionManager.execute(
-                        use_query, conn_config=conn_config
-                    )
-                    cursor.close()
+                statements.append(drop_query)
 
                 click.echo(f"Recreating pipe {p_name}...")
-                cursor = ConnectionManager.execute(ddl, conn_config=conn_config)
+                statements.append(ddl.strip().rstrip(";"))
+
+                cursor = ConnectionManager.execute(
+                    ";\n".join(statements),
+                    conn_config=conn_config,
+                    num_statements=len(statements),
+                )
                 cursor.close()
+                if pipe.database and pipe.schema:
+                    current_context = (pipe.database, pipe.schema)
                 click.echo(
                     f"{Fore.GREEN}Successfully recreated pipe: {p_name}{Style.RESET_ALL}"
                 )
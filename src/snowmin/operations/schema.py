@@ -12,8 +12,8 @@ def parse_schema_spec(schema_spec: Optional[str], config_database: Optional[str]
     if not schema_spec:
         return config_database, None
 
-    if "." in schema_spec:
-        database, schema = schema_spec.split(".", 1)
+    database, sep, schema = schema_spec.partition(".")
+    if sep:
         return database, schema
 
     return config_database, schema_spec
@@ -109,9 +109,7 @@ def list_streams_command(
     conn_config = get_merged_connection_config(settings, cli_overrides)
 
     try:
-        target_schema_spec = (
-            schema or conn_config.get("schema") or conn_config.get("schema_name")
-        )
+        target_schema_spec = schema or conn_config.get("schema")
         config_database = conn_config.get("database")
 
         # Apply basic filters first
@@ -232,9 +230,7 @@ def create_stream_command(
     conn_config = get_merged_connection_config(settings, cli_overrides)
 
     try:
-        target_schema_spec = (
-            schema or conn_config.get("schema") or conn_config.get("schema_name")
-        )
+        target_schema_spec = schema or conn_config.get("schema")
         config_database = conn_config.get("database")
 
         current_owner_role = None
@@ -332,9 +328,7 @@ def drop_stream_command(
     conn_config = get_merged_connection_config(settings, cli_overrides)
 
     try:
-        target_schema_spec = (
-            schema or conn_config.get("schema") or conn_config.get("schema_name")
-        )
+        target_schema_spec = schema or conn_config.get("schema")
         config_database = conn_config.get("database")
 
         streams_to_drop = []
@@ -393,9 +387,7 @@ def reset_stream_command(
     conn_config = get_merged_connection_config(settings, cli_overrides)
 
     try:
-        target_schema_spec = (
-            schema or conn_config.get("schema") or conn_config.get("schema_name")
-        )
+        target_schema_spec = schema or conn_config.get("schema")
         config_database = conn_config.get("database")
 
         streams_to_process = []
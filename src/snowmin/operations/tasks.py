@@ -1,18 +1,51 @@
 """Task management operations for Snowflake"""
 
+import functools
 import json
 import re
 import click
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 from colorama import Fore, Style
 from snowmin.core.connection import ConnectionManager
 from snowmin.core.config import get_merged_connection_config
+from snowmin.core.sql import quote_literal
 from snowmin.operations.schema import (
     build_schema_query_suffix,
     location_label,
+    parse_schema_spec,
     parse_schema_specs,
 )
 
+# Characters that make a --pattern more than a plain substring, plus the
+# quote that would end a SHOW ... LIKE string literal
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]|()\\'")
+
+# Names that can appear unquoted in SQL; others are quoted by _sql_identifier
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_$]*\Z")
+
+# Statements run concurrently when they are sent one at a time
+ALTER_MAX_WORKERS = 8
+
+# Rows fetched per round-trip when streaming SHOW TASKS results
+SHOW_TASKS_FETCH_SIZE = 1000
+
+# Narrows the preceding SHOW TASKS result to the columns list_tasks prints
+_LIST_TASKS_COLUMNS_QUERY = (
+    'SELECT "name", "state", "database_name", "schema_name"'
+    " FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))"
+)
+
+# SHOW TASKS columns read by this module, in _show_tasks_indices order
+_SHOW_TASKS_COLUMNS = (
+    "NAME",
+    "STATE",
+    "DATABASE_NAME",
+    "SCHEMA_NAME",
+    "PREDECESSORS",
+    "TASK_RELATIONS",
+)
+
 
 def _desired_state_for_action(action: str) -> str:
     """Return the only state a task should be in before applying action."""
@@ -86,16 +119,63 @@ def _relation_value(relations: dict[str, Any], name: str):
     return None
 
 
+def _show_tasks_query(target_database, target_schema, like: Optional[str] = None):
+    """Build SHOW TASKS [LIKE '<like>'] scoped to a database or schema."""
+    like_clause = f" LIKE '{like}'" if like else ""
+    return (
+        "SHOW TASKS"
+        + like_clause
+        + build_schema_query_suffix(target_database, target_schema)
+    )
+
+
+def _show_tasks_indices(description):
+    """
+    Indexes of the SHOW TASKS columns we read (see _SHOW_TASKS_COLUMNS), or
+    None for missing ones, looked up case-insensitively.
+    """
+    return _indices_for_layout(tuple(c[0] for c in description))
+
+
+@functools.lru_cache(maxsize=16)
+def _indices_for_layout(column_names):
+    col_map = {name.upper(): i for i, name in enumerate(column_names)}
+    return tuple(col_map.get(column) for column in _SHOW_TASKS_COLUMNS)
+
+
+def _iter_rows(cursor):
+    """
+    Yield cursor rows, fetching SHOW_TASKS_FETCH_SIZE rows per round-trip,
+    and close the cursor once they are exhausted.
+    """
+    try:
+        cursor.arraysize = SHOW_TASKS_FETCH_SIZE
+        while rows := cursor.fetchmany(SHOW_TASKS_FETCH_SIZE):
+            yield from rows
+    finally:
+        cursor.close()
+
+
+def _sql_identifier(part: str) -> str:
+    """
+    Return a name part as usable SQL: plain identifiers (and ones that are
+    already quoted) as-is, anything else double-quoted so it cannot break
+    out of the statement.
+    """
+    if _IDENTIFIER_RE.match(part) or (len(part) > 1 and part[0] == part[-1] == '"'):
+        return part
+    return '"' + part.replace('"', '""') + '"'
+
+
 def _full_task_name(t_name, t_database, t_schema, target_database, target_schema):
     """Build a fully qualified task name from SHOW TASKS metadata when available."""
     task_schema = t_schema or target_schema
     task_database = t_database or target_database
 
+    parts = [task_schema, t_name] if task_schema else [t_name]
     if task_database and task_schema:
-        return f"{task_database}.{task_schema}.{t_name}"
-    if task_schema:
-        return f"{task_schema}.{t_name}"
-    return t_name
+        parts.insert(0, task_database)
+    return ".".join(map(_sql_identifier, parts))
 
 
 def _task_key(task_name: str) -> str:
@@ -161,21 +241,19 @@ def _build_task_info(
 def _load_discovered_tasks(query, conn_config, target_database, target_schema):
     """Load normalized task metadata from a SHOW TASKS query."""
     cursor = ConnectionManager.execute(query, conn_config=conn_config)
-    col_map = {c[0].upper(): i for i, c in enumerate(cursor.description)}
-    name_idx = col_map.get("NAME")
-    state_idx = col_map.get("STATE")
-    database_idx = col_map.get("DATABASE_NAME")
-    schema_idx = col_map.get("SCHEMA_NAME")
-    predecessors_idx = col_map.get("PREDECESSORS")
-    task_relations_idx = col_map.get("TASK_RELATIONS")
+    (
+        name_idx,
+        state_idx,
+        database_idx,
+        schema_idx,
+        predecessors_idx,
+        task_relations_idx,
+    ) = _show_tasks_indices(cursor.description)
 
     if name_idx is None:
         cursor.close()
         raise click.ClickException("Could not find 'name' column in SHOW TASKS result.")
 
-    rows = cursor.fetchall()
-    cursor.close()
-
     return [
         _build_task_info(
             row,
@@ -188,7 +266,7 @@ def _load_discovered_tasks(query, conn_config, target_database, target_schema):
             target_database,
             target_schema,
         )
-        for row in rows
+        for row in _iter_rows(cursor)
     ]
 
 
@@ -350,7 +428,7 @@ def _plan_resume_statements(tasks_to_process, discovered_tasks):
                     "task": task_info,
                     "queries": [
                         f"ALTER TASK {root_name} SUSPEND",
-                        f"SELECT SYSTEM$TASK_DEPENDENTS_ENABLE('{root_name}')",
+                        f"SELECT SYSTEM$TASK_DEPENDENTS_ENABLE({quote_literal(root_name)})",
                     ],
                     "kind": "graph",
                     "display_name": root_name,
@@ -360,6 +438,62 @@ def _plan_resume_statements(tasks_to_process, discovered_tasks):
     return statements
 
 
+def _is_plain_literal(pattern: str) -> bool:
+    """Whether a --pattern regex is just a substring that is safe in a LIKE."""
+    return _REGEX_METACHARACTERS.isdisjoint(pattern)
+
+
+def _execute_batch(queries, conn_config) -> tuple[int, Optional[Exception]]:
+    """Run queries as one multi-statement request.
+
+    Returns how many queries completed and the error that stopped the batch
+    (None if every query ran). Snowflake stops at the first failing statement.
+    """
+    completed = 0
+    try:
+        cursor = ConnectionManager.execute(
+            ";\n".join(queries),
+            conn_config=conn_config,
+            num_statements=len(queries),
+        )
+        completed = 1
+        try:
+            # Later statements' errors surface while stepping through results
+            while cursor.nextset():
+                completed += 1
+        finally:
+            cursor.close()
+    except Exception as e:
+        return completed, e
+    return completed, None
+
+
+def _run_statement(statement, conn_config):
+    """Run one planned statement's queries in order."""
+    for query in statement["queries"]:
+        cursor = ConnectionManager.execute(query, conn_config=conn_config)
+        cursor.close()
+
+
+def _echo_statement_success(statement, action: str):
+    """Report a planned statement as applied."""
+    if statement["kind"] == "graph":
+        click.echo(
+            f"{Fore.GREEN}Successfully resumed task graph rooted at: "
+            f"{statement['display_name']}{Style.RESET_ALL}"
+        )
+    elif statement["kind"] == "graph-root":
+        click.echo(
+            f"{Fore.GREEN}Successfully suspended task graph root: "
+            f"{statement['display_name']}{Style.RESET_ALL}"
+        )
+    else:
+        click.echo(
+            f"{Fore.GREEN}Successfully {_action_past_tense(action)} task: "
+            f"{statement['task']['name']}{Style.RESET_ALL}"
+        )
+
+
 def list_tasks_command(
     ctx,
     pattern: Optional[str] = None,
@@ -372,48 +506,39 @@ def list_tasks_command(
     conn_config = get_merged_connection_config(settings, cli_overrides)
 
     try:
-        target_schema_spec = (
-            schema or conn_config.get("schema") or conn_config.get("schema_name")
-        )
+        target_schema_spec = schema or conn_config.get("schema")
         config_database = conn_config.get("database")
 
         filtered = []
+        # A regex-free pattern is a plain substring: let SHOW TASKS LIKE
+        # prune rows server-side and check the exact (case-sensitive) match
+        # with `in`. Anything else is compiled once up front; an invalid
+        # regex is reported like any other error below.
+        literal = pattern if pattern and _is_plain_literal(pattern) else None
+        compiled = re.compile(pattern) if pattern and not literal else None
         for target_database, target_schema in parse_schema_specs(
             target_schema_spec, config_database
         ):
-            query = "SHOW TASKS" + build_schema_query_suffix(
-                target_database, target_schema
+            query = _show_tasks_query(
+                target_database, target_schema, like=f"%{literal}%" if literal else None
             )
 
             click.echo(
                 f"Fetching tasks{location_label(target_database, target_schema)}..."
             )
 
-            cursor = ConnectionManager.execute(query, conn_config=conn_config)
-
-            # Helper to find column index case-insensitively
-            col_map = {c[0].upper(): i for i, c in enumerate(cursor.description)}
-            name_idx = col_map.get("NAME")
-            state_idx = col_map.get("STATE")
-            schema_idx = col_map.get("SCHEMA_NAME")
-
-            if name_idx is None:
-                click.echo(
-                    f"{Fore.RED}Error: Could not find 'name' column in SHOW TASKS result.{Style.RESET_ALL}",
-                    err=True,
-                )
-                cursor.close()
-                return
-
-            rows = cursor.fetchall()
-            cursor.close()
-
-            for row in rows:
-                t_name = row[name_idx]
-                t_state = row[state_idx] if state_idx is not None else "UNKNOWN"
-                t_schema = row[schema_idx] if schema_idx is not None else "UNKNOWN"
+            # Only (name, state, database_name, schema_name) cross the wire
+            cursor = ConnectionManager.execute(
+                f"{query};\n{_LIST_TASKS_COLUMNS_QUERY}",
+                conn_config=conn_config,
+                num_statements=2,
+            )
+            cursor.nextset()
 
-                if pattern and not re.search(pattern, t_name):
+            for t_name, t_state, _, t_schema in _iter_rows(cursor):
+                if literal and literal not in t_name:
+                    continue
+                if compiled and not compiled.search(t_name):
                     continue
                 if status and t_state.lower() != status.lower():
                     continue
@@ -424,12 +549,13 @@ def list_tasks_command(
             click.echo("No tasks found.")
             return
 
-        click.echo(f"\nFound {len(filtered)} task(s):")
-        click.echo("-" * 60)
-
+        green, yellow, reset = Fore.GREEN, Fore.YELLOW, Style.RESET_ALL
+        lines = [f"\nFound {len(filtered)} task(s):", "-" * 60]
         for t_schema, t_name, t_state in filtered:
-            state_color = Fore.GREEN if t_state == "started" else Fore.YELLOW
-            click.echo(f"{t_schema}.{t_name}: {state_color}{t_state}{Style.RESET_ALL}")
+            state_color = green if t_state == "started" else yellow
+            lines.append(f"{t_schema}.{t_name}: {state_color}{t_state}{reset}")
+        # One write for the whole listing rather than one per task
+        click.echo("\n".join(lines))
 
     except Exception as e:
         click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}", err=True)
@@ -452,42 +578,37 @@ def _process_tasks(
     conn_config = get_merged_connection_config(settings, cli_overrides)
 
     try:
-        target_schema_spec = (
-            schema or conn_config.get("schema") or conn_config.get("schema_name")
-        )
+        target_schema_spec = schema or conn_config.get("schema")
         config_database = conn_config.get("database")
 
-        target_locations = parse_schema_specs(target_schema_spec, config_database)
-
         tasks_to_process = []
         discovered_tasks = []
 
         desired_state = _desired_state_for_action(action)
 
         if task_name:
-            lookup_name = task_name
-            lookup_locations = target_locations
-            if "." in lookup_name:
-                parts = lookup_name.split(".")
-                if len(parts) == 3:
-                    lookup_database, lookup_schema, lookup_name = parts
-                    lookup_locations = [(lookup_database, lookup_schema)]
-                elif len(parts) == 2:
-                    lookup_schema, lookup_name = parts
-                    lookup_locations = [(config_database, lookup_schema)]
+            # A qualified name ([database.]schema.task) overrides --schema,
+            # so the schema list is only parsed for bare names
+            qualifier, sep, lookup_name = task_name.rpartition(".")
+            lookup_locations = (
+                [parse_schema_spec(qualifier, config_database)]
+                if sep
+                else parse_schema_specs(target_schema_spec, config_database)
+            )
 
             for lookup_database, lookup_schema in lookup_locations:
-                query = f"SHOW TASKS LIKE '{lookup_name}'" + build_schema_query_suffix(
-                    lookup_database, lookup_schema
+                query = _show_tasks_query(
+                    lookup_database, lookup_schema, like=lookup_name
                 )
                 cursor = ConnectionManager.execute(query, conn_config=conn_config)
-                col_map = {c[0].upper(): i for i, c in enumerate(cursor.description)}
-                name_idx = col_map.get("NAME")
-                state_idx = col_map.get("STATE")
-                database_idx = col_map.get("DATABASE_NAME")
-                schema_idx = col_map.get("SCHEMA_NAME")
-                predecessors_idx = col_map.get("PREDECESSORS")
-                task_relations_idx = col_map.get("TASK_RELATIONS")
+                (
+                    name_idx,
+                    state_idx,
+                    database_idx,
+                    schema_idx,
+                    predecessors_idx,
+                    task_relations_idx,
+                ) = _show_tasks_indices(cursor.description)
                 rows = cursor.fetchall()
                 cursor.close()
 
@@ -529,7 +650,7 @@ def _process_tasks(
                     and task_info["database"]
                     and task_info["schema"]
                 ):
-                    graph_query = "SHOW TASKS" + build_schema_query_suffix(
+                    graph_query = _show_tasks_query(
                         task_info["database"], task_info["schema"]
                     )
                     discovered_tasks.extend(
@@ -544,24 +665,25 @@ def _process_tasks(
                 click.echo(f"No task found matching {task_name}.")
                 return
         elif all_flag or pattern:
-            for target_database, target_schema in target_locations:
-                query = "SHOW TASKS" + build_schema_query_suffix(
-                    target_database, target_schema
-                )
+            compiled = re.compile(pattern) if pattern else None
+            for target_database, target_schema in parse_schema_specs(
+                target_schema_spec, config_database
+            ):
+                query = _show_tasks_query(target_database, target_schema)
 
                 click.echo(
                     f"Fetching tasks{location_label(target_database, target_schema)}..."
                 )
                 cursor = ConnectionManager.execute(query, conn_config=conn_config)
 
-                # Helper to find column index case-insensitively
-                col_map = {c[0].upper(): i for i, c in enumerate(cursor.description)}
-                name_idx = col_map.get("NAME")
-                state_idx = col_map.get("STATE")
-                database_idx = col_map.get("DATABASE_NAME")
-                schema_idx = col_map.get("SCHEMA_NAME")
-                predecessors_idx = col_map.get("PREDECESSORS")
-                task_relations_idx = col_map.get("TASK_RELATIONS")
+                (
+                    name_idx,
+                    state_idx,
+                    database_idx,
+                    schema_idx,
+                    predecessors_idx,
+                    task_relations_idx,
+                ) = _show_tasks_indices(cursor.description)
 
                 if name_idx is None:
                     click.echo(
@@ -571,10 +693,7 @@ def _process_tasks(
                     cursor.close()
                     return
 
-                rows = cursor.fetchall()
-                cursor.close()
-
-                for row in rows:
+                for row in _iter_rows(cursor):
                     task_info = _build_task_info(
                         row,
                         name_idx,
@@ -590,8 +709,8 @@ def _process_tasks(
                     t_name = task_info["name"]
                     t_state = task_info["state"]
 
-                    if pattern:
-                        if re.search(pattern, t_name):
+                    if compiled:
+                        if compiled.search(t_name):
                             if str(t_state).lower() == desired_state:
                                 tasks_to_process.append(task_info)
                     else:
@@ -605,12 +724,18 @@ def _process_tasks(
         # Display tasks before confirmation
         if all_flag or pattern:
             click.echo(f"\nFound {len(tasks_to_process)} task(s) to {action}:")
+            green, yellow, cyan, reset = (
+                Fore.GREEN,
+                Fore.YELLOW,
+                Fore.CYAN,
+                Style.RESET_ALL,
+            )
             for task_info in tasks_to_process:
                 t_name = task_info["name"]
                 t_state = task_info["state"]
-                state_color = Fore.GREEN if t_state == "started" else Fore.YELLOW
+                state_color = green if t_state == "started" else yellow
                 click.echo(
-                    f"  - {Fore.CYAN}{t_name}{Style.RESET_ALL} (Status: {state_color}{t_state}{Style.RESET_ALL})"
+                    f"  - {cyan}{t_name}{reset} (Status: {state_color}{t_state}{reset})"
                 )
 
             if not click.confirm(
@@ -634,35 +759,60 @@ def _process_tasks(
                 for task_info in tasks_to_process
             ]
 
-        for statement in statements:
-            task_info = statement["task"]
-            t_name = task_info["name"]
-            try:
+        # Send every statement in one multi-statement request; if one of
+        # them fails, run it and everything after it one at a time so each
+        # remaining task gets its own success or error line
+        queries = [query for statement in statements for query in statement["queries"]]
+        if len(queries) > 1:
+            for query in queries:
+                click.echo(f"Executing: {query}")
+            completed, error = _execute_batch(queries, conn_config)
+            remaining = []
+            for statement in statements:
+                if completed >= len(statement["queries"]):
+                    completed -= len(statement["queries"])
+                    _echo_statement_success(statement, action)
+                else:
+                    remaining.append(
+                        {**statement, "queries": statement["queries"][completed:]}
+                    )
+                    completed = 0
+            if error is None:
+                return
+            click.echo(
+                f"{Fore.YELLOW}Batch failed: {error}{Style.RESET_ALL}\n"
+                "Retrying the remaining statements one at a time..."
+            )
+            statements = remaining
+
+        # Graph roots must be suspended before their children; every other
+        # statement is independent, so each phase fans out over a pool
+        phases = (
+            [st for st in statements if st["kind"] == "graph-root"],
+            [st for st in statements if st["kind"] != "graph-root"],
+        )
+        for phase in phases:
+            if not phase:
+                continue
+            for statement in phase:
                 for query in statement["queries"]:
                     click.echo(f"Executing: {query}")
-                    cursor = ConnectionManager.execute(query, conn_config=conn_config)
-                    cursor.close()
-                if statement["kind"] == "graph":
-                    click.echo(
-                        f"{Fore.GREEN}Successfully resumed task graph rooted at: "
-                        f"{statement['display_name']}{Style.RESET_ALL}"
-                    )
-                    continue
-                if statement["kind"] == "graph-root":
+            with ThreadPoolExecutor(
+                max_workers=min(ALTER_MAX_WORKERS, len(phase))
+            ) as pool:
+                futures = [
+                    pool.submit(_run_statement, statement, conn_config)
+                    for statement in phase
+                ]
+            for statement, future in zip(phase, futures):
+                try:
+                    future.result()
+                    _echo_statement_success(statement, action)
+                except Exception as e:
                     click.echo(
-                        f"{Fore.GREEN}Successfully suspended task graph root: "
-                        f"{statement['display_name']}{Style.RESET_ALL}"
+                        f"{Fore.RED}Error processing task {statement['task']['name']}: {e}{Style.RESET_ALL}",
+                        err=True,
                     )
-                    continue
-
-                click.echo(
-                    f"{Fore.GREEN}Successfully {_action_past_tense(action)} task: {t_name}{Style.RESET_ALL}"
-                )
-            except Exception as e:
-                click.echo(
-                    f"{Fore.RED}Error processing task {t_name}: {e}{Style.RESET_ALL}",
-                    err=True,
-                )
 
     except Exception as e:
         click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}", err=True)
@@ -1,6 +1,9 @@
+import sys
+from functools import cached_property
 from typing import Optional
 
 from pydantic import Field, validator
+from snowmin.core.sql import quote_literal
 from snowmin.core.state import AccountObject, Resource
 
 
@@ -24,19 +27,19 @@ class Warehouse(AccountObject):
             return v.upper()
         return v
 
-    def get_create_sql(self) -> str:
-        sql = f"CREATE WAREHOUSE {self.name}"
+    def _build_create_sql(self) -> str:
+        parts = [f"CREATE WAREHOUSE {self.name}"]
         if self.warehouse_size:
-            sql += f" WAREHOUSE_SIZE = '{self.warehouse_size}'"
+            parts.append(f"WAREHOUSE_SIZE = {quote_literal(self.warehouse_size)}")
         if self.auto_suspend is not None:
-            sql += f" AUTO_SUSPEND = {self.auto_suspend}"
+            parts.append(f"AUTO_SUSPEND = {self.auto_suspend}")
         if self.auto_resume is not None:
-            sql += f" AUTO_RESUME = {str(self.auto_resume).upper()}"
+            parts.append(f"AUTO_RESUME = {str(self.auto_resume).upper()}")
         if self.scaling_policy:
-            sql += f" SCALING_POLICY = '{self.scaling_policy}'"
+            parts.append(f"SCALING_POLICY = {quote_literal(self.scaling_policy)}")
         if self.comment:
-            sql += f" COMMENT = '{self.comment}'"
-        return sql
+            parts.append(f"COMMENT = {quote_literal(self.comment)}")
+        return " ".join(parts)
 
     def get_alter_sql(self, current_state: "Warehouse") -> str:
         changes = []
@@ -46,7 +49,7 @@ class Warehouse(AccountObject):
             # For strict declarative, we should probably set everything.
             # Assuming explicitly set values in 'self' are enforced.
             if self.warehouse_size:
-                changes.append(f"WAREHOUSE_SIZE = '{self.warehouse_size}'")
+                changes.append(f"WAREHOUSE_SIZE = {quote_literal(self.warehouse_size)}")
 
         if self.auto_suspend != current_state.auto_suspend:
             changes.append(f"AUTO_SUSPEND = {self.auto_suspend}")
@@ -55,10 +58,10 @@ class Warehouse(AccountObject):
             changes.append(f"AUTO_RESUME = {str(self.auto_resume).upper()}")
 
         if self.scaling_policy != current_state.scaling_policy:
-            changes.append(f"SCALING_POLICY = '{self.scaling_policy}'")
+            changes.append(f"SCALING_POLICY = {quote_literal(self.scaling_policy)}")
 
         if self.comment != current_state.comment:
-            changes.append(f"COMMENT = '{self.comment}'")
+            changes.append(f"COMMENT = {quote_literal(self.comment)}")
 
         if not changes:
             return ""
@@ -70,15 +73,15 @@ class Role(AccountObject):
     _snowflake_type = "role"
     comment: Optional[str] = Field(None)
 
-    def get_create_sql(self) -> str:
-        sql = f"CREATE ROLE {self.name}"
+    def _build_create_sql(self) -> str:
+        parts = [f"CREATE ROLE {self.name}"]
         if self.comment:
-            sql += f" COMMENT = '{self.comment}'"
-        return sql
+            parts.append(f"COMMENT = {quote_literal(self.comment)}")
+        return " ".join(parts)
 
     def get_alter_sql(self, current_state: "Role") -> str:
         if self.comment != current_state.comment:
-            return f"ALTER ROLE {self.name} SET COMMENT = '{self.comment}'"
+            return f"ALTER ROLE {self.name} SET COMMENT = {quote_literal(self.comment)}"
         return ""
 
 
@@ -93,23 +96,23 @@ class User(AccountObject):
     default_warehouse: Optional[str] = Field(None)
     comment: Optional[str] = Field(None)
 
-    def get_create_sql(self) -> str:
-        sql = f"CREATE USER {self.name}"
+    def _build_create_sql(self) -> str:
+        parts = [f"CREATE USER {self.name}"]
         if self.login_name:
-            sql += f" LOGIN_NAME = '{self.login_name}'"
+            parts.append(f"LOGIN_NAME = {quote_literal(self.login_name)}")
         if self.display_name:
-            sql += f" DISPLAY_NAME = '{self.display_name}'"
+            parts.append(f"DISPLAY_NAME = {quote_literal(self.display_name)}")
         if self.email:
-            sql += f" EMAIL = '{self.email}'"
+            parts.append(f"EMAIL = {quote_literal(self.email)}")
         if self.disabled:
-            sql += " DISABLED = TRUE"
+            parts.append("DISABLED = TRUE")
         if self.default_role:
-            sql += f" DEFAULT_ROLE = '{self.default_role}'"
+            parts.append(f"DEFAULT_ROLE = {quote_literal(self.default_role)}")
         if self.default_warehouse:
-            sql += f" DEFAULT_WAREHOUSE = '{self.default_warehouse}'"
+            parts.append(f"DEFAULT_WAREHOUSE = {quote_literal(self.default_warehouse)}")
         if self.comment:
-            sql += f" COMMENT = '{self.comment}'"
-        return sql
+            parts.append(f"COMMENT = {quote_literal(self.comment)}")
+        return " ".join(parts)
 
     def get_alter_sql(self, current_state: "User") -> str:
         changes = []
@@ -128,13 +131,15 @@ class Grant(Resource):
     on_name: str = Field(..., description="Name of the object")
     to_role: str = Field(..., description="Role to grant to")
 
-    @property
+    @cached_property
     def identifier(self) -> str:
         # Unique ID for a grant is tricky.
         # GRANT USAGE ON DATABASE DB1 TO ROLE R1
-        return f"GRANT.{self.privilege}.{self.on_type}.{self.on_name}.TO.{self.to_role}".upper()
+        return sys.intern(
+            f"GRANT.{self.privilege}.{self.on_type}.{self.on_name}.TO.{self.to_role}".upper()
+        )
 
-    def get_create_sql(self) -> str:
+    def _build_create_sql(self) -> str:
         return f"GRANT {self.privilege} ON {self.on_type} {self.on_name} TO ROLE {self.to_role}"
 
     def get_drop_sql(self) -> str:
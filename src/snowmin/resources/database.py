@@ -1,5 +1,8 @@
+import sys
+from functools import cached_property
 from typing import Optional
 from pydantic import Field
+from snowmin.core.sql import quote_literal
 from snowmin.core.state import AccountObject, Resource
 
 
@@ -11,13 +14,15 @@ class Database(AccountObject):
         None, description="Data retention in days"
     )
 
-    def get_create_sql(self) -> str:
-        sql = f"CREATE DATABASE {self.name}"
+    def _build_create_sql(self) -> str:
+        parts = [f"CREATE DATABASE {self.name}"]
         if self.data_retention_time_in_days is not None:
-            sql += f" DATA_RETENTION_TIME_IN_DAYS = {self.data_retention_time_in_days}"
+            parts.append(
+                f"DATA_RETENTION_TIME_IN_DAYS = {self.data_retention_time_in_days}"
+            )
         if self.comment:
-            sql += f" COMMENT = '{self.comment}'"
-        return sql
+            parts.append(f"COMMENT = {quote_literal(self.comment)}")
+        return " ".join(parts)
 
     def get_alter_sql(self, current_state: "Database") -> str:
         changes = []
@@ -29,7 +34,7 @@ class Database(AccountObject):
                 f"DATA_RETENTION_TIME_IN_DAYS = {self.data_retention_time_in_days}"
             )
         if self.comment != current_state.comment:
-            changes.append(f"COMMENT = '{self.comment}'")
+            changes.append(f"COMMENT = {quote_literal(self.comment)}")
 
         if not changes:
             return ""
@@ -55,19 +60,23 @@ class Schema(Resource):
         # Instantiate Table, which auto-registers with ResourceRegistry
         Table.from_model(database=self.database, schema=self.name, model=model_class)
 
-    @property
+    @cached_property
     def identifier(self) -> str:
-        return f"{self._snowflake_type}.{self.database.upper()}.{self.name.upper()}"
+        return sys.intern(
+            f"{self._snowflake_type}." + f"{self.database}.{self.name}".upper()
+        )
 
-    def get_create_sql(self) -> str:
-        sql = f"CREATE SCHEMA {self.database}.{self.name}"
+    def _build_create_sql(self) -> str:
+        parts = [f"CREATE SCHEMA {self.database}.{self.name}"]
         if self.managed_access:
-            sql += " WITH MANAGED ACCESS"
+            parts.append("WITH MANAGED ACCESS")
         if self.data_retention_time_in_days is not None:
-            sql += f" DATA_RETENTION_TIME_IN_DAYS = {self.data_retention_time_in_days}"
+            parts.append(
+                f"DATA_RETENTION_TIME_IN_DAYS = {self.data_retention_time_in_days}"
+            )
         if self.comment:
-            sql += f" COMMENT = '{self.comment}'"
-        return sql
+            parts.append(f"COMMENT = {quote_literal(self.comment)}")
+        return " ".join(parts)
 
     def get_alter_sql(self, current_state: "Schema") -> str:
         changes = []
@@ -79,7 +88,7 @@ class Schema(Resource):
                 f"DATA_RETENTION_TIME_IN_DAYS = {self.data_retention_time_in_days}"
             )
         if self.comment != current_state.comment:
-            changes.append(f"COMMENT = '{self.comment}'")
+            changes.append(f"COMMENT = {quote_literal(self.comment)}")
 
         if not changes:
             return ""
@@ -1,9 +1,20 @@
+from dataclasses import dataclass
 from typing import List, Type, Any, Optional
-from pydantic import BaseModel, Field
-from snowmin.core.state import Resource
+from pydantic import BaseModel
+from snowmin.core.registry import ResourceRegistry
+from snowmin.core.sql import quote_literal
+from snowmin.core.state import SchemaObject
 
 
-class Column(BaseModel):
+# Snowflake column types for Python annotations; str is handled separately
+# because its length comes from the field metadata
+_TYPE_MAP = {int: "NUMBER", bool: "BOOLEAN", float: "FLOAT"}
+
+
+@dataclass(slots=True, frozen=True)
+class Column:
+    # A plain dataclass: columns are built from trusted values, and pydantic
+    # accepts existing instances in Table.columns without re-validating them
     name: str
     type: str
     nullable: bool = True
@@ -11,18 +22,12 @@ class Column(BaseModel):
     comment: Optional[str] = None
 
 
-class Table(Resource):
+class Table(SchemaObject):
     _snowflake_type = "table"
 
-    database: str
-    schema_name: str = Field(..., alias="schema")
     columns: List[Column]
     comment: Optional[str] = None
 
-    @property
-    def identifier(self) -> str:
-        return f"{self._snowflake_type}.{self.database.upper()}.{self.schema_name.upper()}.{self.name.upper()}"
-
     @classmethod
     def from_model(cls, database: str, schema: str, model: Type[BaseModel]) -> "Table":
         """Create a Table resource from a Pydantic model."""
@@ -44,54 +49,55 @@ class Table(Resource):
                 )
             )
 
-        return cls(
-            name=model.__name__, database=database, schema=schema, columns=columns
+        # Every field is built here, so skip validation; model_construct also
+        # skips Resource.__init__, so register the table explicitly
+        table = cls.model_construct(
+            name=model.__name__,
+            database=database,
+            schema_name=schema,
+            columns=columns,
         )
+        ResourceRegistry.register(table)
+        return table
 
     @staticmethod
     def _map_type(py_type: Any, field_info: Any) -> str:
-        if py_type is int:
-            return "NUMBER"
         if py_type is str:
-            if field_info.metadata:
-                for meta in field_info.metadata:
-                    if hasattr(meta, "max_length") and meta.max_length:
-                        return f"VARCHAR({meta.max_length})"
+            for meta in field_info.metadata or ():
+                max_length = getattr(meta, "max_length", None)
+                if max_length:
+                    return f"VARCHAR({max_length})"
             return "VARCHAR"
-        if py_type is bool:
-            return "BOOLEAN"
-        if py_type is float:
-            return "FLOAT"
-        return "VARCHAR"
+        return _TYPE_MAP.get(py_type, "VARCHAR")
 
-    def get_create_sql(self) -> str:
+    def _build_create_sql(self) -> str:
         full_name = f"{self.database}.{self.schema_name}.{self.name}"
         cols_sql = []
         for col in self.columns:
-            line = f"{col.name} {col.type}"
+            line = [col.name, col.type]
             if not col.nullable:
-                line += " NOT NULL"
+                line.append("NOT NULL")
             if col.comment:
-                line += f" COMMENT '{col.comment}'"
-            cols_sql.append(line)
+                line.append(f"COMMENT {quote_literal(col.comment)}")
+            cols_sql.append(" ".join(line))
 
         return f"CREATE TABLE {full_name} ({', '.join(cols_sql)})"
 
     def get_alter_sql(self, current_state: "Table") -> str:
-        full_name = f"{self.database}.{self.schema_name}.{self.name}"
-        sql_stmts = []
-
         desired_cols = {c.name: c for c in self.columns}
-        current_cols = {c.name: c for c in current_state.columns}
+        added = desired_cols.keys() - {c.name for c in current_state.columns}
+        if not added:
+            return ""
 
+        sql_stmts = []
+        # Walk the desired columns rather than the set so the ADD COLUMN
+        # clauses keep their declaration order
         for name, col in desired_cols.items():
-            if name not in current_cols:
-                line = f"{col.name} {col.type}"
+            if name in added:
+                line = ["ADD COLUMN", col.name, col.type]
                 if not col.nullable:
-                    line += " NOT NULL"
-                sql_stmts.append(f"ADD COLUMN {line}")
+                    line.append("NOT NULL")
+                sql_stmts.append(" ".join(line))
 
-        if sql_stmts:
-            return f"ALTER TABLE {full_name} " + ", ".join(sql_stmts)
-
-        return ""
+        full_name = f"{self.database}.{self.schema_name}.{self.name}"
+        return f"ALTER TABLE {full_name} " + ", ".join(sql_stmts)
@@ -33,7 +33,7 @@ class TestApplyCommand:
     def test_apply_confirmed(self, runner: CliRunner, stub_stack: Path, mocker):
         """When user confirms, runner.apply() is called with the SQL plan."""
         sql = ["CREATE WAREHOUSE SNOWMIN_WH;"]
-        _ = mocker.patch("snowmin.core.runner.Runner.plan", return_value=sql)
+        mock_plan = mocker.patch("snowmin.core.runner.Runner.plan", return_value=sql)
         mock_apply = mocker.patch("snowmin.core.runner.Runner.apply")
         mocker.patch("snowmin.core.runner.Introspector")
         mocker.patch("snowmin.core.runner.ConnectionManager")
@@ -42,6 +42,8 @@ class TestApplyCommand:
         result = runner.invoke(cli, ["apply", "--stack", str(stub_stack)], input="y\n")
 
         assert result.exit_code == 0
+        # The plan being applied is never built from the cached state
+        mock_plan.assert_called_once_with(refresh=True)
         mock_apply.assert_called_once_with(sql)
 
     def test_apply_cancelled(self, runner: CliRunner, stub_stack: Path, mocker):
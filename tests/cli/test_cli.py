@@ -0,0 +1,46 @@
+"""Tests for the top-level `snowmin` command group."""
+
+from __future__ import annotations
+
+import sys
+
+from click.testing import CliRunner
+
+from snowmin.cli import LAZY_SUBCOMMANDS, _colors, cli
+
+
+def test_help_lists_lazy_subcommands(runner: CliRunner):
+    result = runner.invoke(cli, ["--help"])
+
+    assert result.exit_code == 0
+    for name in LAZY_SUBCOMMANDS:
+        assert name in result.output
+
+
+def test_subcommand_module_loaded_only_when_invoked(runner: CliRunner, mocker):
+    mocker.patch.dict(sys.modules)
+    sys.modules.pop("snowmin.cli_tables", None)
+
+    result = runner.invoke(cli, ["destroy"])
+
+    assert result.exit_code == 0
+    assert "snowmin.cli_tables" not in sys.modules
+
+    result = runner.invoke(cli, ["tables", "--help"])
+
+    assert result.exit_code == 0
+    assert "truncate" in result.output
+    assert "snowmin.cli_tables" in sys.modules
+
+
+def test_colorama_initialised_without_database_line(runner: CliRunner, mocker):
+    mocker.patch("snowmin.cli.get_merged_connection_config", return_value={})
+    init = mocker.patch("colorama.init")
+    _colors.cache_clear()
+
+    result = runner.invoke(cli, ["destroy"])
+    _colors.cache_clear()
+
+    assert result.exit_code == 0
+    assert "Current database" not in result.output
+    init.assert_called_once_with()
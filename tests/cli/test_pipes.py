@@ -2,7 +2,16 @@
 
 from __future__ import annotations
 
-from snowmin.operations.pipes import list_pipes_command, pause_pipe_command
+import re
+
+import pytest
+
+from snowmin.operations import pipes
+from snowmin.operations.pipes import (
+    drop_recreate_pipe_command,
+    list_pipes_command,
+    pause_pipe_command,
+)
 
 
 class FakeCursor:
@@ -13,6 +22,13 @@ class FakeCursor:
     def fetchall(self):
         return self._rows
 
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchmany(self, size):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
     def close(self):
         pass
 
@@ -24,6 +40,13 @@ PIPE_DESCRIPTION = [
 ]
 
 
+@pytest.fixture(autouse=True)
+def empty_show_pipes_cache():
+    pipes._SHOW_PIPES_CACHE.clear()
+    yield
+    pipes._SHOW_PIPES_CACHE.clear()
+
+
 def _ctx(mocker):
     ctx = mocker.Mock()
     ctx.obj = {"settings": mocker.Mock(), "cli_overrides": {}}
@@ -41,7 +64,7 @@ def test_list_pipes_queries_comma_separated_schemas(mocker):
     _patch_config(mocker)
     execute = mocker.patch("snowmin.operations.pipes.ConnectionManager.execute")
 
-    def execute_side_effect(query, conn_config):
+    def execute_side_effect(query, params=None, conn_config=None):
         if query == "SHOW PIPES IN SCHEMA RAP_DEV_ANALYTICS.SILVER":
             return FakeCursor(
                 description=PIPE_DESCRIPTION,
@@ -52,8 +75,10 @@ def test_list_pipes_queries_comma_separated_schemas(mocker):
                 description=PIPE_DESCRIPTION,
                 rows=[("ORDER_PIPE", "RAP_DEV_ANALYTICS", "GOLD")],
             )
-        if query.startswith("SELECT '"):
-            return FakeCursor(rows=[("CUSTOMER_PIPE", '{"executionState":"RUNNING"}')])
+        if "SYSTEM$PIPE_STATUS" in query:
+            return FakeCursor(
+                rows=[('{"executionState":"RUNNING"}', '{"executionState":"PAUSED"}')]
+            )
         return FakeCursor()
 
     execute.side_effect = execute_side_effect
@@ -87,3 +112,244 @@ def test_pause_pipe_applies_unqualified_name_to_comma_separated_schemas(mocker):
         "ALTER PIPE RAP_DEV_ANALYTICS.GOLD.LOAD_PIPE SET PIPE_EXECUTION_PAUSED = TRUE"
         in executed_sql
     )
+
+
+def test_pipe_statuses_fetched_in_concurrent_batches(mocker):
+    execute = mocker.patch("snowmin.operations.pipes.ConnectionManager.execute")
+
+    def execute_side_effect(query, params=None, conn_config=None):
+        names = re.findall(r"SYSTEM\$PIPE_STATUS\('([^']*)'\)", query)
+        if names[0] == "DB.S.P50":
+            raise RuntimeError("boom")
+        return FakeCursor(rows=[tuple('{"executionState":"RUNNING"}' for _ in names)])
+
+    execute.side_effect = execute_side_effect
+    names = [f"P{i}" for i in range(120)]
+
+    status_map = pipes._fetch_pipe_statuses(
+        {}, [pipes.PipeRef(n, database="DB", schema="S") for n in names]
+    )
+
+    # The failed batch is reported and its pipes retried one by one; only
+    # the pipe that keeps failing is missing
+    assert execute.call_count == 3 + 50
+    assert sorted(status_map) == sorted(f"DB.S.{n}" for n in names if n != "P50")
+    assert set(status_map.values()) == {"RUNNING"}
+
+
+def test_pipe_status_execution_state_extraction(mocker):
+    execute = mocker.patch("snowmin.operations.pipes.ConnectionManager.execute")
+    execute.return_value = FakeCursor(
+        rows=[
+            (
+                '{"executionState": "PAUSED", "pendingFileCount": 0}',
+                '{"pendingFileCount": 0}',
+                '{"executionState": "STOPPED_\\u0041"}',
+                "not json",
+            )
+        ]
+    )
+
+    status_map = pipes._fetch_pipe_statuses(
+        {}, [pipes.PipeRef(n, database="DB", schema="S") for n in "ABCD"]
+    )
+
+    # Names are inlined as literals: SYSTEM$PIPE_STATUS takes no bind variables
+    assert execute.call_args.args == (
+        "SELECT SYSTEM$PIPE_STATUS('DB.S.A') AS s0,"
+        " SYSTEM$PIPE_STATUS('DB.S.B') AS s1,"
+        " SYSTEM$PIPE_STATUS('DB.S.C') AS s2,"
+        " SYSTEM$PIPE_STATUS('DB.S.D') AS s3",
+    )
+
+    assert status_map == {
+        "DB.S.A": "PAUSED",
+        "DB.S.B": "UNKNOWN",
+        "DB.S.C": "STOPPED_A",
+        "DB.S.D": "ERROR_PARSING_JSON",
+    }
+
+
+def test_show_pipes_reused_until_no_cache(mocker):
+    _patch_config(mocker)
+    execute = mocker.patch("snowmin.operations.pipes.ConnectionManager.execute")
+
+    def execute_side_effect(query, params=None, conn_config=None):
+        if query.startswith("SHOW PIPES"):
+            return FakeCursor(
+                description=PIPE_DESCRIPTION,
+                rows=[("LOAD_PIPE", "RAP_DEV_ANALYTICS", "SILVER")],
+            )
+        return FakeCursor()
+
+    execute.side_effect = execute_side_effect
+    ctx = _ctx(mocker)
+
+    list_pipes_command(ctx, schema="SILVER")
+    list_pipes_command(ctx, pattern="LOAD", schema="SILVER")
+
+    show_queries = [
+        call.args[0]
+        for call in execute.call_args_list
+        if call.args[0].startswith("SHOW PIPES")
+    ]
+    assert show_queries == ["SHOW PIPES IN SCHEMA RAP_DEV_ANALYTICS.SILVER"]
+
+    ctx.obj["no_cache"] = True
+    pipes._SHOW_PIPES_CACHE.clear()
+    list_pipes_command(ctx, schema="SILVER")
+
+    assert execute.call_args_list[-2].args[0].startswith("SHOW PIPES")
+    assert pipes._SHOW_PIPES_CACHE == {}
+
+
+def test_drop_recreate_forgets_cached_show_pipes(mocker):
+    _patch_config(mocker)
+    mocker.patch("click.confirm", return_value=True)
+    execute = mocker.patch("snowmin.operations.pipes.ConnectionManager.execute")
+
+    def execute_side_effect(query, params=None, conn_config=None, num_statements=None):
+        if query.startswith("SHOW PIPES"):
+            return FakeCursor(
+                description=PIPE_DESCRIPTION,
+                rows=[("LOAD_PIPE", "RAP_DEV_ANALYTICS", "SILVER")],
+            )
+        if query.startswith("SELECT GET_DDL"):
+            return FakeCursor(rows=[("create pipe LOAD_PIPE as copy",)])
+        return FakeCursor()
+
+    execute.side_effect = execute_side_effect
+    ctx = _ctx(mocker)
+    list_pipes_command(ctx, schema="SILVER,GOLD")
+    assert len(pipes._SHOW_PIPES_CACHE) == 2
+
+    drop_recreate_pipe_command(
+        ctx,
+        pipe_name=None,
+        all_flag=True,
+        pattern=None,
+        schema="SILVER",
+        status=None,
+        skip_status=True,
+    )
+
+    assert list(pipes._SHOW_PIPES_CACHE) == [(None, "RAP_DEV_ANALYTICS", "GOLD")]
+
+
+def test_drop_recreate_runs_drop_and_ddl_as_one_batch(mocker):
+    _patch_config(mocker)
+    mocker.patch("click.confirm", return_value=True)
+    execute = mocker.patch("snowmin.operations.pipes.ConnectionManager.execute")
+
+    def execute_side_effect(query, params=None, conn_config=None, num_statements=None):
+        if query.startswith("SELECT GET_DDL"):
+            return FakeCursor(rows=[("create or replace pipe LOAD_PIPE as copy;",)])
+        return FakeCursor()
+
+    execute.side_effect = execute_side_effect
+
+    drop_recreate_pipe_command(
+        _ctx(mocker),
+        pipe_name="SILVER.LOAD_PIPE",
+        all_flag=False,
+        pattern=None,
+        schema=None,
+        status=None,
+    )
+
+    ddl_call, batch_call = execute.call_args_list
+    assert ddl_call.args == (
+        pipes.PIPE_DDL_QUERY,
+        ("RAP_DEV_ANALYTICS.SILVER.LOAD_PIPE",),
+    )
+    assert batch_call.args[0] == (
+        "USE SCHEMA RAP_DEV_ANALYTICS.SILVER;\n"
+        "DROP PIPE RAP_DEV_ANALYTICS.SILVER.LOAD_PIPE;\n"
+        "create or replace pipe LOAD_PIPE as copy"
+    )
+    assert batch_call.kwargs["num_statements"] == 3
+
+
+def test_status_filter_reads_only_execution_state(mocker):
+    _patch_config(mocker)
+    mocker.patch("click.confirm", return_value=True)
+    execute = mocker.patch("snowmin.operations.pipes.ConnectionManager.execute")
+
+    def execute_side_effect(query, params=None, conn_config=None):
+        if query.startswith("SHOW PIPES"):
+            return FakeCursor(
+                description=PIPE_DESCRIPTION,
+                rows=[
+                    ("LOAD_A", "RAP_DEV_ANALYTICS", "SILVER"),
+                    ("LOAD_B", "RAP_DEV_ANALYTICS", "SILVER"),
+                ],
+            )
+        if "SYSTEM$PIPE_STATUS" in query:
+            return FakeCursor(rows=[("RUNNING", "PAUSED")])
+        return FakeCursor()
+
+    execute.side_effect = execute_side_effect
+
+    pause_pipe_command(
+        _ctx(mocker), pipe_name=None, pattern="LOAD", schema="SILVER", status="paused"
+    )
+
+    executed_sql = [call.args[0] for call in execute.call_args_list]
+    (status_sql,) = [sql for sql in executed_sql if "SYSTEM$PIPE_STATUS" in sql]
+    assert status_sql.count(":executionState::string") == 2
+    assert [sql for sql in executed_sql if sql.startswith("ALTER PIPE")] == [
+        "ALTER PIPE RAP_DEV_ANALYTICS.SILVER.LOAD_B SET PIPE_EXECUTION_PAUSED = TRUE"
+    ]
+
+
+def test_drop_recreate_sets_schema_context_once_per_schema(mocker):
+    _patch_config(mocker)
+    mocker.patch("click.confirm", return_value=True)
+    execute = mocker.patch("snowmin.operations.pipes.ConnectionManager.execute")
+
+    def execute_side_effect(query, params=None, conn_config=None, num_statements=None):
+        if query.startswith("SHOW PIPES"):
+            return FakeCursor(
+                description=PIPE_DESCRIPTION,
+                rows=[
+                    ("B_PIPE", "RAP_DEV_ANALYTICS", "GOLD"),
+                    ("A_PIPE", "RAP_DEV_ANALYTICS", "SILVER"),
+                    ("C_PIPE", "RAP_DEV_ANALYTICS", "GOLD"),
+                ],
+            )
+        if query.startswith("SELECT GET_DDL"):
+            return FakeCursor(rows=[("create pipe X as copy",)])
+        return FakeCursor()
+
+    execute.side_effect = execute_side_effect
+
+    drop_recreate_pipe_command(
+        _ctx(mocker),
+        pipe_name=None,
+        all_flag=True,
+        pattern=None,
+        schema="SILVER",
+        status=None,
+        skip_status=True,
+    )
+
+    batches = [c.args[0] for c in execute.call_args_list if "DROP PIPE" in c.args[0]]
+    assert [b.split(";")[0] for b in batches] == [
+        "USE SCHEMA RAP_DEV_ANALYTICS.GOLD",
+        "DROP PIPE RAP_DEV_ANALYTICS.GOLD.C_PIPE",
+        "USE SCHEMA RAP_DEV_ANALYTICS.SILVER",
+    ]
+
+
+def test_show_pipes_indices_use_known_layout_with_fallback():
+    snowflake_layout = [
+        ("created_on",),
+        ("name",),
+        ("database_name",),
+        ("schema_name",),
+        ("definition",),
+    ]
+
+    assert pipes._show_pipes_indices(snowflake_layout) == (1, 2, 3)
+    assert pipes._show_pipes_indices(PIPE_DESCRIPTION) == (0, 1, 2)
+    assert pipes._show_pipes_indices([("owner",)]) == (None, None, None)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import pytest
+
+from snowmin.operations import tasks
 from snowmin.operations.tasks import (
     list_tasks_command,
     resume_task_command,
@@ -17,6 +20,13 @@ class FakeCursor:
     def fetchall(self):
         return self._rows
 
+    def fetchmany(self, size):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def nextset(self):
+        return None
+
     def close(self):
         pass
 
@@ -28,6 +38,11 @@ TASK_DESCRIPTION = [
     ("schema_name",),
 ]
 
+LIST_TASKS_COLUMNS_QUERY = (
+    'SELECT "name", "state", "database_name", "schema_name"'
+    " FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))"
+)
+
 TASK_GRAPH_DESCRIPTION = TASK_DESCRIPTION + [("predecessors",)]
 TASK_RELATIONS_DESCRIPTION = TASK_DESCRIPTION + [("task_relations",)]
 
@@ -38,6 +53,13 @@ def _ctx(mocker):
     return ctx
 
 
+def _executed_sql(execute):
+    """Executed statements, with multi-statement batches split apart."""
+    return [
+        query for call in execute.call_args_list for query in call.args[0].split(";\n")
+    ]
+
+
 def _patch_config(mocker):
     mocker.patch(
         "snowmin.operations.tasks.get_merged_connection_config",
@@ -50,7 +72,7 @@ def test_suspend_all_only_processes_started_tasks(mocker):
     mocker.patch("snowmin.operations.tasks.click.confirm", return_value=True)
     execute = mocker.patch("snowmin.operations.tasks.ConnectionManager.execute")
 
-    def execute_side_effect(query, conn_config):
+    def execute_side_effect(query, conn_config, num_statements=None):
         if query == "SHOW TASKS IN SCHEMA RAP_DEV_ANALYTICS.MART":
             return FakeCursor(
                 description=TASK_DESCRIPTION,
@@ -71,7 +93,7 @@ def test_suspend_all_only_processes_started_tasks(mocker):
         schema="RAP_DEV_ANALYTICS.MART",
     )
 
-    executed_sql = [call.args[0] for call in execute.call_args_list]
+    executed_sql = _executed_sql(execute)
     assert "ALTER TASK RAP_DEV_ANALYTICS.MART.LOAD_CUSTOMERS SUSPEND" in executed_sql
     assert "ALTER TASK RAP_DEV_ANALYTICS.MART.LOAD_ORDERS SUSPEND" not in executed_sql
 
@@ -81,7 +103,7 @@ def test_resume_pattern_only_processes_suspended_tasks(mocker):
     mocker.patch("snowmin.operations.tasks.click.confirm", return_value=True)
     execute = mocker.patch("snowmin.operations.tasks.ConnectionManager.execute")
 
-    def execute_side_effect(query, conn_config):
+    def execute_side_effect(query, conn_config, num_statements=None):
         if query == "SHOW TASKS IN SCHEMA RAP_DEV_ANALYTICS.MART":
             return FakeCursor(
                 description=TASK_DESCRIPTION,
@@ -102,7 +124,7 @@ def test_resume_pattern_only_processes_suspended_tasks(mocker):
         schema="RAP_DEV_ANALYTICS.MART",
     )
 
-    executed_sql = [call.args[0] for call in execute.call_args_list]
+    executed_sql = _executed_sql(execute)
     assert "ALTER TASK RAP_DEV_ANALYTICS.MART.LOAD_CUSTOMERS RESUME" not in executed_sql
     assert "ALTER TASK RAP_DEV_ANALYTICS.MART.LOAD_ORDERS RESUME" in executed_sql
 
@@ -111,13 +133,13 @@ def test_list_tasks_queries_comma_separated_schemas(mocker):
     _patch_config(mocker)
     execute = mocker.patch("snowmin.operations.tasks.ConnectionManager.execute")
 
-    def execute_side_effect(query, conn_config):
-        if query == "SHOW TASKS IN SCHEMA RAP_DEV_ANALYTICS.SILVER":
+    def execute_side_effect(query, conn_config, num_statements=None):
+        if query.startswith("SHOW TASKS IN SCHEMA RAP_DEV_ANALYTICS.SILVER;"):
             return FakeCursor(
                 description=TASK_DESCRIPTION,
                 rows=[("LOAD_CUSTOMERS", "started", "RAP_DEV_ANALYTICS", "SILVER")],
             )
-        if query == "SHOW TASKS IN SCHEMA RAP_DEV_ANALYTICS.GOLD":
+        if query.startswith("SHOW TASKS IN SCHEMA RAP_DEV_ANALYTICS.GOLD;"):
             return FakeCursor(
                 description=TASK_DESCRIPTION,
                 rows=[("LOAD_ORDERS", "suspended", "RAP_DEV_ANALYTICS", "GOLD")],
@@ -128,10 +150,12 @@ def test_list_tasks_queries_comma_separated_schemas(mocker):
 
     list_tasks_command(_ctx(mocker), schema="SILVER,GOLD")
 
-    executed_sql = [call.args[0] for call in execute.call_args_list]
+    executed_sql = _executed_sql(execute)
     assert executed_sql == [
         "SHOW TASKS IN SCHEMA RAP_DEV_ANALYTICS.SILVER",
+        LIST_TASKS_COLUMNS_QUERY,
         "SHOW TASKS IN SCHEMA RAP_DEV_ANALYTICS.GOLD",
+        LIST_TASKS_COLUMNS_QUERY,
     ]
 
 
@@ -140,7 +164,7 @@ def test_suspend_all_queries_comma_separated_schemas(mocker):
     mocker.patch("snowmin.operations.tasks.click.confirm", return_value=True)
     execute = mocker.patch("snowmin.operations.tasks.ConnectionManager.execute")
 
-    def execute_side_effect(query, conn_config):
+    def execute_side_effect(query, conn_config, num_statements=None):
         if query == "SHOW TASKS IN SCHEMA RAP_DEV_ANALYTICS.SILVER":
             return FakeCursor(
                 description=TASK_DESCRIPTION,
@@ -163,7 +187,7 @@ def test_suspend_all_queries_comma_separated_schemas(mocker):
         schema="SILVER,GOLD",
     )
 
-    executed_sql = [call.args[0] for call in execute.call_args_list]
+    executed_sql = _executed_sql(execute)
     assert "ALTER TASK RAP_DEV_ANALYTICS.SILVER.LOAD_CUSTOMERS SUSPEND" in executed_sql
     assert "ALTER TASK RAP_DEV_ANALYTICS.GOLD.LOAD_ORDERS SUSPEND" in executed_sql
 
@@ -185,7 +209,7 @@ def test_single_suspend_skips_task_that_is_not_started(mocker):
         schema="RAP_DEV_ANALYTICS.MART",
     )
 
-    executed_sql = [call.args[0] for call in execute.call_args_list]
+    executed_sql = _executed_sql(execute)
     assert executed_sql == [
         "SHOW TASKS LIKE 'LOAD_CUSTOMERS' IN SCHEMA RAP_DEV_ANALYTICS.MART"
     ]
@@ -195,7 +219,7 @@ def test_single_suspend_non_graph_task_executes_once(mocker):
     _patch_config(mocker)
     execute = mocker.patch("snowmin.operations.tasks.ConnectionManager.execute")
 
-    def execute_side_effect(query, conn_config):
+    def execute_side_effect(query, conn_config, num_statements=None):
         if query == "SHOW TASKS LIKE 'LOAD_CUSTOMERS' IN SCHEMA RAP_DEV_ANALYTICS.MART":
             return FakeCursor(
                 description=TASK_DESCRIPTION,
@@ -213,19 +237,20 @@ def test_single_suspend_non_graph_task_executes_once(mocker):
         schema="RAP_DEV_ANALYTICS.MART",
     )
 
-    executed_sql = [call.args[0] for call in execute.call_args_list]
+    executed_sql = _executed_sql(execute)
     assert executed_sql == [
         "SHOW TASKS LIKE 'LOAD_CUSTOMERS' IN SCHEMA RAP_DEV_ANALYTICS.MART",
         "ALTER TASK RAP_DEV_ANALYTICS.MART.LOAD_CUSTOMERS SUSPEND",
     ]
 
 
-def test_suspend_all_suspends_graph_root_before_children(mocker):
+@pytest.mark.parametrize("fail_batch", [False, True])
+def test_suspend_all_suspends_graph_root_before_children(mocker, fail_batch):
     _patch_config(mocker)
     mocker.patch("snowmin.operations.tasks.click.confirm", return_value=True)
     execute = mocker.patch("snowmin.operations.tasks.ConnectionManager.execute")
 
-    def execute_side_effect(query, conn_config):
+    def execute_side_effect(query, conn_config, num_statements=None):
         if query == "SHOW TASKS IN SCHEMA RAP_DEV_ANALYTICS.MART":
             return FakeCursor(
                 description=TASK_GRAPH_DESCRIPTION,
@@ -247,6 +272,8 @@ def test_suspend_all_suspends_graph_root_before_children(mocker):
                     ),
                 ],
             )
+        if num_statements and fail_batch:
+            raise RuntimeError("batch failed")
         return FakeCursor()
 
     execute.side_effect = execute_side_effect
@@ -259,7 +286,14 @@ def test_suspend_all_suspends_graph_root_before_children(mocker):
         schema="RAP_DEV_ANALYTICS.MART",
     )
 
-    executed_sql = [call.args[0] for call in execute.call_args_list]
+    executed_sql = _executed_sql(execute)
+    if fail_batch:
+        # Only the one-at-a-time retries matter; children may run in any order
+        executed_sql = [
+            call.args[0]
+            for call in execute.call_args_list
+            if "num_statements" not in call.kwargs
+        ]
     root_sql = "ALTER TASK RAP_DEV_ANALYTICS.MART.ROOT_TASK SUSPEND"
     child_a_sql = "ALTER TASK RAP_DEV_ANALYTICS.MART.CHILD_A SUSPEND"
     child_b_sql = "ALTER TASK RAP_DEV_ANALYTICS.MART.CHILD_B SUSPEND"
@@ -272,7 +306,7 @@ def test_single_suspend_graph_child_suspends_root_first(mocker):
     _patch_config(mocker)
     execute = mocker.patch("snowmin.operations.tasks.ConnectionManager.execute")
 
-    def execute_side_effect(query, conn_config):
+    def execute_side_effect(query, conn_config, num_statements=None):
         if query == "SHOW TASKS LIKE 'CHILD_TASK' IN SCHEMA RAP_DEV_ANALYTICS.MART":
             return FakeCursor(
                 description=TASK_GRAPH_DESCRIPTION,
@@ -312,7 +346,7 @@ def test_single_suspend_graph_child_suspends_root_first(mocker):
         schema="RAP_DEV_ANALYTICS.MART",
     )
 
-    executed_sql = [call.args[0] for call in execute.call_args_list]
+    executed_sql = _executed_sql(execute)
     root_sql = "ALTER TASK RAP_DEV_ANALYTICS.MART.ROOT_TASK SUSPEND"
     child_sql = "ALTER TASK RAP_DEV_ANALYTICS.MART.CHILD_TASK SUSPEND"
     assert root_sql in executed_sql
@@ -324,7 +358,7 @@ def test_single_resume_graph_root_uses_task_dependents_enable(mocker):
     _patch_config(mocker)
     execute = mocker.patch("snowmin.operations.tasks.ConnectionManager.execute")
 
-    def execute_side_effect(query, conn_config):
+    def execute_side_effect(query, conn_config, num_statements=None):
         if query == "SHOW TASKS LIKE 'ROOT_TASK' IN SCHEMA RAP_DEV_ANALYTICS.MART":
             return FakeCursor(
                 description=TASK_GRAPH_DESCRIPTION,
@@ -358,7 +392,7 @@ def test_single_resume_graph_root_uses_task_dependents_enable(mocker):
         schema="RAP_DEV_ANALYTICS.MART",
     )
 
-    executed_sql = [call.args[0] for call in execute.call_args_list]
+    executed_sql = _executed_sql(execute)
     assert "ALTER TASK RAP_DEV_ANALYTICS.MART.ROOT_TASK RESUME" not in executed_sql
     assert "ALTER TASK RAP_DEV_ANALYTICS.MART.ROOT_TASK SUSPEND" in executed_sql
     assert (
@@ -367,11 +401,43 @@ def test_single_resume_graph_root_uses_task_dependents_enable(mocker):
     )
 
 
+def test_resume_graph_root_escapes_name_in_task_dependents_enable(mocker):
+    _patch_config(mocker)
+    mocker.patch("snowmin.operations.tasks.click.confirm", return_value=True)
+    execute = mocker.patch("snowmin.operations.tasks.ConnectionManager.execute")
+    execute.side_effect = lambda query, conn_config, num_statements=None: FakeCursor(
+        description=TASK_GRAPH_DESCRIPTION,
+        rows=[
+            ("O'ROOT", "suspended", "RAP_DEV_ANALYTICS", "MART", "[]"),
+            (
+                "CHILD_TASK",
+                "suspended",
+                "RAP_DEV_ANALYTICS",
+                "MART",
+                '["RAP_DEV_ANALYTICS.MART.\\"O\'ROOT\\""]',
+            ),
+        ],
+    )
+
+    resume_task_command(
+        _ctx(mocker),
+        task_name=None,
+        all=True,
+        pattern=None,
+        schema="RAP_DEV_ANALYTICS.MART",
+    )
+
+    assert (
+        "SELECT SYSTEM$TASK_DEPENDENTS_ENABLE('RAP_DEV_ANALYTICS.MART.\"O''ROOT\"')"
+        in _executed_sql(execute)
+    )
+
+
 def test_single_resume_graph_child_resumes_root_graph(mocker):
     _patch_config(mocker)
     execute = mocker.patch("snowmin.operations.tasks.ConnectionManager.execute")
 
-    def execute_side_effect(query, conn_config):
+    def execute_side_effect(query, conn_config, num_statements=None):
         if query == "SHOW TASKS LIKE 'CHILD_TASK' IN SCHEMA RAP_DEV_ANALYTICS.MART":
             return FakeCursor(
                 description=TASK_GRAPH_DESCRIPTION,
@@ -411,7 +477,7 @@ def test_single_resume_graph_child_resumes_root_graph(mocker):
         schema="RAP_DEV_ANALYTICS.MART",
     )
 
-    executed_sql = [call.args[0] for call in execute.call_args_list]
+    executed_sql = _executed_sql(execute)
     assert "ALTER TASK RAP_DEV_ANALYTICS.MART.CHILD_TASK RESUME" not in executed_sql
     assert "ALTER TASK RAP_DEV_ANALYTICS.MART.ROOT_TASK SUSPEND" in executed_sql
     assert (
@@ -424,7 +490,7 @@ def test_single_resume_finalizer_resumes_root_graph(mocker):
     _patch_config(mocker)
     execute = mocker.patch("snowmin.operations.tasks.ConnectionManager.execute")
 
-    def execute_side_effect(query, conn_config):
+    def execute_side_effect(query, conn_config, num_statements=None):
         if (
             query
             == "SHOW TASKS LIKE 'ROOT_TASK_FINALIZER' IN SCHEMA RAP_DEV_ANALYTICS.MART"
@@ -473,7 +539,7 @@ def test_single_resume_finalizer_resumes_root_graph(mocker):
         schema="RAP_DEV_ANALYTICS.MART",
     )
 
-    executed_sql = [call.args[0] for call in execute.call_args_list]
+    executed_sql = _executed_sql(execute)
     assert (
         "ALTER TASK RAP_DEV_ANALYTICS.MART.ROOT_TASK_FINALIZER RESUME"
         not in executed_sql
@@ -489,7 +555,7 @@ def test_single_resume_uses_bare_name_when_task_is_qualified(mocker):
     _patch_config(mocker)
     execute = mocker.patch("snowmin.operations.tasks.ConnectionManager.execute")
 
-    def execute_side_effect(query, conn_config):
+    def execute_side_effect(query, conn_config, num_statements=None):
         if query == "SHOW TASKS LIKE 'LOAD_CUSTOMERS' IN SCHEMA DB1.SCHEMA1":
             return FakeCursor(
                 description=TASK_DESCRIPTION,
@@ -507,8 +573,148 @@ def test_single_resume_uses_bare_name_when_task_is_qualified(mocker):
         schema=None,
     )
 
-    executed_sql = [call.args[0] for call in execute.call_args_list]
+    executed_sql = _executed_sql(execute)
     assert executed_sql == [
         "SHOW TASKS LIKE 'LOAD_CUSTOMERS' IN SCHEMA DB1.SCHEMA1",
         "ALTER TASK DB1.SCHEMA1.LOAD_CUSTOMERS RESUME",
     ]
+
+
+def test_suspend_all_batches_statements_and_falls_back_on_error(mocker, capsys):
+    _patch_config(mocker)
+    mocker.patch("snowmin.operations.tasks.click.confirm", return_value=True)
+    execute = mocker.patch("snowmin.operations.tasks.ConnectionManager.execute")
+    fail_batch = True
+
+    class FailingSecondStatementCursor(FakeCursor):
+        def nextset(self):
+            raise RuntimeError("statement 2 failed")
+
+    def execute_side_effect(query, conn_config, num_statements=None):
+        if query.startswith("SHOW TASKS"):
+            return FakeCursor(
+                description=TASK_DESCRIPTION,
+                rows=[
+                    ("LOAD_A", "started", "RAP_DEV_ANALYTICS", "MART"),
+                    ("LOAD_B", "started", "RAP_DEV_ANALYTICS", "MART"),
+                    ("LOAD_C", "started", "RAP_DEV_ANALYTICS", "MART"),
+                ],
+            )
+        if num_statements and fail_batch:
+            return FailingSecondStatementCursor()
+        return FakeCursor()
+
+    execute.side_effect = execute_side_effect
+    suspend_all = dict(task_name=None, all=True, pattern=None, schema="MART")
+
+    fail_batch = False
+    suspend_task_command(_ctx(mocker), **suspend_all)
+
+    batch = execute.call_args_list[-1]
+    assert batch.kwargs["num_statements"] == 3
+    assert batch.args[0] == (
+        "ALTER TASK RAP_DEV_ANALYTICS.MART.LOAD_A SUSPEND;\n"
+        "ALTER TASK RAP_DEV_ANALYTICS.MART.LOAD_B SUSPEND;\n"
+        "ALTER TASK RAP_DEV_ANALYTICS.MART.LOAD_C SUSPEND"
+    )
+
+    execute.reset_mock()
+    capsys.readouterr()
+    fail_batch = True
+    suspend_task_command(_ctx(mocker), **suspend_all)
+
+    # LOAD_A already ran in the batch; the retries run concurrently, so their
+    # order is not fixed
+    assert execute.call_args_list[-3].kwargs["num_statements"] == 3
+    assert sorted(call.args[0] for call in execute.call_args_list[-2:]) == [
+        "ALTER TASK RAP_DEV_ANALYTICS.MART.LOAD_B SUSPEND",
+        "ALTER TASK RAP_DEV_ANALYTICS.MART.LOAD_C SUSPEND",
+    ]
+    output = capsys.readouterr().out
+    assert "Batch failed: statement 2 failed" in output
+    assert output.count("Successfully suspended task: LOAD_A") == 1
+
+
+def test_list_tasks_pushes_plain_pattern_into_show_like(mocker, capsys):
+    _patch_config(mocker)
+    execute = mocker.patch("snowmin.operations.tasks.ConnectionManager.execute")
+    execute.side_effect = lambda *args, **kwargs: FakeCursor(
+        description=TASK_DESCRIPTION,
+        rows=[
+            ("LOAD_CUSTOMERS", "started", "RAP_DEV_ANALYTICS", "SILVER"),
+            # SHOW ... LIKE is case-insensitive; --pattern is not
+            ("load_orders", "started", "RAP_DEV_ANALYTICS", "SILVER"),
+        ],
+    )
+
+    list_tasks_command(_ctx(mocker), pattern="LOAD", schema="SILVER")
+    list_tasks_command(_ctx(mocker), pattern="^LOAD", schema="SILVER")
+
+    assert _executed_sql(execute) == [
+        "SHOW TASKS LIKE '%LOAD%' IN SCHEMA RAP_DEV_ANALYTICS.SILVER",
+        LIST_TASKS_COLUMNS_QUERY,
+        "SHOW TASKS IN SCHEMA RAP_DEV_ANALYTICS.SILVER",
+        LIST_TASKS_COLUMNS_QUERY,
+    ]
+    assert {call.kwargs["num_statements"] for call in execute.call_args_list} == {2}
+    output = capsys.readouterr().out
+    assert "load_orders" not in output
+    assert output.count("SILVER.LOAD_CUSTOMERS") == 2
+
+
+def test_show_tasks_indices_cached_per_column_layout():
+    tasks._indices_for_layout.cache_clear()
+
+    assert tasks._show_tasks_indices(TASK_GRAPH_DESCRIPTION) == (0, 1, 2, 3, 4, None)
+    assert tasks._show_tasks_indices(list(TASK_GRAPH_DESCRIPTION)) == (
+        0,
+        1,
+        2,
+        3,
+        4,
+        None,
+    )
+    assert tasks._show_tasks_indices([("STATE",), ("NAME",)]) == (
+        1,
+        0,
+        None,
+        None,
+        None,
+        None,
+    )
+    info = tasks._indices_for_layout.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+def test_load_discovered_tasks_streams_rows_in_batches(mocker):
+    mocker.patch.object(tasks, "SHOW_TASKS_FETCH_SIZE", 2)
+    cursor = FakeCursor(
+        description=TASK_DESCRIPTION,
+        rows=[
+            (f"LOAD_{i}", "started", "RAP_DEV_ANALYTICS", "SILVER") for i in range(5)
+        ],
+    )
+    fetchmany = mocker.spy(cursor, "fetchmany")
+    close = mocker.spy(cursor, "close")
+    mocker.patch.object(tasks.ConnectionManager, "execute", return_value=cursor)
+
+    discovered = tasks._load_discovered_tasks(
+        "SHOW TASKS", {}, "RAP_DEV_ANALYTICS", "SILVER"
+    )
+
+    assert [t["name"] for t in discovered] == [f"LOAD_{i}" for i in range(5)]
+    assert cursor.arraysize == 2
+    assert fetchmany.call_count == 4
+    close.assert_called_once()
+
+
+def test_full_task_name_quotes_unsafe_parts():
+    assert tasks._full_task_name("LOAD_A", "DB", "MART", None, None) == "DB.MART.LOAD_A"
+    assert (
+        tasks._full_task_name('load; DROP "x"', None, "MART", "DB", None)
+        == 'DB.MART."load; DROP ""x"""'
+    )
+    assert tasks._full_task_name("LOAD_A", None, None, '"My DB"', None) == "LOAD_A"
+    assert tasks._full_task_name("LOAD_A", '"My DB"', "MART", None, None) == (
+        '"My DB".MART.LOAD_A'
+    )
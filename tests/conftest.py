@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 from click.testing import CliRunner
 
@@ -10,3 +12,18 @@ from click.testing import CliRunner
 def runner():
     """Return a Click CliRunner for testing CLI commands."""
     return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def stack_dir(tmp_path_factory) -> Path:
+    """
+    A directory of small stack files written once per session:
+    my_stack.py (x = 42), stack.py (value = 'hello'), empty.py and a
+    non-stack config.yaml. Tests must not modify these files.
+    """
+    path = tmp_path_factory.mktemp("stacks")
+    (path / "my_stack.py").write_text("x = 42\n")
+    (path / "stack.py").write_text("value = 'hello'\n")
+    (path / "empty.py").write_text("")
+    (path / "config.yaml").write_text("key: value\n")
+    return path
@@ -0,0 +1,202 @@
+"""Tests for snowmin.core.config settings loading."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from snowmin.core import config
+from snowmin.core.config import Settings
+
+
+@pytest.fixture
+def config_file(tmp_path: Path, monkeypatch) -> Path:
+    """Point the generic config file at a temp path and isolate the env config."""
+    path = tmp_path / "config.json"
+    monkeypatch.setattr(config, "CONFIG_FILE", path)
+    monkeypatch.setattr(config, "LEGACY_CONFIG_FILE", tmp_path / "config.yaml")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("SNOWMIN_ENV", raising=False)
+    config._load_config_cached.cache_clear()
+    return path
+
+
+def test_generic_config_parsed_once_per_settings(config_file: Path, mocker):
+    config_file.write_text('{"database": "DB1", "role": "R1", "warehouse": "WH1"}')
+    load = mocker.spy(config.json, "load")
+
+    settings = Settings()
+
+    assert settings.database == "DB1"
+    assert settings.role == "R1"
+    assert settings.warehouse == "WH1"
+    assert load.call_count == 1
+
+
+def test_generic_config_reloaded_after_change(config_file: Path):
+    config_file.write_text('{"database": "DB1"}')
+    assert Settings().database == "DB1"
+
+    config_file.write_text('{"database": "DB2"}')
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert Settings().database == "DB2"
+
+
+def test_malformed_config_ignored(config_file: Path, tmp_path: Path):
+    config_file.write_text('{"database": ')
+    (tmp_path / "snowmin_dev.yaml").write_text("role: [unclosed\n")
+
+    settings = Settings()
+
+    assert settings.database is None
+    assert settings.role is None
+
+    # Well-formed, but not a mapping
+    config_file.write_text("[1, 2]")
+    (tmp_path / "snowmin_dev.yaml").write_text("- role\n")
+    config._load_config_cached.cache_clear()
+
+    assert Settings().database is None
+
+
+def test_env_config_overrides_generic_config(config_file: Path, tmp_path: Path):
+    config_file.write_text('{"database": "DB1", "role": "R1"}')
+    (tmp_path / "snowmin_dev.yaml").write_text("database: ENV_DB\n")
+
+    settings = Settings()
+
+    assert settings.database == "ENV_DB"
+    assert settings.role == "R1"
+
+
+def test_legacy_yaml_config_migrated_to_json(config_file: Path, tmp_path: Path):
+    legacy = tmp_path / "config.yaml"
+    legacy.write_text("database: DB1\nrole: R1\n")
+
+    # Loading settings reads the legacy file without touching it
+    assert Settings().database == "DB1"
+    assert legacy.exists()
+    assert not config_file.exists()
+
+    config.migrate_legacy_config()
+
+    assert not legacy.exists()
+    assert json.loads(config_file.read_text()) == {"database": "DB1", "role": "R1"}
+
+
+def test_legacy_yaml_config_without_json_form_left_in_place(
+    config_file: Path, tmp_path: Path, capsys
+):
+    legacy = tmp_path / "config.yaml"
+    legacy.write_text("database: DB1\nsince: 2024-01-01\n")
+
+    config.migrate_legacy_config()
+
+    assert "Could not migrate" in capsys.readouterr().out
+    assert legacy.exists()
+    assert not config_file.exists()
+    assert Settings().database == "DB1"
+
+
+def test_save_writes_json(config_file: Path):
+    Settings(database="DB1").save()
+
+    assert json.loads(config_file.read_text()) == {
+        "database": "DB1",
+        "state_backend": "stateless",
+    }
+    assert not config_file.with_suffix(".json.tmp").exists()
+
+
+def test_save_keeps_existing_config_when_write_fails(config_file: Path, mocker):
+    config_file.write_text('{"database": "DB1"}')
+    mocker.patch.object(config.json, "dump", side_effect=TypeError("boom"))
+
+    with pytest.raises(TypeError):
+        config.save_generic_config({"database": "DB2"})
+
+    assert json.loads(config_file.read_text()) == {"database": "DB1"}
+    assert not config_file.with_suffix(".json.tmp").exists()
+
+
+def test_get_settings_reuses_instance_until_inputs_change(
+    config_file: Path, monkeypatch, mocker
+):
+    config._SETTINGS_CACHE.clear()
+    config_file.write_text('{"database": "DB1"}')
+    build = mocker.spy(config, "Settings")
+
+    first = config.get_settings(role="R1")
+    first.database = "MUTATED"
+
+    # Cached, but each caller gets its own copy
+    assert config.get_settings(role="R1").database == "DB1"
+    assert build.call_count == 1
+    config.get_settings(role="R2")
+    assert build.call_count == 2
+
+    monkeypatch.setattr(config, "SETTINGS_CACHE_MAXSIZE", 2)
+    config.get_settings(role="R3")
+    assert len(config._SETTINGS_CACHE) == 2
+
+    config_file.write_text('{"database": "DB2"}')
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert config.get_settings(role="R1").database == "DB2"
+
+
+def test_load_snowflake_connection_parses_toml_once(
+    tmp_path: Path, monkeypatch, mocker
+):
+    toml_path = tmp_path / "connections.toml"
+    toml_path.write_text('[default]\naccount = "acct"\n\n[prod]\naccount = "prod"\n')
+    monkeypatch.setattr(config, "get_toml_config_path", lambda: toml_path)
+    config._load_toml_cached.cache_clear()
+    load = mocker.spy(config.tomllib, "load")
+
+    first = config.load_snowflake_connection()
+    first["database"] = "MUTATED"
+
+    assert config.load_snowflake_connection() == {"account": "acct"}
+    assert config.load_snowflake_connection("prod") == {"account": "prod"}
+    assert load.call_count == 1
+
+    with pytest.raises(ValueError, match="not found"):
+        config.load_snowflake_connection("missing")
+
+
+def test_merged_connection_config_priority(tmp_path: Path, monkeypatch):
+    toml_path = tmp_path / "connections.toml"
+    toml_path.write_text(
+        '[default]\naccount = "acct"\nusername = "toml_user"\n'
+        'role = "TOML_ROLE"\nwarehouse = "TOML_WH"\n'
+    )
+    monkeypatch.setattr(config, "get_toml_config_path", lambda: toml_path)
+    config._load_toml_cached.cache_clear()
+    settings = Settings.model_construct(
+        role="SETTINGS_ROLE", warehouse="SETTINGS_WH", schema_name="SILVER"
+    )
+
+    merged = config.get_merged_connection_config(settings, {"warehouse": "CLI_WH"})
+
+    assert merged == {
+        "account": "acct",
+        "user": "toml_user",
+        "role": "SETTINGS_ROLE",
+        "warehouse": "CLI_WH",
+        "schema": "SILVER",
+    }
+
+
+def test_file_config_source_requires_config_path():
+    class NoPath(config.FileConfigSettingsSource):
+        pass
+
+    with pytest.raises(TypeError, match="config_path"):
+        NoPath(Settings)
@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
-from snowmin.core.connection import ConnectionManager
+import os
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from snowmin.core import connection
+from snowmin.core.connection import ConnectionManager, get_private_key
 
 
 def test_connection_does_not_set_session_schema_for_schema_list(mocker):
@@ -26,3 +33,93 @@ def test_connection_does_not_set_session_schema_for_schema_list(mocker):
     conn_args = connect.call_args.kwargs
     assert conn_args["database"] == "RAP_DEV_ANALYTICS"
     assert "schema" not in conn_args
+
+
+def test_connection_reused_for_equal_config(mocker):
+    connect = mocker.patch("snowmin.core.connection.snowflake.connector.connect")
+    connect.side_effect = lambda **kwargs: mocker.Mock()
+    ConnectionManager.close()
+    conn_config = {"account": "acct", "user": "user", "password": "secret"}
+
+    try:
+        first = ConnectionManager.get_connection(conn_config)
+        assert ConnectionManager.get_connection(conn_config) is first
+        assert ConnectionManager.get_connection(dict(conn_config)) is first
+        assert ConnectionManager.get_connection() is first
+
+        other = ConnectionManager.get_connection({**conn_config, "role": "R1"})
+        assert ConnectionManager.get_connection(conn_config) is not other
+
+        # Changing the caller's dict in place is a new config too
+        conn_config["role"] = "R2"
+        ConnectionManager.get_connection(conn_config)
+        assert ConnectionManager.get_current_config()["role"] == "R2"
+    finally:
+        ConnectionManager.close()
+
+    assert other is not first
+    assert connect.call_count == 4
+
+
+def test_private_key_parsed_once_until_file_changes(tmp_path: Path, mocker):
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    key_path = tmp_path / "rsa_key.p8"
+    key_path.write_bytes(
+        key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+    )
+    connection._load_private_key_cached.cache_clear()
+    load = mocker.spy(connection.serialization, "load_pem_private_key")
+
+    first = get_private_key(str(key_path))
+
+    assert get_private_key(str(key_path)) == first
+    assert load.call_count == 1
+
+    stat = key_path.stat()
+    os.utime(key_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    get_private_key(str(key_path))
+
+    assert load.call_count == 2
+
+
+def test_fetch_iter_streams_rows_in_batches(mocker):
+    cursor = mocker.Mock(description=[("NAME",), ("KIND",)])
+    cursor.fetchmany.side_effect = [
+        [("A", "TABLE"), ("B", "VIEW")],
+        [("C", "TABLE")],
+        [],
+    ]
+    mocker.patch.object(ConnectionManager, "execute", return_value=cursor)
+    mocker.patch.object(connection, "FETCH_BATCH_SIZE", 2)
+
+    rows = list(ConnectionManager.fetch_iter("SHOW TERSE TABLES IN ACCOUNT"))
+
+    assert rows == [
+        {"name": "A", "kind": "TABLE"},
+        {"name": "B", "kind": "VIEW"},
+        {"name": "C", "kind": "TABLE"},
+    ]
+    cursor.fetchmany.assert_called_with(2)
+    cursor.close.assert_called_once()
+
+
+def test_fetch_all_cached_shares_results_until_invalidated(mocker):
+    fetch_all = mocker.patch.object(
+        ConnectionManager, "fetch_all", return_value=[{"name": "WH"}]
+    )
+    ConnectionManager.invalidate_cache()
+
+    first = ConnectionManager.fetch_all_cached("SHOW WAREHOUSES")
+
+    assert ConnectionManager.fetch_all_cached("SHOW WAREHOUSES") is first
+    assert fetch_all.call_count == 1
+    ConnectionManager.fetch_all_cached("SHOW WAREHOUSES", ttl=0)
+    assert fetch_all.call_count == 2
+
+    ConnectionManager.invalidate_cache()
+    ConnectionManager.fetch_all_cached("SHOW WAREHOUSES")
+    assert fetch_all.call_count == 3
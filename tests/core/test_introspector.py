@@ -0,0 +1,286 @@
+"""Tests for snowmin.core.introspector current-state discovery."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from snowmin.core import introspector as introspector_module
+from snowmin.core.connection import ConnectionManager
+from snowmin.core.introspector import Introspector
+from snowmin.core.registry import ResourceRegistry
+
+DATABASE_ROWS = [
+    {"name": "DB", "kind": "STANDARD"},
+    {"name": "SHARED_DB", "kind": "IMPORTED DATABASE"},
+]
+
+TABLE_ROWS = [
+    {"database_name": "DB", "schema_name": "RAW", "name": "ORDERS", "kind": "TABLE"},
+    {"database_name": "DB", "schema_name": "RAW", "name": "EMPTY", "kind": "TABLE"},
+]
+
+COLUMN_ROWS = [
+    {
+        "database_name": "DB",
+        "schema_name": "RAW",
+        "table_name": "ORDERS",
+        "column_name": "ID",
+        "data_type": json.dumps({"type": "FIXED", "precision": 38, "scale": 0}),
+        "null?": "false",
+        "comment": "",
+    },
+    {
+        "database_name": "DB",
+        "schema_name": "RAW",
+        "table_name": "ORDERS",
+        "column_name": "NOTE",
+        "data_type": json.dumps({"type": "TEXT", "length": 100}),
+        "null?": "true",
+        "comment": "free text",
+    },
+]
+
+
+INFORMATION_SCHEMA_QUERY = (
+    "SELECT table_schema, table_name, column_name, data_type,"
+    " character_maximum_length, numeric_precision, numeric_scale,"
+    " datetime_precision, is_nullable, comment"
+    " FROM DB.information_schema.columns"
+    " WHERE table_schema IN (%s)"
+    " ORDER BY table_schema, table_name, ordinal_position"
+)
+
+
+def _fake_fetch_all(responses):
+    executed = []
+
+    def fetch_all(query, params=None, conn_config=None):
+        executed.append(query)
+        result = responses[query]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return fetch_all, executed
+
+
+@pytest.fixture(autouse=True)
+def empty_query_cache():
+    ConnectionManager.invalidate_cache()
+    yield
+    ConnectionManager.invalidate_cache()
+
+
+def _patch_conn(mocker, introspector: Introspector, responses):
+    fetch_all, executed = _fake_fetch_all(responses)
+    mocker.patch.object(introspector.conn, "fetch_all", side_effect=fetch_all)
+    mocker.patch.object(introspector.conn, "fetch_iter", side_effect=fetch_all)
+    return executed
+
+
+def test_fetch_tables_uses_single_show_columns_per_database(mocker):
+    introspector = Introspector()
+    executed = _patch_conn(
+        mocker,
+        introspector,
+        {
+            "SHOW TERSE DATABASES": DATABASE_ROWS,
+            "SHOW TERSE TABLES IN DATABASE DB": TABLE_ROWS,
+            "SHOW COLUMNS IN DATABASE DB": COLUMN_ROWS,
+        },
+    )
+
+    tables = introspector.fetch_tables()
+
+    # Shared databases are skipped
+    assert executed == [
+        "SHOW TERSE DATABASES",
+        "SHOW COLUMNS IN DATABASE DB",
+        "SHOW TERSE TABLES IN DATABASE DB",
+    ]
+    orders, empty = tables
+    assert [(c.name, c.type, c.nullable, c.comment) for c in orders.columns] == [
+        ("ID", "NUMBER(38,0)", False, None),
+        ("NOTE", "VARCHAR(100)", True, "free text"),
+    ]
+    assert empty.columns == []
+
+
+def test_fetch_tables_falls_back_to_desc_table(mocker):
+    introspector = Introspector()
+    pools = mocker.spy(introspector_module, "ThreadPoolExecutor")
+    executed = _patch_conn(
+        mocker,
+        introspector,
+        {
+            "SHOW TERSE DATABASES": DATABASE_ROWS,
+            "SHOW TERSE TABLES IN DATABASE DB": TABLE_ROWS,
+            "SHOW COLUMNS IN DATABASE DB": RuntimeError("exceeds 10000 rows"),
+            INFORMATION_SCHEMA_QUERY: RuntimeError("insufficient privileges"),
+            "DESC TABLE DB.RAW.ORDERS": [
+                {"name": "ID", "type": "NUMBER(38,0)", "null?": "N", "comment": None}
+            ],
+            "DESC TABLE DB.RAW.EMPTY": RuntimeError("insufficient privileges"),
+        },
+    )
+
+    (orders,) = introspector.fetch_tables()
+
+    assert sorted(executed[4:]) == [
+        "DESC TABLE DB.RAW.EMPTY",
+        "DESC TABLE DB.RAW.ORDERS",
+    ]
+    # The describes share the per-database pool rather than nesting another
+    assert pools.call_count == 1
+    assert [(c.name, c.type, c.nullable) for c in orders.columns] == [
+        ("ID", "NUMBER(38,0)", False)
+    ]
+
+
+def test_fetch_tables_connects_before_fanning_out(mocker):
+    conn_config = {"account": "ACME", "role": "SYSADMIN"}
+    introspector = Introspector(conn_config=conn_config)
+    get_connection = mocker.patch.object(introspector.conn, "get_connection")
+    executed = _patch_conn(mocker, introspector, {"SHOW TERSE DATABASES": []})
+
+    assert introspector.fetch_tables() == []
+    get_connection.assert_called_once_with(conn_config)
+    assert executed == ["SHOW TERSE DATABASES"]
+
+
+def test_fetch_tables_falls_back_to_information_schema(mocker):
+    introspector = Introspector()
+    executed = _patch_conn(
+        mocker,
+        introspector,
+        {
+            "SHOW TERSE DATABASES": DATABASE_ROWS,
+            "SHOW TERSE TABLES IN DATABASE DB": TABLE_ROWS,
+            "SHOW COLUMNS IN DATABASE DB": RuntimeError("exceeds 10000 rows"),
+            INFORMATION_SCHEMA_QUERY: [
+                {
+                    "table_schema": "RAW",
+                    "table_name": "ORDERS",
+                    "column_name": "CREATED_AT",
+                    "data_type": "TIMESTAMP_NTZ",
+                    "character_maximum_length": None,
+                    "numeric_precision": None,
+                    "numeric_scale": None,
+                    "datetime_precision": 3,
+                    "is_nullable": "NO",
+                    "comment": None,
+                }
+            ],
+        },
+    )
+
+    orders, empty = introspector.fetch_tables()
+
+    assert executed[-1] == INFORMATION_SCHEMA_QUERY
+    assert [(c.name, c.type, c.nullable) for c in orders.columns] == [
+        ("CREATED_AT", "TIMESTAMP_NTZ(3)", False)
+    ]
+    assert empty.columns == []
+
+
+def test_fetch_database_names_honours_allow_list(mocker):
+    introspector = Introspector(databases="analytics, db")
+    _patch_conn(
+        mocker,
+        introspector,
+        {
+            "SHOW TERSE DATABASES": [
+                *DATABASE_ROWS,
+                {"name": "ANALYTICS", "kind": "STANDARD"},
+                {"name": "SCRATCH", "kind": "STANDARD"},
+            ]
+        },
+    )
+
+    assert introspector.fetch_database_names() == ["DB", "ANALYTICS"]
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setattr(introspector_module, "CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+def test_fetch_all_served_from_cache_until_refresh(cache_dir: Path, mocker):
+    introspector = Introspector()
+    executed = _patch_conn(
+        mocker,
+        introspector,
+        {
+            "SHOW WAREHOUSES": [{"name": "WH", "size": "X-Small", "auto_suspend": 60}],
+            "SHOW TERSE DATABASES": DATABASE_ROWS,
+            "SHOW TERSE TABLES IN DATABASE DB": TABLE_ROWS,
+            "SHOW COLUMNS IN DATABASE DB": COLUMN_ROWS,
+        },
+    )
+
+    first = introspector.fetch_all()
+    query_count = len(executed)
+    cached = introspector.fetch_all()
+
+    assert len(executed) == query_count
+    assert cached.keys() == first.keys()
+    assert cached["table.DB.RAW.ORDERS"].columns == first["table.DB.RAW.ORDERS"].columns
+    assert cached["warehouse.WH"].auto_suspend == 60
+
+    introspector.fetch_all(refresh=True)
+    assert len(executed) == 2 * query_count
+
+    introspector.invalidate_cache()
+    assert not list(cache_dir.iterdir())
+
+
+def test_cache_keyed_on_account_role_and_allow_list(cache_dir: Path):
+    def cache_path(databases=None, **conn_config):
+        return Introspector(databases, conn_config)._cache_path()
+
+    base = cache_path(account="ACME", role="SYSADMIN")
+
+    assert base.parent == cache_dir
+    assert base.name.startswith("acme-")
+    assert base == cache_path(account="acme", role="sysadmin", user="other")
+    assert base != cache_path(account="ACME", role="PUBLIC")
+    assert base != cache_path(account="OTHER", role="SYSADMIN")
+    assert cache_path("a,b", account="ACME") == cache_path("B, A", account="ACME")
+    assert cache_path("a,b", account="ACME") != cache_path("a", account="ACME")
+
+
+def test_fetch_all_not_cached_after_failed_fetch(cache_dir: Path, mocker):
+    introspector = Introspector()
+    executed = _patch_conn(
+        mocker,
+        introspector,
+        {
+            "SHOW WAREHOUSES": RuntimeError("insufficient privileges"),
+            "SHOW TERSE DATABASES": [],
+        },
+    )
+
+    assert introspector.fetch_all() == {}
+    assert not list(cache_dir.iterdir())
+
+    introspector.fetch_all()
+    assert executed.count("SHOW WAREHOUSES") == 2
+
+
+def test_fetch_warehouses_does_not_register(mocker):
+    ResourceRegistry.clear()
+    introspector = Introspector()
+    _patch_conn(
+        mocker,
+        introspector,
+        {"SHOW WAREHOUSES": [{"name": "WH", "size": "X-Small", "auto_suspend": 60}]},
+    )
+
+    (wh,) = introspector.fetch_warehouses()
+
+    assert wh.warehouse_size == "X-SMALL"
+    assert ResourceRegistry.get_all() == []
@@ -0,0 +1,34 @@
+"""Tests for snowmin.core.registry.ResourceRegistry."""
+
+from __future__ import annotations
+
+import pytest
+
+from snowmin.core.registry import ResourceRegistry
+from snowmin.resources.account import Role, Warehouse
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    ResourceRegistry.clear()
+    yield
+    ResourceRegistry.clear()
+
+
+def test_resources_partitioned_by_type():
+    wh = Warehouse(name="WH1")
+    role = Role(name="ANALYST")
+    wh_replacement = Warehouse(name="wh1", auto_suspend=60)
+
+    assert ResourceRegistry.get_all() == [wh_replacement, role]
+    assert list(ResourceRegistry.get_all_of_type("warehouse")) == [wh_replacement]
+    assert list(ResourceRegistry.get_all_of_type("table")) == []
+    assert wh not in ResourceRegistry.get_all()
+
+
+def test_get_all_keeps_declaration_order_across_types():
+    reader = Role(name="READER")
+    wh = Warehouse(name="WH1")
+    writer = Role(name="WRITER")
+
+    assert ResourceRegistry.get_all() == [reader, wh, writer]
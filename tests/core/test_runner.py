@@ -0,0 +1,63 @@
+"""Tests for snowmin.core.runner.Runner planning."""
+
+from __future__ import annotations
+
+import pytest
+
+from snowmin.core.registry import ResourceRegistry
+from snowmin.core.runner import Runner
+from snowmin.resources.account import Warehouse
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    ResourceRegistry.clear()
+    yield
+    ResourceRegistry.clear()
+
+
+def test_plan_creates_updates_and_drops(mocker):
+    current = {
+        wh.identifier: wh
+        for wh in (
+            Warehouse(name="KEEP_WH", register=False),
+            Warehouse(name="RESIZE_WH", warehouse_size="SMALL", register=False),
+            Warehouse(name="OLD_WH", register=False),
+        )
+    }
+    mocker.patch("snowmin.core.runner.Introspector.fetch_all", return_value=current)
+    Warehouse(name="NEW_WH")
+    Warehouse(name="RESIZE_WH", warehouse_size="LARGE")
+    Warehouse(name="KEEP_WH")
+
+    plan_sql = Runner().plan()
+
+    assert plan_sql == [
+        "CREATE WAREHOUSE NEW_WH AUTO_SUSPEND = 600 AUTO_RESUME = TRUE"
+        " SCALING_POLICY = 'STANDARD'",
+        "ALTER WAREHOUSE RESIZE_WH SET WAREHOUSE_SIZE = 'LARGE'",
+        "DROP WAREHOUSE IF EXISTS OLD_WH",
+    ]
+
+
+def test_plan_quiet_skips_resource_lines(mocker, capsys):
+    mocker.patch("snowmin.core.runner.Introspector.fetch_all", return_value={})
+    Warehouse(name="NEW_WH")
+
+    plan_sql = Runner(verbose=False).plan()
+
+    assert len(plan_sql) == 1
+    assert "Create" not in capsys.readouterr().out
+
+
+def test_apply_invalidates_caches_even_if_a_statement_fails(mocker):
+    invalidate_state = mocker.patch("snowmin.core.runner.Introspector.invalidate_cache")
+    conn = mocker.patch("snowmin.core.runner.ConnectionManager")
+    conn.execute.side_effect = [None, RuntimeError("boom")]
+
+    with pytest.raises(RuntimeError):
+        Runner().apply(["CREATE ROLE A", "CREATE ROLE B", "CREATE ROLE C"])
+
+    assert conn.execute.call_count == 2
+    assert invalidate_state.call_count == 2
+    assert conn.invalidate_cache.call_count == 2
@@ -2,59 +2,112 @@
 
 from __future__ import annotations
 
+import os
+import sys
 from pathlib import Path
 
-import pytest
 import click
+import pytest
 
+from snowmin.core import stack_loader
+from snowmin.core.registry import ResourceRegistry
 from snowmin.core.stack_loader import load_stack
 
 
 class TestLoadStack:
     """Unit tests for load_stack()."""
 
-    def test_load_stack_success(self, tmp_path: Path):
-        """A valid .py file loads without error and module is returned."""
-        stack_file = tmp_path / "my_stack.py"
-        stack_file.write_text("x = 42\n")
-
-        module = load_stack(str(stack_file))
-
-        assert module is not None
-        assert module.x == 42
+    @pytest.fixture(autouse=True)
+    def isolated_loader_state(self, monkeypatch):
+        """
+        Restore sys.path and sys.modules["stack"] afterwards and start with empty
+        loader caches and registry.
+        """
+        monkeypatch.setattr(sys, "path", sys.path[:])
+        monkeypatch.delitem(sys.modules, "stack", raising=False)
+        monkeypatch.setattr(stack_loader, "_STACK_DIRS_SEEN", set())
+        monkeypatch.setattr(stack_loader, "_CACHE", {})
+        monkeypatch.setattr(ResourceRegistry, "_resources", {})
+        monkeypatch.setattr(ResourceRegistry, "_by_type", {})
+
+    @pytest.mark.parametrize(
+        ("filename", "attr", "expected"),
+        [
+            ("my_stack.py", "x", 42),
+            ("stack.py", "value", "hello"),
+            ("empty.py", "__name__", "stack"),
+        ],
+    )
+    def test_load_stack_success(
+        self, stack_dir: Path, monkeypatch, filename, attr, expected
+    ):
+        """
+        A valid .py file loads from an absolute or CWD-relative path, and its
+        parent directory is added to sys.path.
+        """
+        monkeypatch.chdir(stack_dir)
+
+        module = load_stack(stack_dir / filename)
+
+        assert getattr(module, attr) == expected
+        assert load_stack(filename) is module
+        assert str(stack_dir) in sys.path
 
     def test_load_stack_file_not_found(self, tmp_path: Path):
         """Non-existent path raises ClickException."""
         missing = tmp_path / "does_not_exist.py"
 
         with pytest.raises(click.ClickException, match="not found"):
-            load_stack(str(missing))
+            load_stack(missing)
 
-    def test_load_stack_not_a_python_file(self, tmp_path: Path):
+    def test_load_stack_not_a_python_file(self, stack_dir: Path):
         """Non-.py extension raises ClickException."""
-        bad_file = tmp_path / "config.yaml"
-        bad_file.write_text("key: value\n")
-
         with pytest.raises(click.ClickException, match=r"\.py"):
-            load_stack(str(bad_file))
+            load_stack(stack_dir / "config.yaml")
 
-    def test_load_stack_relative_path(self, tmp_path: Path, monkeypatch):
-        """Relative path resolved from CWD."""
+    def test_load_stack_executes_unchanged_file_once(self, tmp_path: Path):
+        """An unchanged stack is served from cache; a modified one re-runs."""
         stack_file = tmp_path / "stack.py"
-        stack_file.write_text("value = 'hello'\n")
-        monkeypatch.chdir(tmp_path)
+        stack_file.write_text("run = 'first'\n")
 
-        module = load_stack("stack.py")
+        first = load_stack(stack_file)
+        assert load_stack(stack_file) is first
 
-        assert module.value == "hello"
+        stack_file.write_text("run = 'changed'\n")
+        stat = stack_file.stat()
+        os.utime(stack_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
 
-    def test_load_stack_adds_parent_to_syspath(self, tmp_path: Path):
-        """The stack file's parent directory is added to sys.path."""
-        import sys
+        assert load_stack(stack_file).run == "changed"
+        assert load_stack(stack_file, reload=True) is not first
 
+    def test_load_stack_cache_hit_registers_resources_again(self, tmp_path: Path):
+        """
+        A cached stack re-registers its resources; re-running a changed stack
+        only replaces its own.
+        """
         stack_file = tmp_path / "stack.py"
-        stack_file.write_text("")
-
-        load_stack(str(stack_file))
-
-        assert str(tmp_path) in sys.path
+        stack_file.write_text(
+            "from snowmin.resources.account import Role\nRole(name='ANALYST')\n"
+        )
+        load_stack(stack_file)
+
+        ResourceRegistry.clear()
+        load_stack(stack_file)
+        assert [r.identifier for r in ResourceRegistry.get_all()] == ["role.ANALYST"]
+
+        other = tmp_path / "other.py"
+        other.write_text(
+            "from snowmin.resources.account import Role\nRole(name='LOADER')\n"
+        )
+        load_stack(other)
+        stack_file.write_text(
+            "from snowmin.resources.account import Role\nRole(name='REPORTER')\n"
+        )
+        stat = stack_file.stat()
+        os.utime(stack_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        load_stack(stack_file)
+        assert [r.identifier for r in ResourceRegistry.get_all()] == [
+            "role.LOADER",
+            "role.REPORTER",
+        ]
@@ -0,0 +1,72 @@
+"""Tests for snowmin.core.state.Resource."""
+
+from __future__ import annotations
+
+import pydantic
+import pytest
+
+from snowmin.resources.account import Role, Warehouse
+from snowmin.resources.schema_objects import Column, Table
+
+
+def test_create_sql_built_once_and_resources_frozen(mocker):
+    wh = Warehouse(name="WH1", warehouse_size="small", register=False)
+    build = mocker.spy(Warehouse, "_build_create_sql")
+
+    assert wh.get_create_sql() == (
+        "CREATE WAREHOUSE WH1 WAREHOUSE_SIZE = 'SMALL' AUTO_SUSPEND = 600"
+        " AUTO_RESUME = TRUE SCALING_POLICY = 'STANDARD'"
+    )
+    assert wh.get_create_sql() is wh.create_sql
+    assert build.call_count == 1
+
+    with pytest.raises(pydantic.ValidationError):
+        wh.auto_suspend = 60
+
+
+def test_model_copy_does_not_keep_cached_sql():
+    wh = Warehouse(name="W", register=False)
+    assert wh.identifier == "warehouse.W"
+    wh.get_create_sql()
+
+    other = wh.model_copy(update={"name": "OTHER"})
+
+    assert other.identifier == "warehouse.OTHER"
+    assert other.get_create_sql().startswith("CREATE WAREHOUSE OTHER ")
+    assert wh.get_create_sql().startswith("CREATE WAREHOUSE W ")
+
+
+def test_table_alter_adds_new_columns_in_declared_order():
+    current = Table(
+        name="ORDERS",
+        database="DB",
+        schema="RAW",
+        columns=[Column(name="ID", type="NUMBER")],
+        register=False,
+    )
+    desired = Table(
+        name="ORDERS",
+        database="DB",
+        schema="RAW",
+        columns=[
+            Column(name="ZIP", type="VARCHAR", nullable=False),
+            Column(name="ID", type="NUMBER"),
+            Column(name="AMOUNT", type="FLOAT"),
+        ],
+        register=False,
+    )
+
+    assert current.get_alter_sql(current) == ""
+    assert desired.get_alter_sql(current) == (
+        "ALTER TABLE DB.RAW.ORDERS ADD COLUMN ZIP VARCHAR NOT NULL,"
+        " ADD COLUMN AMOUNT FLOAT"
+    )
+
+
+def test_string_literals_escape_single_quotes():
+    role = Role(name="ANALYST", comment="Analyst's role", register=False)
+    wh = Warehouse(name="WH1", comment="C:\\temp\\", register=False)
+
+    assert role.get_create_sql() == "CREATE ROLE ANALYST COMMENT = 'Analyst''s role'"
+    # A trailing backslash must not escape the closing quote
+    assert wh.get_create_sql().endswith(" COMMENT = 'C:\\\\temp\\\\'")